@@ -0,0 +1,83 @@
+# Heap allocated per move and per game, for keeping the move path clean.
+
+# A move, from console input or an incoming frame to the notify or write
+# that answers it, should allocate nothing: every buffer it touches is made
+# when a session or board is. (The host's IRQ handler still gets a fresh
+# bytes from gatts_read(), which has no in-place form; that happens before
+# the move is handled, so isn't counted.) begin() and end() bracket one move and read
+# gc.mem_alloc() either side, with the collector held off in between so a
+# collection can't make the count go backwards. Brackets may nest (an event
+# drained in the middle of a move); only the outermost one counts.
+#
+# Off by default, since printing the result after every move is noisy.
+# Under ble_sim, gc.mem_alloc() is backed by tracemalloc, so CPython's own
+# objects show up as well; only figures from a board mean zero.
+
+import gc
+
+
+class AllocMeter:
+    def __init__(self):
+        self.enabled = False
+        self._depth = 0
+        self._start = 0
+        self._game_over = False
+        self.clear()
+
+    def clear(self):
+        self.moves = 0
+        # Moves that allocated anything, and the most any one did.
+        self.dirty = 0
+        self.max_move = 0
+        self.games = 0
+        self.game_bytes = 0
+        # Bytes so far in the game being played.
+        self._game = 0
+
+    def begin(self):
+        if not self.enabled:
+            return
+        self._depth += 1
+        if self._depth == 1:
+            gc.disable()
+            self._start = gc.mem_alloc()
+            self._game_over = False
+
+    # game_over says the move finished a game. Logging it and starting the
+    # next one come after end(), so aren't counted against the move.
+    def end(self, game_over=False):
+        if self._depth == 0:
+            return
+        self._game_over = self._game_over or game_over
+        self._depth -= 1
+        if self._depth:
+            return
+        n = gc.mem_alloc() - self._start
+        gc.enable()
+        self.moves += 1
+        if n:
+            self.dirty += 1
+        if n > self.max_move:
+            self.max_move = n
+        self._game += n
+        print("alloc: %d bytes this move" % n)
+        if self._game_over:
+            self.games += 1
+            self.game_bytes += self._game
+            print("alloc: %d bytes this game" % self._game)
+            self._game = 0
+
+    # Switch on from scratch, or off with a summary; for console commands.
+    def toggle(self):
+        if self.enabled:
+            self.report()
+            self.enabled = False
+        else:
+            self.clear()
+            self.enabled = True
+            print("Counting bytes allocated per move")
+
+    def report(self):
+        print("%d moves, %d allocated, at most %d bytes" % (self.moves, self.dirty, self.max_move))
+        if self.games:
+            print("%d games, %d bytes each on average" % (self.games, self.game_bytes // self.games))
@@ -0,0 +1,161 @@
+# Summarise game_record logs collected from many devices. CPython + NumPy.
+#
+#   python3 analyze_games.py logs/            # every games.bin(.old) under logs/
+#   python3 analyze_games.py a.bin b.bin --json
+#
+# Each file is memory-mapped and viewed as an (n, 6) array of records, so
+# nothing is parsed in Python and only the pages being counted are read.
+# Counts are accumulated per file, which keeps memory flat however many
+# files there are. Reports opening frequencies (first square, and the first
+# two squares), results by who started, results by opening square and the
+# distribution of game lengths.
+
+import argparse
+import json
+import mmap
+import os
+import sys
+
+import numpy as np
+
+# Layout from game_record.py.
+_RECORD_SIZE = 6
+_RESULTS = ("host won", "guest won", "draw")
+# What GameLog writes. Boards also keep stats logs and a handle cache in
+# other .bin files, which mustn't be read as games.
+_LOG_NAMES = ("games.bin", "games.bin.old")
+
+
+class Totals:
+    def __init__(self):
+        self.files = 0
+        self.games = 0
+        self.spoiled = 0
+        self.first = np.zeros(10, np.int64)
+        self.pairs = np.zeros(100, np.int64)
+        # [starter, result]: starter 0 = host, 1 = guest.
+        self.by_starter = np.zeros((2, 3), np.int64)
+        # [first square, result]
+        self.by_opening = np.zeros((10, 3), np.int64)
+        self.lengths = np.zeros(10, np.int64)
+
+    def add(self, records):
+        header = records[:, 0]
+        n = header & 0x0F
+        result = (header >> 5) & 0x03
+        ok = (n <= 9) & (result <= 2)
+        self.spoiled += int(np.count_nonzero(~ok))
+        records = records[ok]
+        n = n[ok]
+        result = result[ok]
+        starter = (records[:, 0] >> 4) & 0x01
+        first = records[:, 1] & 0x0F
+        second = records[:, 1] >> 4
+
+        self.games += len(records)
+        self.lengths += np.bincount(n, minlength=10)[:10]
+        self.by_starter += np.bincount(starter * 3 + result, minlength=6)[:6].reshape(2, 3)
+        opened = n >= 1
+        self.first += np.bincount(first[opened], minlength=10)[:10]
+        self.by_opening += np.bincount(first[opened] * 3 + result[opened], minlength=30)[:30].reshape(10, 3)
+        two = n >= 2
+        self.pairs += np.bincount(first[two] * 10 + second[two], minlength=100)[:100]
+
+    def add_file(self, path):
+        size = os.path.getsize(path)
+        count = size // _RECORD_SIZE
+        self.files += 1
+        if count == 0:
+            return
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            records = np.frombuffer(m, np.uint8, count * _RECORD_SIZE).reshape(count, _RECORD_SIZE)
+            self.add(records)
+            # Drop the view before the map closes.
+            del records
+
+    def to_dict(self, top):
+        pairs = np.argsort(self.pairs)[::-1][:top]
+        return {
+            "files": self.files,
+            "games": self.games,
+            "spoiled": self.spoiled,
+            "openings": {str(sq): int(self.first[sq]) for sq in range(1, 10)},
+            "top_pairs": [[int(p // 10), int(p % 10), int(self.pairs[p])] for p in pairs if self.pairs[p]],
+            "by_starter": {
+                who: dict(zip(_RESULTS, (int(c) for c in self.by_starter[k])))
+                for k, who in enumerate(("host", "guest"))
+            },
+            "by_opening": {
+                str(sq): dict(zip(_RESULTS, (int(c) for c in self.by_opening[sq]))) for sq in range(1, 10)
+            },
+            "lengths": {str(k): int(self.lengths[k]) for k in range(10)},
+        }
+
+
+def _pct(part, whole):
+    return 100.0 * part / whole if whole else 0.0
+
+
+def report(t, top=5):
+    print(f"{t.games} games from {t.files} files ({t.spoiled} incomplete skipped)")
+    if not t.games:
+        return
+    print("Opening square:")
+    opened = int(t.first.sum())
+    for sq in range(1, 10):
+        won = t.by_opening[sq]
+        print(
+            f"    {sq}: {_pct(t.first[sq], opened):5.1f}%"
+            f"   host {_pct(won[0], t.first[sq]):5.1f}%  guest {_pct(won[1], t.first[sq]):5.1f}%"
+            f"  draw {_pct(won[2], t.first[sq]):5.1f}%"
+        )
+    print("Most common first two moves:")
+    for p in np.argsort(t.pairs)[::-1][:top]:
+        if t.pairs[p]:
+            print(f"    {p // 10} then {p % 10}: {_pct(t.pairs[p], t.pairs.sum()):5.1f}%")
+    print("Results by starter:")
+    for k, who in enumerate(("host", "guest")):
+        row = t.by_starter[k]
+        total = int(row.sum())
+        print(
+            f"    {who:<5} started {total:>10} games:  starter won {_pct(row[k], total):5.1f}%"
+            f"  lost {_pct(row[1 - k], total):5.1f}%  drew {_pct(row[2], total):5.1f}%"
+        )
+    print("Game length (moves):")
+    for k in range(10):
+        if t.lengths[k]:
+            print(f"    {k}: {_pct(t.lengths[k], t.games):5.1f}%")
+
+
+def _paths(args):
+    for arg in args:
+        if os.path.isdir(arg):
+            for root, _, names in os.walk(arg):
+                for name in sorted(names):
+                    if name in _LOG_NAMES:
+                        yield os.path.join(root, name)
+        else:
+            yield arg
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarise game_record logs.")
+    parser.add_argument("paths", nargs="+", help="log files, or directories to search for games.bin files")
+    parser.add_argument("--top", type=int, default=5, help="how many opening pairs to list")
+    parser.add_argument("--json", action="store_true", help="print the totals as JSON")
+    args = parser.parse_args(argv)
+
+    t = Totals()
+    for path in _paths(args.paths):
+        try:
+            t.add_file(path)
+        except OSError as e:
+            print(f"Skipping {path}: {e}", file=sys.stderr)
+    if args.json:
+        print(json.dumps(t.to_dict(args.top), indent=2))
+    else:
+        report(t, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+# Benchmark full games between host.TicTacToe and join.TicTacToe under
+# CPython, using the ble_sim radio in place of real hardware.
+#
+#   python3 bench.py --games 200 --latency-ms 0
+#   python3 bench.py --compare bench_results/bench-<commit>.json
+#
+# Reports per-direction move latency percentiles (from make_move on one side
+# to the move being applied by the other side's queued-event handler),
+# games per second, time spent inside each side's IRQ handler and bytes
+# allocated per move and per game. Results are written as JSON named after
+# the current commit so runs can be compared across commits.
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import ble_sim
+
+
+def _percentiles(samples):
+    if not samples:
+        return {}
+    s = sorted(samples)
+
+    def pick(p):
+        return s[min(len(s) - 1, int(p / 100 * len(s)))]
+
+    return {
+        "n": len(s),
+        "p50_us": round(pick(50) * 1e6, 1),
+        "p90_us": round(pick(90) * 1e6, 1),
+        "p99_us": round(pick(99) * 1e6, 1),
+        "max_us": round(s[-1] * 1e6, 1),
+        "mean_us": round(sum(s) / len(s) * 1e6, 1),
+    }
+
+
+def _commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class Match:
+    # A host and a guest on one simulated radio, with the timing hooks the
+    # benchmark needs wrapped around their move and IRQ paths.
+    def __init__(self, radio, players="ai", seed=None, trace_alloc=False, fast=False, rules=(3, 3, 3)):
+        import bluetooth
+        import host
+        import join
+
+        self.radio = radio
+        self.host = host.TicTacToe(bluetooth.BLE(), rules=rules)
+        self.guest = join.TicTacToe(bluetooth.BLE(), fast=fast)
+        self.players = players
+        self.random = random.Random(seed)
+        self.trace_alloc = trace_alloc
+        self.host_to_guest = []
+        self.guest_to_host = []
+        self.alloc_bytes = []
+        self.moves = 0
+        self._host_sent = None
+        self._guest_sent = None
+
+        h, g = self.host, self.guest
+        host_handle_event = h._events._handler
+        guest_advance = g.advance_game_state
+
+        # The host applies guest moves when it handles the queued event, not
+        # in its IRQ handler.
+        def host_event_hook(q, i):
+            before = self._guest_squares()
+            result = self._measure(host_handle_event, q, i)
+            if self._guest_sent is not None and self._guest_squares() != before:
+                self.guest_to_host.append(time.perf_counter() - self._guest_sent)
+                self._guest_sent = None
+            return result
+
+        def guest_advance_hook(starts, step, move):
+            before = g._step
+            guest_advance(starts, step, move)
+            if self._host_sent is not None and g._step != before:
+                self.host_to_guest.append(time.perf_counter() - self._host_sent)
+                self._host_sent = None
+
+        h._events._handler = host_event_hook
+        g.advance_game_state = guest_advance_hook
+
+    def _guest_squares(self):
+        # Each state the host takes on gets a new sequence number.
+        return tuple(s.seq for s in self.host._sessions.values())
+
+    def _measure(self, fn, *args):
+        if not self.trace_alloc or not self.alloc_bytes:
+            return fn(*args)
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        result = fn(*args)
+        self.alloc_bytes[-1] += tracemalloc.get_traced_memory()[1] - start
+        return result
+
+    def _pick(self, suggest, board):
+        if self.players == "random":
+            free = [m for m in range(1, board.size + 1) if board.is_free(m)]
+            return self.random.choice(free)
+        return suggest()
+
+    def games_played(self):
+        return sum(s.p1_wins + s.p2_wins + s.draws for s in self.host._sessions.values())
+
+    def step(self):
+        self.radio.process()
+        h, g = self.host, self.guest
+        g.tick()
+        if g.is_our_turn():
+            move = self._pick(g.suggest_move, g._board)
+            self.alloc_bytes.append(0)
+            self._guest_sent = time.perf_counter()
+            self._measure(g.make_move, move)
+            self.moves += 1
+        elif h.is_our_turn() and g.is_ready():
+            move = self._pick(h.suggest_move, h._waiting[0].board)
+            self.alloc_bytes.append(0)
+            self._host_sent = time.perf_counter()
+            self._measure(h.make_move, move)
+            self.moves += 1
+
+    def run_until(self, done, timeout_s):
+        end = time.monotonic() + timeout_s
+        while not done():
+            if time.monotonic() > end:
+                raise TimeoutError("benchmark stalled")
+            self.step()
+
+
+def run(
+    games=100, latency_ms=0, jitter_ms=0, players="ai", seed=1, trace_alloc=False, timeout_s=120, fast=False, rules=(3, 3, 3)
+):
+    radio = ble_sim.install(latency_ms, jitter_ms, seed)
+    # Discard the games' output: a StringIO growing in the background would
+    # show up in the allocation figures.
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        match = Match(radio, players, seed, fast=fast, rules=rules)
+        t0 = time.perf_counter()
+        match.run_until(match.guest.is_ready, timeout_s)
+        connect_s = time.perf_counter() - t0
+
+        host_irq0 = (match.host._ble.irq_count, match.host._ble.irq_time_s)
+        guest_irq0 = (match.guest._ble.irq_count, match.guest._ble.irq_time_s)
+        packets0 = radio.packets
+        t0 = time.perf_counter()
+        match.run_until(lambda: match.games_played() >= games, timeout_s)
+        elapsed = time.perf_counter() - t0
+        packets = radio.packets - packets0
+
+        alloc = alloc_game = None
+        if trace_alloc:
+            # A separate, shorter pass: tracing allocations slows everything
+            # down and would distort the timings above.
+            tracemalloc.start()
+            match.trace_alloc = True
+            match.alloc_bytes = []
+            alloc_games = max(1, games // 10)
+            target = match.games_played() + alloc_games
+            match.run_until(lambda: match.games_played() >= target, timeout_s)
+            tracemalloc.stop()
+            alloc = round(sum(match.alloc_bytes) / max(1, len(match.alloc_bytes)), 1)
+            alloc_game = round(sum(match.alloc_bytes) / alloc_games, 1)
+
+    h, g = match.host._ble, match.guest._ble
+    return {
+        "commit": _commit(),
+        "timestamp": int(time.time()),
+        "python": sys.version.split()[0],
+        "config": {
+            "games": games,
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+            "players": players,
+            "seed": seed,
+            "fast": fast,
+            "rules": list(rules),
+        },
+        "connect_s": round(connect_s, 4),
+        # As each side reports it: from advertising or scanning to the link.
+        "connect_ms": {"host": match.host.connect_ms, "guest": match.guest.connect_ms},
+        "elapsed_s": round(elapsed, 4),
+        "games_per_s": round(games / elapsed, 2),
+        "moves": match.moves,
+        "packets": packets,
+        "host_to_guest": _percentiles(match.host_to_guest),
+        "guest_to_host": _percentiles(match.guest_to_host),
+        "irq": {
+            "host_calls": h.irq_count - host_irq0[0],
+            "host_us_per_call": round((h.irq_time_s - host_irq0[1]) / max(1, h.irq_count - host_irq0[0]) * 1e6, 2),
+            "guest_calls": g.irq_count - guest_irq0[0],
+            "guest_us_per_call": round((g.irq_time_s - guest_irq0[1]) / max(1, g.irq_count - guest_irq0[0]) * 1e6, 2),
+        },
+        "alloc_bytes_per_move": alloc,
+        "alloc_bytes_per_game": alloc_game,
+    }
+
+
+def _compare(result, baseline):
+    print("Compared with " + baseline.get("commit", "?") + ":")
+    rows = (
+        ("games/s", ("games_per_s",), True),
+        ("host->guest p50 us", ("host_to_guest", "p50_us"), False),
+        ("host->guest p99 us", ("host_to_guest", "p99_us"), False),
+        ("guest->host p50 us", ("guest_to_host", "p50_us"), False),
+        ("guest->host p99 us", ("guest_to_host", "p99_us"), False),
+        ("host irq us/call", ("irq", "host_us_per_call"), False),
+        ("guest irq us/call", ("irq", "guest_us_per_call"), False),
+        ("alloc bytes/move", ("alloc_bytes_per_move",), False),
+        ("alloc bytes/game", ("alloc_bytes_per_game",), False),
+    )
+    for label, path, higher_is_better in rows:
+        new, old = result, baseline
+        for key in path:
+            new = new.get(key) if isinstance(new, dict) else None
+            old = old.get(key) if isinstance(old, dict) else None
+        if not new or not old:
+            continue
+        change = (new - old) / old * 100
+        better = change > 0 if higher_is_better else change < 0
+        print(f"    {label:<20} {old:>10} -> {new:>10}  {change:+6.1f}% {'better' if better else 'worse'}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark host/guest games over ble_sim.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--players", choices=("ai", "random"), default="ai")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--alloc", action="store_true", help="also measure bytes allocated per move and game")
+    parser.add_argument("--fast", action="store_true", help="guest sends moves without write responses")
+    parser.add_argument(
+        "--rules", type=int, nargs=3, default=(3, 3, 3), metavar=("W", "H", "K"), help="board size and win length"
+    )
+    parser.add_argument("--out", help="result file (default bench_results/bench-<commit>.json)")
+    parser.add_argument("--compare", help="earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    result = run(
+        args.games, args.latency_ms, args.jitter_ms, args.players, args.seed, args.alloc, fast=args.fast, rules=tuple(args.rules)
+    )
+    print(json.dumps(result, indent=2))
+
+    out = args.out or os.path.join("bench_results", "bench-" + result["commit"] + ".json")
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(result, f, indent=2)
+    print("Saved " + out)
+
+    if args.compare:
+        with open(args.compare) as f:
+            _compare(result, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -22,46 +22,79 @@ _ADV_TYPE_UUID16_MORE = const(0x2)
 _ADV_TYPE_UUID32_MORE = const(0x4)
 _ADV_TYPE_UUID128_MORE = const(0x6)
 _ADV_TYPE_APPEARANCE = const(0x19)
+_ADV_TYPE_MANUFACTURER = const(0xFF)
+
+# Company ID reserved by the Bluetooth SIG for testing; fine for a game that
+# only talks to itself.
+MANUFACTURER_TEST = const(0xFFFF)
 
 _ADV_MAX_PAYLOAD = const(31)
 
 
 # Generate a payload to be passed to gap_advertise(adv_data=...).
-def advertising_payload(limited_disc=False, br_edr=False, name=None, services=None, appearance=0):
-    payload = bytearray()
-
-    def _append(adv_type, value):
-        nonlocal payload
-        payload += struct.pack("BB", len(value) + 1, adv_type) + value
+# manufacturer is an optional (company_id, data) pair.
+def advertising_payload(limited_disc=False, br_edr=False, name=None, services=None, appearance=0, manufacturer=None):
+    if name and isinstance(name, str):
+        name = name.encode()
+    uuids = [bytes(uuid) for uuid in services] if services else ()
+
+    # Size everything first so the payload is built in a single buffer
+    # rather than by repeated concatenation.
+    size = 3
+    if name:
+        size += 2 + len(name)
+    for b in uuids:
+        if len(b) in (2, 4, 16):
+            size += 2 + len(b)
+    if appearance:
+        size += 4
+    if manufacturer:
+        size += 4 + len(manufacturer[1])
+    if size > _ADV_MAX_PAYLOAD:
+        raise ValueError("advertising payload too large")
 
-    _append(
-        _ADV_TYPE_FLAGS,
-        struct.pack("B", (0x01 if limited_disc else 0x02) + (0x18 if br_edr else 0x04)),
-    )
+    payload = bytearray(size)
+    i = _put(payload, 0, _ADV_TYPE_FLAGS, 1)
+    payload[i - 1] = (0x01 if limited_disc else 0x02) + (0x18 if br_edr else 0x04)
 
     if name:
-        _append(_ADV_TYPE_NAME, name)
-
-    if services:
-        for uuid in services:
-            b = bytes(uuid)
-            if len(b) == 2:
-                _append(_ADV_TYPE_UUID16_COMPLETE, b)
-            elif len(b) == 4:
-                _append(_ADV_TYPE_UUID32_COMPLETE, b)
-            elif len(b) == 16:
-                _append(_ADV_TYPE_UUID128_COMPLETE, b)
+        i = _put(payload, i, _ADV_TYPE_NAME, len(name))
+        payload[i - len(name) : i] = name
+
+    for b in uuids:
+        if len(b) == 2:
+            adv_type = _ADV_TYPE_UUID16_COMPLETE
+        elif len(b) == 4:
+            adv_type = _ADV_TYPE_UUID32_COMPLETE
+        elif len(b) == 16:
+            adv_type = _ADV_TYPE_UUID128_COMPLETE
+        else:
+            continue
+        i = _put(payload, i, adv_type, len(b))
+        payload[i - len(b) : i] = b
 
     # See org.bluetooth.characteristic.gap.appearance.xml
     if appearance:
-        _append(_ADV_TYPE_APPEARANCE, struct.pack("<h", appearance))
+        i = _put(payload, i, _ADV_TYPE_APPEARANCE, 2)
+        struct.pack_into("<h", payload, i - 2, appearance)
 
-    if len(payload) > _ADV_MAX_PAYLOAD:
-        raise ValueError("advertising payload too large")
+    if manufacturer:
+        company, data = manufacturer
+        i = _put(payload, i, _ADV_TYPE_MANUFACTURER, 2 + len(data))
+        struct.pack_into("<H", payload, i - 2 - len(data), company)
+        payload[i - len(data) : i] = data
 
     return payload
 
 
+# Write a field header at payload[i] and return the index just past the
+# (still empty) n-byte value.
+def _put(payload, i, adv_type, n):
+    payload[i] = n + 1
+    payload[i + 1] = adv_type
+    return i + 2 + n
+
+
 def decode_field(payload, adv_type):
     i = 0
     result = []
@@ -88,14 +121,81 @@ def decode_services(payload):
     return services
 
 
+# Index of the first field of adv_type in payload[start:end], or -1. Works
+# on bytes, bytearray or a memoryview of the IRQ buffer without copying.
+def find_field(payload, adv_type, start=0, end=-1):
+    if end < 0:
+        end = len(payload)
+    i = start
+    while i + 1 < end:
+        n = payload[i]
+        if n == 0:
+            break
+        if payload[i + 1] == adv_type:
+            return i
+        i += 1 + n
+    return -1
+
+
+# Index of the first manufacturer-specific field from company in
+# payload[start:end], or -1. Its data is payload[i + 4 : i + 1 + payload[i]].
+# Allocation-free, like find_field.
+def find_manufacturer(payload, company, start=0, end=-1):
+    i = find_field(payload, _ADV_TYPE_MANUFACTURER, start, end)
+    if i < 0 or payload[i] < 3 or (payload[i + 2] | (payload[i + 3] << 8)) != company:
+        return -1
+    return i
+
+
+# Allocation-free check for one 128-bit service UUID, for scan IRQs that see
+# hundreds of advertisements a second. The target is converted to its raw
+# little-endian bytes once, and candidates are compared byte by byte in
+# place; the name is only decoded for advertisements that match.
+class UUIDMatcher:
+    def __init__(self, uuid):
+        self._target = bytes(uuid)
+        if len(self._target) != 16:
+            raise ValueError("128-bit UUID required")
+
+    def match(self, payload, start=0, end=-1):
+        if end < 0:
+            end = len(payload)
+        target = self._target
+        i = start
+        while i + 1 < end:
+            n = payload[i]
+            if n == 0 or i + 1 + n > end:
+                break
+            adv_type = payload[i + 1]
+            if adv_type == _ADV_TYPE_UUID128_COMPLETE or adv_type == _ADV_TYPE_UUID128_MORE:
+                j = i + 2
+                while j + 16 <= i + 1 + n:
+                    k = 0
+                    while k < 16 and payload[j + k] == target[k]:
+                        k += 1
+                    if k == 16:
+                        return True
+                    j += 16
+            i += 1 + n
+        return False
+
+    def name(self, payload, start=0, end=-1):
+        i = find_field(payload, _ADV_TYPE_NAME, start, end)
+        if i < 0:
+            return ""
+        return str(bytes(payload[i + 2 : i + 1 + payload[i]]), "utf-8")
+
+
 def demo():
     payload = advertising_payload(
-        name="micropython",
+        name="mpy",
         services=[bluetooth.UUID(0x181A), bluetooth.UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E")],
     )
     print(payload)
     print(decode_name(payload))
     print(decode_services(payload))
+    matcher = UUIDMatcher(bluetooth.UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"))
+    print(matcher.match(memoryview(payload)), matcher.name(payload))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,669 @@
+# In-process stand-in for the MicroPython bluetooth module, for CPython.
+#
+# install() registers fake `bluetooth`, `micropython` and `uselect` modules
+# (and the MicroPython-only helpers on `time` and `gc`), after which host.py and
+# join.py import and run unchanged on a Linux box:
+#
+#   import ble_sim
+#   radio = ble_sim.install(latency_ms=5)
+#   import bluetooth, host, join
+#   h = host.TicTacToe(bluetooth.BLE())
+#   g = join.TicTacToe(bluetooth.BLE())
+#   while ...:
+#       radio.process()
+#       join.game(None, g, ai=True)
+#
+# Every BLE object created while the radio is installed shares that radio.
+# IRQs are never delivered from inside an API call: they are queued with the
+# configured latency and handed to the registered handler by Radio.process()
+# (or run()/serve()), which keeps the whole simulation on one thread and
+# deterministic apart from wall-clock timing.
+
+import gc
+import heapq
+import os
+import select
+import sys
+import time
+import tracemalloc
+import types
+
+_IRQ_CENTRAL_CONNECT = 1
+_IRQ_CENTRAL_DISCONNECT = 2
+_IRQ_GATTS_WRITE = 3
+_IRQ_GATTS_READ_REQUEST = 4
+_IRQ_SCAN_RESULT = 5
+_IRQ_SCAN_DONE = 6
+_IRQ_PERIPHERAL_CONNECT = 7
+_IRQ_PERIPHERAL_DISCONNECT = 8
+_IRQ_GATTC_SERVICE_RESULT = 9
+_IRQ_GATTC_SERVICE_DONE = 10
+_IRQ_GATTC_CHARACTERISTIC_RESULT = 11
+_IRQ_GATTC_CHARACTERISTIC_DONE = 12
+_IRQ_GATTC_READ_RESULT = 15
+_IRQ_GATTC_READ_DONE = 16
+_IRQ_GATTC_WRITE_DONE = 17
+_IRQ_GATTC_NOTIFY = 18
+_IRQ_GATTC_INDICATE = 19
+_IRQ_GATTS_INDICATE_DONE = 20
+_IRQ_MTU_EXCHANGED = 21
+
+# ATT error for a handle the server has no attribute at.
+_ATT_INVALID_HANDLE = 0x01
+
+_ADV_IND = 0x00
+_ADV_SCAN_IND = 0x02
+_ADV_NONCONN_IND = 0x03
+_SCAN_RSP = 0x04
+
+_CONN_HANDLE_NONE = 0xFFFF
+_DEFAULT_MTU = 23
+
+FLAG_BROADCAST = 0x0001
+FLAG_READ = 0x0002
+FLAG_WRITE_NO_RESPONSE = 0x0004
+FLAG_WRITE = 0x0008
+FLAG_NOTIFY = 0x0010
+FLAG_INDICATE = 0x0020
+
+
+class UUID:
+    # Matches MicroPython: 16/32-bit UUIDs from ints, 128-bit from strings,
+    # and bytes(uuid) is little-endian.
+    def __init__(self, value):
+        if isinstance(value, UUID):
+            self._bytes = value._bytes
+        elif isinstance(value, int):
+            if value < 0:
+                value &= 0xFFFF
+            size = 2 if value <= 0xFFFF else 4
+            self._bytes = value.to_bytes(size, "little")
+        elif isinstance(value, str):
+            digits = value.replace("-", "")
+            if len(digits) != 32:
+                raise ValueError("invalid UUID")
+            self._bytes = bytes.fromhex(digits)[::-1]
+        else:
+            value = bytes(value)
+            if len(value) not in (2, 4, 16):
+                raise ValueError("invalid UUID")
+            self._bytes = value
+
+    def __bytes__(self):
+        return self._bytes
+
+    def __eq__(self, other):
+        return isinstance(other, UUID) and self._bytes == other._bytes
+
+    def __hash__(self):
+        return hash(self._bytes)
+
+    def __repr__(self):
+        if len(self._bytes) == 16:
+            h = self._bytes[::-1].hex()
+            return "UUID('%s-%s-%s-%s-%s')" % (h[:8], h[8:12], h[12:16], h[16:20], h[20:])
+        return "UUID(0x%x)" % int.from_bytes(self._bytes, "little")
+
+
+class _Connection:
+    def __init__(self, handle, central, peripheral):
+        self.handle = handle
+        self.central = central
+        self.peripheral = peripheral
+        self.mtu = _DEFAULT_MTU
+
+    def peer(self, ble):
+        return self.peripheral if ble is self.central else self.central
+
+
+class Radio:
+    # latency_ms delays every IRQ; jitter_ms adds a uniform random extra
+    # delay on top. loss is the fraction of notifications and writes without
+    # response that never arrive, as when a busy device runs out of buffers.
+    # Counters record what crossed the air.
+    def __init__(self, latency_ms=0, jitter_ms=0, seed=None, loss=0.0):
+        import random
+
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.loss = loss
+        self._random = random.Random(seed)
+        self._queue = []
+        self._order = 0
+        self._devices = []
+        self._connections = {}
+        self._next_handle = 1
+        self.irq_count = 0
+        self.irq_time_s = 0.0
+        self.packets = 0
+        self.lost = 0
+
+    def now(self):
+        return time.monotonic()
+
+    def _delay(self):
+        d = self.latency_ms
+        if self.jitter_ms:
+            d += self._random.uniform(0, self.jitter_ms)
+        return d / 1000
+
+    def _drop(self):
+        if self.loss and self._random.random() < self.loss:
+            self.lost += 1
+            return True
+        return False
+
+    def _at(self, due, fn, *args):
+        self._order += 1
+        heapq.heappush(self._queue, (due, self._order, fn, args))
+
+    def _irq(self, ble, event, data, extra_delay=0.0):
+        # Jitter varies the delay but never reorders one device's events:
+        # link-layer traffic arrives in the order it was sent.
+        due = max(self.now() + self._delay() + extra_delay, ble._last_due)
+        ble._last_due = due
+        self._at(due, self._deliver, ble, event, data)
+
+    def _deliver(self, ble, event, data):
+        if not ble._active or ble._handler is None:
+            return None
+        t0 = time.perf_counter()
+        try:
+            return ble._handler(event, data)
+        finally:
+            dt = time.perf_counter() - t0
+            self.irq_count += 1
+            self.irq_time_s += dt
+            ble.irq_count += 1
+            ble.irq_time_s += dt
+
+    def next_due(self):
+        return self._queue[0][0] if self._queue else None
+
+    # Deliver every event that is due now. Returns the number delivered.
+    def process(self):
+        n = 0
+        now = self.now()
+        while self._queue and self._queue[0][0] <= now:
+            _, _, fn, args = heapq.heappop(self._queue)
+            fn(*args)
+            _run_scheduled()
+            n += 1
+        _run_scheduled()
+        return n
+
+    # Process events for `seconds`, sleeping between them. If `until` is
+    # given, stop as soon as it returns true.
+    def run(self, seconds, until=None, idle=None):
+        end = self.now() + seconds
+        while True:
+            self.process()
+            if idle is not None:
+                idle()
+            if until is not None and until():
+                return True
+            now = self.now()
+            if now >= end:
+                return False
+            due = self.next_due()
+            wait = end - now if due is None else min(due - now, end - now)
+            if idle is not None:
+                wait = min(wait, 0.001)
+            if wait > 0:
+                time.sleep(wait)
+
+    # Asyncio equivalent of run() for code driven by an event loop.
+    async def serve(self):
+        import asyncio
+
+        while True:
+            self.process()
+            due = self.next_due()
+            wait = 0.001 if due is None else max(0.0, min(due - self.now(), 0.001))
+            await asyncio.sleep(wait)
+
+    def _connect(self, central, peripheral):
+        if len(peripheral._conns) >= peripheral.max_connections:
+            return None
+        handle = self._next_handle
+        self._next_handle += 1
+        conn = _Connection(handle, central, peripheral)
+        self._connections[handle] = conn
+        central._conns[handle] = conn
+        peripheral._conns[handle] = conn
+        peripheral._stop_advertising()
+        self._irq(central, _IRQ_PERIPHERAL_CONNECT, (handle, peripheral.addr_type, memoryview(peripheral.addr)))
+        self._irq(peripheral, _IRQ_CENTRAL_CONNECT, (handle, central.addr_type, memoryview(central.addr)))
+        return conn
+
+    def _disconnect(self, conn):
+        if self._connections.pop(conn.handle, None) is None:
+            return
+        conn.central._conns.pop(conn.handle, None)
+        conn.peripheral._conns.pop(conn.handle, None)
+        self._irq(
+            conn.central,
+            _IRQ_PERIPHERAL_DISCONNECT,
+            (conn.handle, conn.peripheral.addr_type, memoryview(conn.peripheral.addr)),
+        )
+        self._irq(
+            conn.peripheral,
+            _IRQ_CENTRAL_DISCONNECT,
+            (conn.handle, conn.central.addr_type, memoryview(conn.central.addr)),
+        )
+
+    # One advertising event from `ble`: report it to scanners whose scan
+    # window is open (with the scan response too for active scanners) and
+    # complete any pending gap_connect aimed at it.
+    def _advertising_event(self, ble, token):
+        if ble._adv_token != token:
+            return
+        self.packets += 1
+        now = self.now()
+        for other in self._devices:
+            if other is ble or not other._active:
+                continue
+            if other._scanning and other._listening(now):
+                if ble._connectable:
+                    adv_type = _ADV_IND
+                else:
+                    adv_type = _ADV_SCAN_IND if ble._resp_data else _ADV_NONCONN_IND
+                self._irq(
+                    other,
+                    _IRQ_SCAN_RESULT,
+                    (ble.addr_type, memoryview(ble.addr), adv_type, ble.rssi, memoryview(ble._adv_data)),
+                )
+                if other._scan_active and ble._resp_data:
+                    self.packets += 2
+                    self._irq(
+                        other,
+                        _IRQ_SCAN_RESULT,
+                        (ble.addr_type, memoryview(ble.addr), _SCAN_RSP, ble.rssi, memoryview(ble._resp_data)),
+                    )
+            pending = other._pending_connect
+            if pending is not None and ble._connectable and pending[1] == ble.addr:
+                other._pending_connect = None
+                if self._connect(other, ble) is not None:
+                    return
+        if ble._adv_token == token:
+            # Controllers add 0-10 ms of random delay to every interval.
+            self._at(now + ble._adv_interval + self._random.uniform(0, 0.01), self._advertising_event, ble, token)
+
+
+_radio = None
+_scheduled = []
+
+
+def _run_scheduled():
+    while _scheduled:
+        fn, arg = _scheduled.pop(0)
+        fn(arg)
+
+
+class BLE:
+    # rssi is what scanners see for this device; max_connections models the
+    # controller's link limit.
+    def __init__(self, radio=None, max_connections=8, rssi=-50):
+        self._radio = radio or _radio
+        if self._radio is None:
+            raise OSError("ble_sim not installed")
+        self._radio._devices.append(self)
+        self._active = False
+        self._handler = None
+        self.addr_type = 0
+        self.addr = os.urandom(6)
+        self.rssi = rssi
+        self.max_connections = max_connections
+        self.mtu = _DEFAULT_MTU
+        self._conns = {}
+        self._attrs = {}
+        self._services = []
+        self._adv_token = None
+        self._adv_data = b""
+        self._resp_data = b""
+        self._adv_interval = 0.5
+        self._connectable = True
+        self._scanning = None
+        self._scan_active = False
+        self._last_due = 0.0
+        self._scan_started = 0.0
+        self._scan_interval = 1.28
+        self._scan_window = 0.01125
+        self._pending_connect = None
+        # Time spent inside this device's IRQ handler.
+        self.irq_count = 0
+        self.irq_time_s = 0.0
+
+    def active(self, flag=None):
+        if flag is not None:
+            self._active = bool(flag)
+            if not self._active:
+                # Powering the radio down ends everything it was doing.
+                self._stop_advertising()
+                self._scanning = None
+                self._pending_connect = None
+        return self._active
+
+    def irq(self, handler):
+        self._handler = handler
+
+    def config(self, *names, **values):
+        if "mtu" in values:
+            self.mtu = values["mtu"]
+        if names:
+            if names[0] == "mac":
+                return (self.addr_type, self.addr)
+            if names[0] == "mtu":
+                return self.mtu
+            raise ValueError("unknown config param")
+        return None
+
+    def _conn(self, conn_handle):
+        conn = self._conns.get(conn_handle)
+        if conn is None:
+            raise OSError(128)  # ENOTCONN
+        return conn
+
+    # GATT server
+
+    def gatts_register_services(self, services):
+        handle = len(self._attrs) + 1
+        result = []
+        for uuid, chars in services:
+            start = handle
+            handle += 1
+            value_handles = []
+            char_defs = []
+            for char in chars:
+                char_uuid, flags = char[0], char[1]
+                def_handle = handle
+                value_handle = handle + 1
+                handle += 2
+                self._attrs[value_handle] = [b"", 20, False]
+                char_defs.append((def_handle, value_handle, flags, char_uuid))
+                value_handles.append(value_handle)
+                for desc_uuid, _ in char[2] if len(char) > 2 else ():
+                    self._attrs[handle] = [b"", 20, False]
+                    value_handles.append(handle)
+                    handle += 1
+            self._services.append((start, handle - 1, uuid, char_defs))
+            result.append(tuple(value_handles))
+        return tuple(result)
+
+    def gatts_read(self, value_handle):
+        return bytes(self._attrs[value_handle][0])
+
+    def gatts_write(self, value_handle, data, send_update=False):
+        attr = self._attrs[value_handle]
+        attr[0] = bytes(data)
+        if send_update:
+            for conn in list(self._conns.values()):
+                if conn.peripheral is self:
+                    self.gatts_notify(conn.handle, value_handle)
+
+    def gatts_set_buffer(self, value_handle, size, append=False):
+        attr = self._attrs[value_handle]
+        attr[1] = size
+        attr[2] = append
+
+    def gatts_notify(self, conn_handle, value_handle, data=None):
+        conn = self._conns.get(conn_handle)
+        if conn is None:
+            return
+        payload = bytes(self._attrs[value_handle][0] if data is None else data)[: conn.mtu - 3]
+        self._radio.packets += 1
+        if self._radio._drop():
+            return
+        self._radio._irq(conn.central, _IRQ_GATTC_NOTIFY, (conn_handle, value_handle, memoryview(payload)))
+
+    def gatts_indicate(self, conn_handle, value_handle, data=None):
+        conn = self._conn(conn_handle)
+        payload = bytes(self._attrs[value_handle][0] if data is None else data)[: conn.mtu - 3]
+        self._radio.packets += 2
+        self._radio._irq(conn.central, _IRQ_GATTC_INDICATE, (conn_handle, value_handle, memoryview(payload)))
+        self._radio._irq(self, _IRQ_GATTS_INDICATE_DONE, (conn_handle, value_handle, 0), self._radio._delay())
+
+    # GAP
+
+    def gap_advertise(self, interval_us, adv_data=None, resp_data=None, connectable=True):
+        if interval_us is None:
+            self._stop_advertising()
+            return
+        if connectable and len(self._conns) >= self.max_connections:
+            raise OSError(12)  # ENOMEM: no room for another link
+        if adv_data is not None:
+            self._adv_data = bytes(adv_data)
+        if resp_data is not None:
+            self._resp_data = bytes(resp_data)
+        self._adv_interval = max(interval_us, 20000) / 1000000
+        self._connectable = connectable
+        self._adv_token = object()
+        self._radio._at(self._radio.now(), self._radio._advertising_event, self, self._adv_token)
+
+    def _stop_advertising(self):
+        self._adv_token = None
+
+    def gap_scan(self, duration_ms, interval_us=1280000, window_us=11250, active=False):
+        if duration_ms is None:
+            if self._scanning is not None:
+                self._scanning = None
+                self._radio._irq(self, _IRQ_SCAN_DONE, (0,))
+            return
+        token = object()
+        self._scanning = token
+        self._scan_started = self._radio.now()
+        self._scan_interval = interval_us / 1000000
+        self._scan_window = window_us / 1000000
+        self._scan_active = active
+        if duration_ms:
+            self._radio._at(self._radio.now() + duration_ms / 1000, self._scan_timeout, token)
+
+    # Whether the scan window is open at time t: the radio listens for the
+    # first window_us of every interval_us.
+    def _listening(self, t):
+        if self._scan_window >= self._scan_interval:
+            return True
+        return (t - self._scan_started) % self._scan_interval < self._scan_window
+
+    def _scan_timeout(self, token):
+        if self._scanning is token:
+            self._scanning = None
+            self._radio._irq(self, _IRQ_SCAN_DONE, (0,))
+
+    def gap_connect(self, addr_type, addr=None, scan_duration_ms=2000, min_conn_interval_us=None, max_conn_interval_us=None):
+        if addr_type is None:
+            self._pending_connect = None
+            return
+        token = (addr_type, bytes(addr), object())
+        self._pending_connect = token
+        self._radio._at(self._radio.now() + scan_duration_ms / 1000, self._connect_timeout, token)
+
+    def _connect_timeout(self, token):
+        if self._pending_connect is token:
+            self._pending_connect = None
+            self._radio._irq(
+                self, _IRQ_PERIPHERAL_DISCONNECT, (_CONN_HANDLE_NONE, token[0], memoryview(token[1]))
+            )
+
+    def gap_disconnect(self, conn_handle):
+        conn = self._conns.get(conn_handle)
+        if conn is None:
+            return False
+        self._radio._disconnect(conn)
+        return True
+
+    # GATT client
+
+    def gattc_discover_services(self, conn_handle, uuid=None):
+        conn = self._conn(conn_handle)
+        for start, end, service_uuid, _ in conn.peripheral._services:
+            if uuid is None or uuid == service_uuid:
+                self._radio._irq(self, _IRQ_GATTC_SERVICE_RESULT, (conn_handle, start, end, service_uuid))
+        self._radio._irq(self, _IRQ_GATTC_SERVICE_DONE, (conn_handle, 0))
+
+    def gattc_discover_characteristics(self, conn_handle, start_handle, end_handle, uuid=None):
+        conn = self._conn(conn_handle)
+        for start, end, _, chars in conn.peripheral._services:
+            for def_handle, value_handle, flags, char_uuid in chars:
+                if start_handle <= def_handle <= end_handle and (uuid is None or uuid == char_uuid):
+                    self._radio._irq(
+                        self,
+                        _IRQ_GATTC_CHARACTERISTIC_RESULT,
+                        (conn_handle, def_handle, value_handle, flags, char_uuid),
+                    )
+        self._radio._irq(self, _IRQ_GATTC_CHARACTERISTIC_DONE, (conn_handle, 0))
+
+    def gattc_read(self, conn_handle, value_handle):
+        conn = self._conn(conn_handle)
+        self._radio.packets += 2
+        self._radio._at(self._radio.now() + self._radio._delay(), self._serve_read, conn, value_handle)
+
+    def _serve_read(self, conn, value_handle):
+        if conn.handle not in self._radio._connections:
+            return
+        peripheral = conn.peripheral
+        if value_handle not in peripheral._attrs:
+            # As the stack reports a stale cached handle.
+            self._radio._irq(self, _IRQ_GATTC_READ_DONE, (conn.handle, value_handle, _ATT_INVALID_HANDLE))
+            return
+        denied = self._radio._deliver(peripheral, _IRQ_GATTS_READ_REQUEST, (conn.handle, value_handle))
+        status = denied or 0
+        if not status:
+            data = peripheral._attrs[value_handle][0][: conn.mtu - 1]
+            self._radio._irq(self, _IRQ_GATTC_READ_RESULT, (conn.handle, value_handle, memoryview(data)))
+        self._radio._irq(self, _IRQ_GATTC_READ_DONE, (conn.handle, value_handle, status))
+
+    def gattc_write(self, conn_handle, value_handle, data, mode=0):
+        conn = self._conn(conn_handle)
+        data = bytes(data)[: conn.mtu - 3]
+        self._radio.packets += 2 if mode == 1 else 1
+        if mode == 0 and self._radio._drop():
+            return
+        self._radio._at(self._radio.now() + self._radio._delay(), self._serve_write, conn, value_handle, data, mode)
+
+    def _serve_write(self, conn, value_handle, data, mode):
+        if conn.handle not in self._radio._connections:
+            return
+        peripheral = conn.peripheral
+        attr = peripheral._attrs.get(value_handle)
+        if attr is None:
+            if mode == 1:
+                self._radio._irq(self, _IRQ_GATTC_WRITE_DONE, (conn.handle, value_handle, _ATT_INVALID_HANDLE))
+            return
+        attr[0] = attr[0] + data if attr[2] else data
+        self._radio._deliver(peripheral, _IRQ_GATTS_WRITE, (conn.handle, value_handle))
+        if mode == 1:
+            self._radio._irq(self, _IRQ_GATTC_WRITE_DONE, (conn.handle, value_handle, 0))
+
+    def gattc_exchange_mtu(self, conn_handle):
+        conn = self._conn(conn_handle)
+        conn.mtu = min(conn.central.mtu, conn.peripheral.mtu)
+        self._radio._irq(conn.central, _IRQ_MTU_EXCHANGED, (conn_handle, conn.mtu))
+        self._radio._irq(conn.peripheral, _IRQ_MTU_EXCHANGED, (conn_handle, conn.mtu))
+
+
+def _const(x):
+    return x
+
+
+def _schedule(fn, arg):
+    _scheduled.append((fn, arg))
+
+
+# Tick counters wrap like MicroPython's, so code that stores them in fixed
+# width arrays behaves the same here as on the device.
+_TICKS_PERIOD = 1 << 30
+_TICKS_MAX = _TICKS_PERIOD - 1
+_TICKS_HALF = _TICKS_PERIOD // 2
+
+
+def _ticks_ms():
+    return int(time.monotonic() * 1000) & _TICKS_MAX
+
+
+def _ticks_us():
+    return int(time.monotonic() * 1000000) & _TICKS_MAX
+
+
+def _ticks_add(ticks, delta):
+    return (ticks + delta) & _TICKS_MAX
+
+
+def _ticks_diff(a, b):
+    return ((a - b + _TICKS_HALF) & _TICKS_MAX) - _TICKS_HALF
+
+
+def _sleep_ms(ms):
+    time.sleep(ms / 1000)
+
+
+def _sleep_us(us):
+    time.sleep(us / 1000000)
+
+
+# Bytes held by Python objects, as far as tracemalloc knows; 0 unless it's
+# tracing. Unlike MicroPython's count this goes down as objects are freed.
+def _mem_alloc():
+    if not tracemalloc.is_tracing():
+        return 0
+    return tracemalloc.get_traced_memory()[0]
+
+
+# Install the stand-in modules and return the shared Radio.
+def install(latency_ms=0, jitter_ms=0, seed=None, loss=0.0):
+    global _radio
+    _radio = Radio(latency_ms, jitter_ms, seed, loss)
+
+    bluetooth = types.ModuleType("bluetooth")
+    bluetooth.BLE = BLE
+    bluetooth.UUID = UUID
+    for name in ("FLAG_BROADCAST", "FLAG_READ", "FLAG_WRITE_NO_RESPONSE", "FLAG_WRITE", "FLAG_NOTIFY", "FLAG_INDICATE"):
+        setattr(bluetooth, name, globals()[name])
+    sys.modules["bluetooth"] = bluetooth
+
+    micropython = types.ModuleType("micropython")
+    micropython.const = _const
+    micropython.schedule = _schedule
+    micropython.alloc_emergency_exception_buf = lambda size: None
+    sys.modules["micropython"] = micropython
+
+    sys.modules.setdefault("uselect", select)
+
+    for name, fn in (
+        ("ticks_ms", _ticks_ms),
+        ("ticks_us", _ticks_us),
+        ("ticks_add", _ticks_add),
+        ("ticks_diff", _ticks_diff),
+        ("sleep_ms", _sleep_ms),
+        ("sleep_us", _sleep_us),
+    ):
+        if not hasattr(time, name):
+            setattr(time, name, fn)
+    if not hasattr(gc, "mem_alloc"):
+        gc.mem_alloc = _mem_alloc
+
+    return _radio
+
+
+# Play computer-vs-computer games between a host and a guest over the radio.
+# rules=(width, height, k) has the guest ask the host for that board.
+def demo(seconds=5, rules=None):
+    radio = install(latency_ms=5)
+    import bluetooth
+    import host
+    import join
+
+    h = host.TicTacToe(bluetooth.BLE())
+    g = join.TicTacToe(bluetooth.BLE(), rules=rules)
+
+    def play():
+        join.game(None, g, ai=True)
+        # Like a person at the console, give the guest time to sync first.
+        if h.is_our_turn() and g.is_ready():
+            h.make_move(h.suggest_move())
+
+    radio.run(seconds, idle=play)
+
+
+if __name__ == "__main__":
+    demo()
@@ -0,0 +1,220 @@
+# Serial-console renderer for the board.
+
+# The board is drawn into one preallocated buffer and sent with a single
+# write instead of seven print() calls. In plain mode every draw prints the
+# whole board followed by an optional status line. In ANSI mode the board is
+# pinned to the top of the terminal (messages scroll underneath it) and each
+# draw only sends cursor moves for the squares and status text that changed.
+#
+# Status text is passed as bytes so callers can use constants and nothing
+# needs encoding per draw.
+#
+# The template and square positions are built for the board's size the first
+# time it is drawn (and again only if the size changes), so bigger m,n,k
+# boards draw the same way, with squares numbered as wide as the largest.
+
+from micropython import const
+import sys
+
+# MicroPython streams take a length, so the buffer goes out without a slice.
+_MICROPYTHON = sys.implementation.name == "micropython"
+
+_STATUS_MAX = const(64)
+# Longest cursor move, "\x1b[RRR;CCCH".
+_GOTO_MAX = const(10)
+
+_SPACE = const(0x20)
+# Marks by owner (player_num); 0 means show the square's number.
+_MARKS = b" XO"
+
+
+def _template(width, height, digits):
+    # "| 1 | 2 | 3 |" rows between "-------------" rules.
+    rule = b"-" * (1 + width * (digits + 3)) + b"\n"
+    t = bytearray(rule)
+    for y in range(height):
+        t += b"|"
+        for x in range(width):
+            label = b"%d" % (y * width + x + 1)
+            t += b" " * (1 + digits - len(label)) + label + b" |"
+        t += b"\n"
+        t += rule
+    return bytes(t)
+
+
+class BoardRenderer:
+    def __init__(self, ansi=False, out=None):
+        self.ansi = ansi
+        self._out = out
+        self._status = bytearray(_STATUS_MAX)
+        self._status_len = 0
+        self._drawn = False
+        self.bytes_written = 0
+        self._width = 0
+        self._height = 0
+        # Laid out on first use, for whatever size the board is then.
+        self._buf = None
+
+    def _layout(self, width, height):
+        self._width = width
+        self._height = height
+        size = width * height
+        digits = len(b"%d" % size)
+        self._digits = digits
+        self._template = _template(width, height, digits)
+        self._board_size = len(self._template)
+        line = self._board_size // (2 * height + 1)
+        cell = digits + 3
+        # Byte offset of the first digit of each square within the template,
+        # and the cursor move to it.
+        self._offsets = [(1 + 2 * (i // width)) * line + 2 + cell * (i % width) for i in range(size)]
+        self._goto = [b"\x1b[%d;%dH" % (2 + 2 * (i // width), 3 + cell * (i % width)) for i in range(size)]
+        # Cursor move to the status line, clearing it.
+        self._status_goto = b"\x1b[%d;1H\x1b[2K" % (2 * height + 2)
+        # First terminal row of the scrolling message area in ANSI mode.
+        self._scroll_top = 2 * height + 4
+        # Big enough for a full board, or for rewriting every square.
+        self._buf = bytearray(max(self._board_size, size * (_GOTO_MAX + digits)) + _STATUS_MAX + 64)
+        self._mv = memoryview(self._buf)
+        # What is on screen now, for ANSI diffs: the owner of each square.
+        self._cells = bytearray(size)
+        self._drawn = False
+
+    # Forget what is on screen so the next draw is a full redraw.
+    def reset(self):
+        self._drawn = False
+
+    def draw(self, board, status=None):
+        if board.width != self._width or board.height != self._height:
+            self._layout(board.width, board.height)
+        if self.ansi:
+            self._draw_ansi(board, status)
+        else:
+            self._draw_plain(board, status)
+
+    def status(self, text):
+        if self._buf is None:
+            self._layout(3, 3)
+        if self.ansi:
+            n = self._put_status(0, text)
+            if n:
+                self._write(n)
+        else:
+            n = self._copy(0, text)
+            self._buf[n] = 0x0A
+            self._write(n + 1)
+
+    # Write square i's text (its number, or a right-aligned mark) at n.
+    def _put_cell(self, n, owner, i):
+        buf = self._buf
+        digits = self._digits
+        if owner:
+            for j in range(digits - 1):
+                buf[n + j] = _SPACE
+            buf[n + digits - 1] = _MARKS[owner]
+        else:
+            at = self._offsets[i]
+            for j in range(digits):
+                buf[n + j] = self._template[at + j]
+        return n + digits
+
+    def _copy(self, n, data):
+        buf = self._buf
+        for j in range(min(len(data), _STATUS_MAX)):
+            buf[n] = data[j]
+            n += 1
+        return n
+
+    def _draw_plain(self, board, status):
+        buf = self._buf
+        buf[: self._board_size] = self._template
+        for i in range(len(self._cells)):
+            owner = board.owner(i)
+            if owner:
+                self._put_cell(self._offsets[i], owner, i)
+        n = self._board_size
+        if status is not None:
+            n = self._copy(n, status)
+            buf[n] = 0x0A
+            n += 1
+        self._write(n)
+
+    def _draw_ansi(self, board, status):
+        if not self._drawn:
+            self._full_ansi(board, status)
+            return
+        # ESC 7 ... ESC 8 saves and restores the cursor around the update so
+        # the message area below is left exactly where it was.
+        n = self._copy(0, b"\x1b7")
+        start = n
+        for i in range(len(self._cells)):
+            owner = board.owner(i)
+            if owner != self._cells[i]:
+                self._cells[i] = owner
+                n = self._copy(n, self._goto[i])
+                n = self._put_cell(n, owner, i)
+        if status is not None:
+            n = self._status_seq(n, status)
+        if n == start:
+            return
+        n = self._copy(n, b"\x1b8")
+        self._write(n)
+
+    def _full_ansi(self, board, status):
+        buf = self._buf
+        # Clear, draw the board at the top, then confine scrolling to the
+        # rows below it and park the cursor there.
+        n = self._copy(0, b"\x1b[2J\x1b[H")
+        buf[n : n + self._board_size] = self._template
+        for i in range(len(self._cells)):
+            owner = board.owner(i)
+            self._cells[i] = owner
+            if owner:
+                self._put_cell(n + self._offsets[i], owner, i)
+        n = self._copy(n + self._board_size, b"\x1b[%dr\x1b[%d;1H" % (self._scroll_top, self._scroll_top))
+        self._status_len = 0
+        self._drawn = True
+        if status is not None:
+            n = self._copy(n, b"\x1b7")
+            n = self._status_seq(n, status)
+            n = self._copy(n, b"\x1b8")
+        self._write(n)
+
+    def _put_status(self, n, text):
+        start = n
+        n = self._copy(n, b"\x1b7")
+        m = self._status_seq(n, text)
+        if m == n:
+            return 0
+        return self._copy(m, b"\x1b8") - start
+
+    def _status_seq(self, n, text):
+        # Rewrite the status row only if the text changed.
+        length = min(len(text), _STATUS_MAX)
+        if length == self._status_len:
+            j = 0
+            while j < length and self._status[j] == text[j]:
+                j += 1
+            if j == length:
+                return n
+        for j in range(length):
+            self._status[j] = text[j]
+        self._status_len = length
+        n = self._copy(n, self._status_goto)
+        return self._copy(n, text)
+
+    def _write(self, n):
+        out = self._out or sys.stdout
+        raw = getattr(out, "buffer", None)
+        if raw is None:
+            # A text-only stream (e.g. redirected under CPython).
+            out.write(str(bytes(self._mv[:n]), "ascii"))
+        else:
+            # Anything print() has buffered must go out first.
+            if hasattr(out, "flush"):
+                out.flush()
+            if _MICROPYTHON:
+                raw.write(self._buf, n)
+            else:
+                raw.write(self._mv[:n])
+        self.bytes_written += n
@@ -0,0 +1,77 @@
+# Radio schedules that start fast and back off, for advertising and scanning.
+
+# A schedule is a tuple of steps, each (interval_us, window_us, duration_ms):
+# run at that interval (and, for scanning, listen for window_us of it) for
+# duration_ms, then move to the next step. The last step's duration is
+# ignored and it lasts until restart(). Restart whenever a connection is
+# likely to be wanted soon, e.g. at boot or just after a peer drops out, so
+# the fast burst is spent when someone is probably looking.
+#
+# The defaults pair up: a host advertising every 30 ms is caught by a guest
+# scanning flat out within a couple of advertisements, and the slower steps
+# still overlap often enough to connect in a few seconds while costing a
+# fraction of the power.
+
+from micropython import const
+import time
+
+# Advertising: 30 ms for 30 s, 152.5 ms for a minute, then 1022.5 ms. These
+# are the intervals Apple's accessory guidelines suggest for quick discovery.
+ADVERTISE = (
+    (30000, 0, 30000),
+    (152500, 0, 60000),
+    (1022500, 0, 0),
+)
+
+# Scanning: continuously for 10 s, then a 30 ms window every 160 ms for
+# 30 s, then 60 ms every 640 ms. Once both sides have backed off, about one
+# advertisement in ten lands in a window, so a connection takes ~10 s.
+SCAN = (
+    (30000, 30000, 10000),
+    (160000, 30000, 30000),
+    (640000, 60000, 0),
+)
+
+_FOREVER = const(0)
+
+
+class DutyCycle:
+    def __init__(self, steps):
+        self._steps = steps
+        self.restart()
+
+    def restart(self):
+        self.step = 0
+        self.started = time.ticks_ms()
+        self._step_started = self.started
+
+    def interval_us(self):
+        return self._steps[self.step][0]
+
+    def window_us(self):
+        return self._steps[self.step][1]
+
+    # Milliseconds left in the current step, or 0 for the last one.
+    def remaining_ms(self):
+        duration = self._steps[self.step][2]
+        if self.step == len(self._steps) - 1 or duration == _FOREVER:
+            return 0
+        return max(1, duration - time.ticks_diff(time.ticks_ms(), self._step_started))
+
+    # Move on if the current step has run its course. Returns True if the
+    # step changed, so the caller knows to reconfigure the radio.
+    def update(self):
+        changed = False
+        now = time.ticks_ms()
+        while self.step < len(self._steps) - 1:
+            duration = self._steps[self.step][2]
+            if time.ticks_diff(now, self._step_started) < duration:
+                break
+            self._step_started = time.ticks_add(self._step_started, duration)
+            self.step += 1
+            changed = True
+        return changed
+
+    # Milliseconds since restart().
+    def elapsed_ms(self):
+        return time.ticks_diff(time.ticks_ms(), self.started)
@@ -0,0 +1,118 @@
+# Preallocated ring buffer for handing BLE IRQ events to the main loop.
+
+# The IRQ side only calls push(), which copies a few integers and at most
+# payload_size bytes into fixed slots, so nothing is allocated and the radio
+# callback returns quickly. The handler then runs outside the IRQ, either via
+# micropython.schedule or, when `wake` is set (e.g. to an asyncio
+# ThreadSafeFlag), from whichever task waits on it.
+#
+# An event whose data doesn't fit its slot is dropped and counted in
+# oversized rather than cut short, so a handler never mistakes the first
+# bytes of a long write for a whole one.
+#
+# push() only writes _tail and drain() only writes _head, so an IRQ that
+# fires while the queue is being drained cannot corrupt it.
+
+from array import array
+import micropython
+
+
+class EventQueue:
+    def __init__(self, size, payload_size, handler):
+        self.size = size
+        self._handler = handler
+        # Per-slot record: event code, three small integer arguments and an
+        # optional payload copied out of the IRQ's (transient) buffers.
+        self.event = bytearray(size)
+        self.arg0 = array("H", bytes(2 * size))
+        self.arg1 = array("H", bytes(2 * size))
+        # Signed for scan RSSI, and wide enough for handles up to 0xFFFF.
+        self.arg2 = array("i", bytes(4 * size))
+        self.length = array("H", bytes(2 * size))
+        self._payloads = [bytearray(payload_size) for _ in range(size)]
+        self._payload_size = payload_size
+        # Monotonic counters modulo 2 * size, so full and empty differ.
+        self._head = 0
+        self._tail = 0
+        self._scheduled = False
+        self._draining = False
+        self._drain_ref = self._scheduled_drain
+        self.wake = None
+        self.pushed = 0
+        self.drops = 0
+        self.oversized = 0
+        self.high_water = 0
+
+    def depth(self):
+        return (self._tail - self._head) % (2 * self.size)
+
+    def payload(self, i):
+        return self._payloads[i]
+
+    def push(self, event, arg0=0, arg1=0, arg2=0, data=None, prefix=None):
+        depth = self.depth()
+        if depth == self.size:
+            self.drops += 1
+            return False
+        n = (len(prefix) if prefix is not None else 0) + (len(data) if data is not None else 0)
+        if n > self._payload_size:
+            self.oversized += 1
+            return False
+        i = self._tail % self.size
+        self.event[i] = event
+        self.arg0[i] = arg0
+        self.arg1[i] = arg1
+        self.arg2[i] = arg2
+        buf = self._payloads[i]
+        n = 0
+        # prefix and data are copied byte by byte: slicing would allocate.
+        if prefix is not None:
+            for j in range(len(prefix)):
+                buf[n] = prefix[j]
+                n += 1
+        if data is not None:
+            for j in range(len(data)):
+                buf[n] = data[j]
+                n += 1
+        self.length[i] = n
+        self._tail = (self._tail + 1) % (2 * self.size)
+        self.pushed += 1
+        if depth + 1 > self.high_water:
+            self.high_water = depth + 1
+        self._kick()
+        return True
+
+    def _kick(self):
+        if self.wake is not None:
+            self.wake.set()
+        elif not self._scheduled:
+            try:
+                micropython.schedule(self._drain_ref, None)
+                self._scheduled = True
+            except RuntimeError:
+                # Scheduler queue full; the main loop's own drain() will
+                # pick the events up.
+                pass
+
+    def _scheduled_drain(self, _):
+        self._scheduled = False
+        self.drain()
+
+    # Run the handler for every queued event. Returns the number handled.
+    def drain(self):
+        if self._draining:
+            # A scheduled drain landed while the main loop was draining.
+            return 0
+        self._draining = True
+        n = 0
+        try:
+            while self._head != self._tail:
+                i = self._head % self.size
+                try:
+                    self._handler(self, i)
+                finally:
+                    self._head = (self._head + 1) % (2 * self.size)
+                n += 1
+        finally:
+            self._draining = False
+        return n
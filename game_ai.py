@@ -0,0 +1,62 @@
+# Perfect-play computer opponent backed by a precomputed move table.
+
+# The tables live in game_ai_table.py (generated by gen_ai_table.py) as bytes
+# objects, so when frozen into the firmware they are read straight from
+# flash and importing this module computes nothing. A lookup is two
+# small-table reads and a nibble extract; nothing is searched or allocated
+# at move time.
+#
+# Bigger m,n,k boards have far too many positions for a table, so they get a
+# greedy player instead: win if it can, block if it must, otherwise extend
+# the longest line it can make or stop, preferring the middle.
+
+from game_ai_table import TABLE, WEIGHT
+
+
+# Base-3 weight of a 9-bit board: the sum of 3**i over the set bits, as a
+# little-endian uint16 in WEIGHT. A position's index is
+# _weight(mine) + 2 * _weight(theirs).
+def _weight(bits):
+    return WEIGHT[2 * bits] | (WEIGHT[2 * bits + 1] << 8)
+
+
+# Best square (1-9) for the side holding `mine` to take next, or 0 if the
+# game is already over.
+def best_move(mine, theirs):
+    index = _weight(mine) + 2 * _weight(theirs)
+    return (TABLE[index >> 1] >> (4 * (index & 1))) & 0x0F
+
+
+# Best move for player_num (1 = host, 2 = guest) on a game_engine.Board or
+# MNKBoard.
+def choose(board, player_num):
+    if not hasattr(board, "p1"):
+        return _greedy(board, player_num)
+    if player_num == 1:
+        return best_move(board.p1, board.p2)
+    return best_move(board.p2, board.p1)
+
+
+def _greedy(board, player_num):
+    other = 3 - player_num
+    width = board.width
+    best = 0
+    best_score = -1
+    for move in range(1, board.size + 1):
+        if not board.is_free(move):
+            continue
+        mine = board.run_through(player_num, move)
+        if mine >= board.k:
+            return move
+        theirs = board.run_through(other, move)
+        x = (move - 1) % width
+        y = (move - 1) // width
+        # Doubled distance from the centre, so odd sizes stay integral.
+        off = abs(2 * x - width + 1) + abs(2 * y - board.height + 1)
+        score = (2 * mine + theirs) * 1024 - off
+        if theirs >= board.k:
+            score += 1 << 20
+        if score > best_score:
+            best = move
+            best_score = score
+    return best
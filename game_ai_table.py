@@ -0,0 +1,348 @@
+# Generated by gen_ai_table.py; do not edit.
+# Perfect-play move table, see game_ai for the layout.
+
+TABLE = (
+    b"\x21\x15\x43\x41\x13\x62\x01\x55\x65\x45\x52\x55\x41\x10\x27\x31\x15\x37\x21\x15\x50\x75\x15\x27\x75\x15\x07\x21\x17\x73\x51\x13"
+    b"\x72\x01\x97\x75\x51\x52\x75\x51\x10\x29\x38\x18\x39\x27\x17\x70\x77\x17\x29\x88\x18\x09\x66\x66\x63\x66\x66\x62\x01\x66\x66\x66"
+    b"\x66\x66\x66\x10\x79\x38\x18\x39\x27\x17\x70\x77\x17\x29\x88\x18\x09\x21\x19\x93\x88\x13\x92\x01\x89\x48\x77\x72\x47\x41\x10\x97"
+    b"\x31\x89\x37\x21\x19\x90\x78\x76\x27\x77\x16\x07\x66\x62\x33\x31\x63\x22\x01\x16\x66\x21\x12\x66\x61\x10\x33\x33\x35\x34\x29\x19"
+    b"\x90\x99\x19\x24\x45\x15\x04\x55\x55\x53\x55\x55\x52\x01\x55\x55\x55\x55\x55\x55\x10\x73\x33\x17\x39\x29\x19\x90\x99\x19\x22\x51"
+    b"\x17\x05\x44\x44\x43\x44\x44\x42\x01\x44\x44\x44\x44\x44\x44\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x93\x87\x83"
+    b"\x93\x73\x72\x01\x77\x77\x91\x82\x88\x91\x10\x93\x33\x89\x38\x29\x19\x90\x99\x79\x27\x77\x14\x04\x71\x19\x93\x78\x93\x92\x01\x99"
+    b"\x97\x77\x72\x77\x71\x10\x23\x33\x83\x38\x29\x19\x90\x99\x79\x27\x77\x17\x07\x33\x32\x53\x71\x13\x42\x01\x45\x55\x99\x92\x99\x91"
+    b"\x10\x37\x31\x33\x37\x21\x12\x50\x77\x95\x27\x79\x19\x07\x55\x52\x33\x55\x53\x22\x01\x55\x55\x21\x12\x55\x51\x10\x29\x38\x18\x39"
+    b"\x27\x17\x70\x77\x97\x29\x88\x18\x09\x71\x82\x83\x71\x73\x72\x01\x77\x77\x79\x82\x87\x71\x10\x79\x38\x18\x39\x27\x17\x70\x77\x97"
+    b"\x29\x88\x18\x09\x44\x42\x33\x31\x43\x22\x01\x14\x44\x21\x12\x44\x41\x10\x97\x31\x89\x37\x21\x19\x90\x78\x17\x27\x71\x17\x07\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x34\x31\x15\x34\x25\x15\x50\x45\x15\x24\x48\x18\x04\x01\x15\x50\x01\x13\x50"
+    b"\x01\x15\x50\x01\x12\x50\x01\x50\x83\x33\x95\x35\x25\x15\x50\x55\x55\x29\x58\x18\x09\x33\x33\x33\x33\x03\x00\x00\x00\x00\x41\x82"
+    b"\x84\x41\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x60\x01\x16\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x98\x82\x88\x91\x10\x94\x31"
+    b"\x89\x34\x21\x19\x90\x48\x14\x24\x41\x19\x04\x01\x19\x90\x01\x13\x90\x01\x19\x60\x01\x12\x90\x01\x60\x26\x36\x13\x33\x26\x12\x60"
+    b"\x61\x66\x26\x66\x16\x06\x43\x13\x33\x43\x53\x52\x01\x55\x54\x44\x42\x54\x41\x10\x50\x01\x15\x50\x01\x15\x50\x01\x15\x50\x01\x15"
+    b"\x00\x33\x33\x33\x33\x53\x52\x01\x55\x55\x91\x82\x85\x91\x30\x33\x33\x33\x33\x00\x00\x00\x00\x40\x44\x44\x44\x04\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x33\x33\x33\x33\x00\x00\x00\x00\x80\x29\x88\x18\x09\x49\x19\x93\x48\x93\x92\x01\x99\x94"
+    b"\x41\x12\x94\x41\x10\x90\x01\x19\x30\x01\x19\x90\x01\x19\x20\x01\x19\x00\x39\x39\x93\x88\x93\x92\x01\x99\x99\x21\x12\x98\x81\x10"
+    b"\x94\x31\x15\x34\x25\x15\x50\x45\x95\x24\x49\x19\x04\x01\x13\x50\x01\x13\x50\x01\x15\x50\x01\x12\x90\x01\x50\x55\x35\x55\x35\x25"
+    b"\x15\x50\x55\x15\x22\x51\x15\x05\x33\x33\x33\x33\x03\x00\x00\x00\x00\x49\x82\x84\x41\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x20"
+    b"\x01\x18\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x99\x82\x88\x91\x40\x24\x34\x13\x34\x24\x12\x40\x41\x14\x24\x41\x14\x04\x01\x19"
+    b"\x90\x01\x13\x90\x01\x19\x80\x01\x12\x90\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x25\x14\x43\x51\x13\x42\x01"
+    b"\x54\x49\x55\x52\x45\x51\x30\x55\x35\x55\x35\x26\x16\x50\x56\x56\x25\x55\x15\x05\x21\x10\x03\x51\x10\x02\x01\x10\x09\x51\x10\x05"
+    b"\x51\x10\x49\x38\x18\x39\x21\x14\x80\x96\x24\x29\x88\x18\x09\x66\x66\x63\x66\x66\x62\x01\x66\x66\x66\x66\x66\x66\x10\x09\x38\x10"
+    b"\x09\x21\x10\x00\x91\x10\x09\x88\x10\x09\x33\x32\x33\x31\x13\x22\x01\x84\x48\x00\x00\x00\x00\x30\x23\x33\x13\x33\x21\x19\x90\x88"
+    b"\x06\x00\x00\x00\x00\x21\x10\x03\x31\x10\x02\x01\x10\x06\x00\x00\x00\x00\x90\x43\x33\x54\x35\x29\x19\x90\x99\x59\x25\x55\x14\x05"
+    b"\x55\x55\x53\x55\x55\x52\x01\x55\x55\x55\x55\x55\x55\x10\x03\x31\x10\x09\x29\x10\x00\x99\x10\x05\x51\x10\x05\x44\x44\x43\x44\x44"
+    b"\x42\x01\x44\x44\x44\x44\x44\x44\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x91\x80\x03\x91\x90\x02\x01\x90\x09\x91"
+    b"\x80\x08\x91\x30\x23\x33\x13\x33\x29\x19\x90\x99\x09\x00\x00\x00\x00\x33\x32\x33\x31\x93\x92\x01\x99\x99\x00\x00\x00\x00\x10\x03"
+    b"\x31\x10\x03\x29\x10\x00\x99\x00\x00\x00\x00\x00\x31\x54\x43\x31\x13\x42\x01\x54\x45\x21\x12\x44\x41\x30\x23\x33\x15\x33\x21\x15"
+    b"\x50\x55\x15\x22\x51\x15\x05\x51\x10\x03\x51\x10\x02\x01\x10\x05\x21\x10\x05\x51\x20\x49\x38\x38\x39\x21\x14\x80\x91\x94\x29\x88"
+    b"\x18\x09\x92\x82\x83\x93\x13\x22\x01\x18\x89\x99\x82\x88\x91\x10\x09\x38\x10\x09\x21\x10\x00\x91\x10\x09\x88\x10\x09\x21\x12\x33"
+    b"\x31\x43\x22\x01\x14\x44\x00\x00\x00\x00\x30\x23\x33\x13\x33\x21\x19\x90\x88\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x10\x72\x35\x15\x37\x22\x15\x50\x57\x97\x25\x55\x15\x07\x75\x55\x53\x77\x13\x52\x01\x55\x57\x75\x52\x55\x71"
+    b"\x50\x72\x35\x15\x39\x22\x17\x50\x57\x57\x25\x55\x15\x09\x22\x02\x00\x97\x23\x22\x00\x70\x77\x22\x02\x00\x91\x20\x22\x00\x60\x66"
+    b"\x22\x02\x00\x66\x26\x22\x00\x60\x06\x22\x02\x00\x97\x23\x22\x00\x70\x77\x22\x02\x00\x91\x10\x97\x31\x19\x37\x29\x19\x90\x79\x79"
+    b"\x27\x77\x14\x07\x77\x19\x93\x77\x13\x92\x01\x79\x97\x77\x72\x67\x71\x60\x26\x36\x63\x36\x26\x12\x60\x66\x16\x22\x61\x16\x06\x25"
+    b"\x55\x53\x49\x93\x92\x01\x95\x99\x45\x52\x55\x41\x50\x55\x35\x55\x55\x25\x15\x50\x55\x55\x55\x55\x55\x05\x29\x57\x53\x99\x93\x92"
+    b"\x01\x95\x99\x51\x52\x55\x91\x20\x22\x00\x40\x44\x22\x02\x00\x44\x24\x22\x00\x40\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x20\x22\x00\x30\x39\x22\x02\x00\x77\x27\x22\x00\x10\x09\x39\x39\x93\x79\x93\x92\x01\x99\x99\x77\x72\x47\x71\x70\x97\x31"
+    b"\x79\x37\x29\x19\x90\x79\x79\x27\x77\x17\x07\x39\x32\x33\x99\x93\x92\x01\x99\x99\x77\x72\x77\x71\x50\x52\x35\x15\x37\x22\x15\x50"
+    b"\x57\x97\x29\x55\x15\x09\x77\x52\x53\x77\x13\x52\x01\x75\x77\x79\x52\x55\x71\x50\x25\x35\x55\x35\x25\x12\x50\x55\x15\x22\x55\x15"
+    b"\x05\x22\x02\x00\x97\x23\x22\x00\x70\x77\x22\x02\x00\x91\x20\x22\x00\x10\x37\x22\x02\x00\x77\x27\x22\x00\x10\x07\x22\x02\x00\x97"
+    b"\x23\x22\x00\x70\x77\x22\x02\x00\x91\x40\x24\x34\x43\x34\x24\x12\x40\x44\x14\x22\x41\x14\x04\x77\x19\x93\x77\x13\x92\x01\x79\x97"
+    b"\x71\x12\x77\x71\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x49\x59\x53\x49\x59\x52\x01\x55\x54\x49\x59\x54\x49\x10"
+    b"\x90\x01\x15\x90\x01\x15\x50\x01\x15\x90\x01\x15\x00\x99\x59\x53\x99\x59\x52\x01\x55\x55\x99\x59\x55\x99\x20\x22\x00\x30\x33\x00"
+    b"\x00\x00\x00\x20\x22\x00\x90\x04\x01\x02\x00\x01\x03\x00\x00\x00\x00\x01\x02\x00\x01\x20\x22\x00\x30\x33\x00\x00\x00\x00\x20\x22"
+    b"\x00\x90\x09\x49\x99\x93\x49\x99\x92\x01\x99\x94\x49\x99\x94\x49\x10\x90\x01\x19\x90\x01\x19\x90\x01\x19\x90\x01\x19\x00\x99\x99"
+    b"\x93\x99\x99\x92\x01\x99\x99\x99\x99\x99\x99\x90\x94\x35\x95\x94\x25\x15\x50\x45\x95\x94\x45\x95\x04\x01\x15\x50\x01\x15\x50\x01"
+    b"\x15\x50\x01\x15\x50\x01\x90\x99\x35\x95\x99\x25\x15\x50\x55\x95\x99\x55\x95\x09\x22\x02\x00\x33\x03\x00\x00\x00\x00\x22\x02\x00"
+    b"\x44\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x22\x02\x00\x33\x03\x00\x00\x00\x00\x22\x02\x00\x99\x90\x94\x39\x99"
+    b"\x94\x29\x19\x90\x49\x99\x94\x49\x99\x04\x01\x19\x90\x01\x19\x90\x01\x19\x90\x01\x19\x90\x01\x90\x99\x39\x99\x99\x29\x19\x90\x99"
+    b"\x99\x99\x99\x99\x09\x49\x59\x53\x49\x59\x52\x01\x55\x54\x49\x59\x54\x49\x10\x90\x01\x15\x90\x01\x15\x50\x01\x15\x90\x01\x15\x00"
+    b"\x99\x59\x53\x99\x59\x52\x01\x55\x55\x99\x59\x55\x99\x20\x22\x00\x30\x33\x00\x00\x00\x00\x20\x22\x00\x90\x04\x01\x02\x00\x01\x03"
+    b"\x00\x00\x00\x00\x01\x02\x00\x01\x20\x22\x00\x30\x33\x00\x00\x00\x00\x20\x22\x00\x90\x09\x49\x99\x93\x49\x99\x92\x01\x99\x94\x49"
+    b"\x99\x94\x49\x10\x90\x01\x19\x90\x01\x19\x90\x01\x19\x90\x01\x19\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x42"
+    b"\x35\x15\x33\x22\x14\x50\x91\x54\x25\x55\x15\x05\x25\x55\x53\x51\x23\x52\x01\x65\x65\x55\x52\x55\x51\x10\x02\x35\x10\x03\x21\x10"
+    b"\x00\x91\x10\x05\x55\x10\x05\x22\x02\x00\x91\x23\x22\x00\x60\x49\x22\x02\x00\x91\x20\x22\x00\x60\x66\x22\x02\x00\x66\x26\x22\x00"
+    b"\x60\x06\x22\x00\x00\x91\x20\x02\x00\x10\x09\x22\x00\x00\x91\x30\x23\x33\x33\x33\x21\x12\x40\x41\x04\x00\x00\x00\x00\x33\x32\x33"
+    b"\x33\x13\x92\x01\x19\x96\x00\x00\x00\x00\x10\x02\x31\x10\x03\x21\x10\x00\x61\x00\x00\x00\x00\x00\x25\x54\x53\x51\x93\x92\x01\x95"
+    b"\x99\x55\x52\x55\x51\x50\x55\x35\x55\x55\x25\x15\x50\x55\x55\x55\x55\x55\x05\x21\x50\x03\x91\x90\x02\x01\x90\x09\x51\x50\x05\x51"
+    b"\x20\x22\x00\x40\x44\x22\x02\x00\x44\x24\x22\x00\x40\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x00\x10\x09"
+    b"\x22\x00\x00\x99\x20\x02\x00\x10\x09\x33\x32\x33\x33\x93\x92\x01\x99\x99\x00\x00\x00\x00\x30\x23\x33\x33\x33\x29\x19\x90\x99\x09"
+    b"\x00\x00\x00\x00\x31\x10\x03\x31\x90\x02\x01\x90\x09\x00\x00\x00\x00\x50\x42\x35\x15\x33\x22\x14\x50\x41\x14\x22\x55\x15\x04\x22"
+    b"\x53\x53\x33\x23\x22\x01\x15\x55\x21\x52\x55\x51\x10\x05\x35\x10\x05\x21\x10\x00\x51\x10\x02\x55\x10\x05\x22\x02\x00\x91\x23\x22"
+    b"\x00\x10\x49\x22\x02\x00\x91\x20\x22\x00\x10\x39\x22\x02\x00\x91\x29\x22\x00\x10\x09\x22\x00\x00\x91\x20\x02\x00\x10\x09\x22\x00"
+    b"\x00\x91\x10\x22\x31\x13\x33\x24\x12\x40\x44\x04\x00\x00\x00\x00\x33\x32\x33\x33\x13\x92\x01\x19\x99\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x32\x12\x73\x55\x13\x92\x01\x57\x55\x71\x72\x47\x51\x50\x57\x31\x55\x37\x21\x15\x50"
+    b"\x75\x55\x27\x75\x15\x07\x31\x77\x73\x55\x13\x72\x01\x57\x55\x21\x12\x75\x51\x10\x49\x31\x14\x39\x27\x17\x70\x77\x47\x29\x94\x14"
+    b"\x09\x66\x66\x63\x66\x66\x62\x01\x66\x66\x66\x66\x66\x66\x10\x79\x31\x17\x39\x27\x17\x70\x77\x77\x29\x97\x17\x09\x22\x12\x93\x00"
+    b"\x20\x22\x01\x09\x00\x21\x72\x47\x00\x20\x27\x31\x09\x00\x22\x12\x90\x00\x10\x27\x77\x06\x00\x21\x62\x33\x00\x10\x22\x01\x06\x00"
+    b"\x21\x12\x66\x00\x50\x53\x33\x54\x35\x29\x19\x90\x99\x59\x24\x44\x15\x05\x55\x55\x53\x55\x55\x52\x01\x55\x55\x55\x55\x55\x55\x10"
+    b"\x73\x33\x57\x35\x29\x19\x90\x99\x19\x25\x57\x17\x05\x44\x44\x43\x44\x44\x42\x01\x44\x44\x44\x44\x44\x44\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x93\x17\x73\x93\x73\x72\x01\x77\x77\x91\x12\x79\x91\x20\x22\x33\x09\x00\x29\x19\x90\x00\x10\x22"
+    b"\x77\x04\x00\x72\x12\x93\x00\x90\x92\x01\x09\x00\x71\x72\x77\x00\x20\x22\x33\x03\x00\x29\x19\x90\x00\x10\x22\x77\x07\x00\x31\x72"
+    b"\x33\x55\x13\x22\x01\x54\x55\x99\x92\x99\x41\x30\x27\x31\x59\x37\x21\x15\x50\x75\x95\x27\x79\x19\x07\x55\x52\x33\x55\x53\x22\x01"
+    b"\x55\x55\x21\x12\x55\x51\x30\x99\x31\x37\x39\x27\x17\x70\x77\x97\x29\x99\x19\x09\x71\x13\x33\x71\x73\x72\x01\x77\x77\x79\x92\x97"
+    b"\x71\x70\x79\x31\x17\x39\x27\x17\x70\x77\x97\x29\x99\x17\x09\x21\x42\x33\x00\x10\x22\x01\x04\x00\x21\x12\x44\x00\x20\x27\x31\x09"
+    b"\x00\x22\x12\x90\x00\x10\x27\x71\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x24\x31\x53\x34\x25\x15\x50\x45"
+    b"\x15\x24\x41\x15\x04\x01\x15\x50\x01\x13\x50\x01\x15\x50\x01\x12\x50\x01\x20\x53\x33\x55\x35\x25\x15\x50\x55\x55\x25\x55\x15\x05"
+    b"\x33\x33\x33\x33\x03\x00\x00\x00\x00\x41\x12\x44\x41\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x60\x01\x16\x00\x33\x33\x33\x33\x03"
+    b"\x00\x00\x00\x00\x91\x12\x69\x91\x20\x24\x31\x09\x00\x22\x12\x90\x00\x20\x24\x41\x09\x00\x01\x12\x90\x00\x10\x20\x01\x09\x00\x01"
+    b"\x12\x90\x00\x10\x22\x36\x03\x00\x21\x12\x60\x00\x10\x22\x66\x06\x00\x43\x13\x33\x45\x53\x52\x01\x55\x54\x44\x42\x44\x41\x10\x50"
+    b"\x01\x15\x50\x01\x15\x50\x01\x15\x50\x01\x15\x00\x33\x33\x33\x55\x53\x52\x01\x55\x55\x21\x12\x55\x51\x30\x33\x33\x33\x33\x00\x00"
+    b"\x00\x00\x40\x44\x44\x44\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x33\x33\x33\x33\x00\x00\x00\x00\x10\x29\x91"
+    b"\x19\x09\x42\x12\x93\x00\x90\x92\x01\x09\x00\x42\x12\x94\x00\x10\x20\x01\x09\x00\x01\x19\x90\x00\x10\x20\x01\x09\x00\x22\x32\x93"
+    b"\x00\x90\x92\x01\x09\x00\x22\x12\x99\x00\x10\x24\x31\x55\x34\x25\x15\x50\x45\x95\x24\x49\x19\x04\x01\x12\x30\x01\x13\x50\x01\x15"
+    b"\x50\x01\x12\x90\x01\x50\x55\x35\x55\x35\x25\x15\x50\x55\x15\x22\x51\x15\x05\x33\x33\x33\x33\x03\x00\x00\x00\x00\x49\x92\x94\x41"
+    b"\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x20\x01\x19\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x99\x92\x99\x91\x10\x24\x34\x03\x00"
+    b"\x21\x12\x40\x00\x10\x24\x41\x04\x00\x01\x12\x90\x00\x10\x20\x01\x09\x00\x01\x12\x90\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x99\x92\x33\x31\x93\x22\x01\x14\x44\x21\x12\x44\x41\x90\x99\x39\x19\x33\x29\x19\x90\x51\x15\x22\x51\x15\x05\x91"
+    b"\x10\x03\x31\x10\x02\x01\x10\x05\x21\x10\x05\x51\x90\x29\x39\x93\x39\x29\x12\x40\x99\x94\x29\x99\x14\x09\x66\x66\x63\x66\x66\x62"
+    b"\x01\x66\x66\x66\x66\x66\x66\x10\x09\x31\x10\x09\x21\x10\x00\x91\x10\x09\x91\x10\x09\x21\x12\x33\x00\x10\x22\x01\x04\x00\x00\x00"
+    b"\x00\x00\x10\x22\x31\x03\x00\x21\x12\x90\x00\x00\x00\x00\x00\x00\x21\x10\x03\x00\x10\x02\x01\x00\x00\x00\x00\x00\x00\x90\x29\x39"
+    b"\x13\x33\x29\x19\x90\x99\x19\x22\x41\x14\x04\x55\x55\x53\x55\x55\x52\x01\x55\x55\x55\x55\x55\x55\x10\x09\x31\x10\x03\x29\x10\x00"
+    b"\x99\x10\x02\x51\x10\x05\x44\x44\x43\x44\x44\x42\x01\x44\x44\x44\x44\x44\x44\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x91\x10\x03\x91\x90\x02\x01\x90\x09\x91\x10\x09\x91\x10\x22\x31\x03\x00\x29\x19\x90\x00\x00\x00\x00\x00\x00\x21\x12\x33\x00"
+    b"\x90\x92\x01\x09\x00\x00\x00\x00\x00\x10\x02\x31\x00\x00\x29\x10\x00\x00\x00\x00\x00\x00\x00\x99\x92\x33\x31\x93\x22\x01\x14\x44"
+    b"\x21\x12\x44\x41\x90\x99\x39\x19\x33\x29\x19\x90\x51\x15\x22\x51\x15\x05\x21\x10\x03\x31\x10\x02\x01\x10\x05\x21\x10\x05\x51\x90"
+    b"\x29\x39\x93\x39\x29\x12\x40\x99\x94\x29\x99\x14\x09\x99\x99\x93\x99\x93\x92\x01\x99\x99\x99\x92\x99\x91\x10\x09\x31\x10\x09\x21"
+    b"\x10\x00\x91\x10\x09\x91\x10\x09\x21\x12\x33\x00\x10\x22\x01\x04\x00\x00\x00\x00\x00\x10\x22\x31\x03\x00\x21\x12\x90\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x35\x31\x38\x35\x26\x16\x60\x56\x16\x25\x55\x18\x05\x51\x16"
+    b"\x53\x51\x63\x62\x01\x66\x65\x51\x12\x55\x51\x30\x75\x31\x37\x35\x26\x16\x60\x56\x76\x25\x55\x17\x05\x01\x13\x80\x01\x13\x60\x01"
+    b"\x16\x60\x01\x12\x80\x01\x10\x60\x01\x16\x60\x01\x16\x60\x01\x16\x60\x01\x16\x00\x01\x17\x80\x01\x13\x60\x01\x16\x60\x01\x12\x80"
+    b"\x01\x10\x33\x33\x83\x38\x26\x16\x60\x66\x76\x27\x77\x17\x04\x77\x12\x33\x78\x63\x62\x01\x66\x66\x77\x72\x77\x71\x60\x26\x36\x13"
+    b"\x33\x26\x16\x60\x66\x16\x22\x61\x16\x06\x33\x33\x33\x33\x03\x00\x00\x00\x00\x55\x52\x55\x51\x30\x33\x33\x33\x33\x00\x00\x00\x00"
+    b"\x50\x55\x55\x55\x05\x33\x33\x33\x33\x03\x00\x00\x00\x00\x51\x52\x75\x51\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x40\x01\x14\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x20\x01\x18\x00\x33\x33\x33\x33\x03"
+    b"\x00\x00\x00\x00\x77\x72\x77\x41\x30\x33\x33\x33\x33\x00\x00\x00\x00\x70\x27\x77\x17\x07\x33\x33\x33\x33\x03\x00\x00\x00\x00\x77"
+    b"\x72\x77\x71\x50\x45\x31\x78\x35\x21\x17\x50\x55\x77\x25\x55\x18\x05\x51\x12\x83\x51\x13\x72\x01\x15\x75\x51\x12\x85\x51\x50\x25"
+    b"\x35\x53\x35\x25\x12\x50\x55\x55\x25\x55\x15\x05\x01\x17\x80\x01\x13\x70\x01\x17\x70\x01\x12\x80\x01\x10\x70\x01\x18\x30\x01\x17"
+    b"\x70\x01\x17\x20\x01\x18\x00\x01\x17\x80\x01\x13\x70\x01\x17\x70\x01\x12\x80\x01\x40\x44\x34\x14\x33\x24\x14\x40\x41\x14\x22\x41"
+    b"\x14\x04\x77\x12\x33\x78\x13\x22\x01\x87\x87\x77\x72\x77\x71\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x48\x88\x83"
+    b"\x48\x58\x52\x01\x55\x54\x48\x88\x84\x48\x10\x80\x01\x18\x80\x01\x15\x50\x01\x15\x80\x01\x18\x00\x58\x88\x83\x58\x58\x52\x01\x55"
+    b"\x55\x58\x88\x85\x58\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x80\x01\x18\x00\x01\x13\x30\x01\x03\x00\x00\x00\x00\x01\x16\x60\x01"
+    b"\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x80\x01\x18\x00\x48\x88\x83\x48\x68\x62\x01\x66\x64\x48\x88\x84\x48\x10\x80\x01\x18\x80"
+    b"\x01\x16\x60\x01\x16\x80\x01\x18\x00\x88\x88\x83\x88\x68\x62\x01\x66\x66\x88\x88\x88\x88\x30\x33\x33\x33\x33\x00\x00\x00\x00\x80"
+    b"\x84\x48\x88\x04\x01\x13\x30\x01\x03\x00\x00\x00\x00\x01\x15\x50\x01\x30\x33\x33\x33\x33\x00\x00\x00\x00\x80\x85\x58\x88\x05\x01"
+    b"\x13\x30\x01\x03\x00\x00\x00\x00\x01\x14\x40\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x13\x30\x01\x03\x00"
+    b"\x00\x00\x00\x01\x18\x80\x01\x30\x33\x33\x33\x33\x00\x00\x00\x00\x80\x84\x48\x88\x04\x01\x13\x30\x01\x03\x00\x00\x00\x00\x01\x18"
+    b"\x80\x01\x30\x33\x33\x33\x33\x00\x00\x00\x00\x80\x88\x88\x88\x08\x48\x88\x83\x48\x58\x52\x01\x55\x54\x48\x88\x84\x48\x10\x80\x01"
+    b"\x18\x80\x01\x15\x50\x01\x15\x80\x01\x18\x00\x58\x88\x83\x58\x58\x52\x01\x55\x55\x58\x88\x85\x58\x10\x30\x01\x13\x30\x00\x00\x00"
+    b"\x00\x10\x80\x01\x18\x00\x01\x13\x30\x01\x03\x00\x00\x00\x00\x01\x18\x80\x01\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x80\x01\x18"
+    b"\x00\x48\x88\x83\x48\x88\x82\x01\x88\x84\x48\x88\x84\x48\x10\x80\x01\x18\x80\x01\x18\x80\x01\x18\x80\x01\x18\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x45\x31\x34\x35\x26\x16\x60\x56\x56\x25\x55\x14\x05\x55\x16\x53\x55\x63\x62\x01\x66\x65"
+    b"\x55\x52\x55\x51\x10\x05\x31\x10\x05\x26\x10\x00\x56\x10\x05\x51\x10\x05\x01\x14\x80\x01\x13\x60\x01\x16\x60\x01\x12\x80\x01\x10"
+    b"\x60\x01\x16\x60\x01\x16\x60\x01\x16\x60\x01\x16\x00\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x30\x23\x33\x13\x33\x26"
+    b"\x16\x60\x66\x06\x00\x00\x00\x00\x33\x33\x33\x31\x63\x62\x01\x66\x66\x00\x00\x00\x00\x10\x02\x31\x10\x03\x26\x10\x00\x66\x00\x00"
+    b"\x00\x00\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x55\x52\x45\x51\x30\x33\x33\x33\x33\x00\x00\x00\x00\x50\x55\x55\x55\x05\x33\x30"
+    b"\x03\x33\x00\x00\x00\x00\x00\x51\x10\x05\x51\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x40\x01\x14\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x10\x00\x01\x10\x00\x00\x00\x00\x00\x10\x00\x01\x10\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x30\x33\x33\x33\x33\x00\x00\x00\x00\x00\x00\x00\x00\x00\x33\x30\x03\x33\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x45\x31\x14"
+    b"\x35\x21\x14\x40\x54\x54\x25\x55\x14\x05\x51\x12\x33\x53\x13\x22\x01\x15\x55\x55\x52\x55\x51\x10\x05\x31\x10\x05\x21\x10\x00\x51"
+    b"\x10\x05\x51\x10\x05\x01\x14\x80\x01\x13\x40\x01\x18\x40\x01\x12\x80\x01\x10\x20\x01\x18\x30\x01\x12\x80\x01\x18\x20\x01\x18\x00"
+    b"\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x22\x31\x13\x33\x24\x14\x40\x41\x04\x00\x00\x00\x00\x33\x33\x33\x31\x13"
+    b"\x22\x01\x88\x88\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x57\x57\x53\x57\x67\x62\x01\x65\x65\x57"
+    b"\x57\x55\x57\x70\x75\x35\x75\x75\x26\x16\x50\x56\x76\x75\x55\x75\x05\x57\x57\x53\x57\x67\x62\x01\x65\x65\x57\x57\x55\x57\x10\x20"
+    b"\x00\x10\x70\x01\x02\x00\x01\x16\x20\x00\x10\x00\x01\x02\x00\x01\x16\x20\x00\x10\x60\x01\x02\x00\x01\x10\x20\x00\x10\x70\x01\x02"
+    b"\x00\x01\x16\x20\x00\x10\x00\x77\x77\x73\x77\x67\x62\x01\x66\x66\x77\x77\x77\x77\x70\x77\x37\x77\x77\x26\x16\x60\x66\x76\x77\x77"
+    b"\x77\x07\x77\x77\x73\x77\x67\x62\x01\x66\x66\x77\x77\x77\x77\x30\x33\x33\x33\x33\x00\x00\x00\x00\x70\x75\x55\x75\x05\x33\x33\x33"
+    b"\x33\x03\x00\x00\x00\x00\x55\x55\x55\x55\x30\x33\x33\x33\x33\x00\x00\x00\x00\x70\x75\x55\x75\x05\x01\x02\x00\x01\x03\x00\x00\x00"
+    b"\x00\x01\x02\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x00\x01\x03\x00\x00\x00\x00\x01\x02\x00\x01"
+    b"\x30\x33\x33\x33\x33\x00\x00\x00\x00\x70\x77\x77\x77\x07\x33\x33\x33\x33\x03\x00\x00\x00\x00\x77\x77\x77\x77\x30\x33\x33\x33\x33"
+    b"\x00\x00\x00\x00\x70\x77\x77\x77\x07\x57\x57\x53\x57\x77\x72\x01\x75\x75\x57\x57\x55\x57\x70\x75\x35\x75\x75\x27\x17\x50\x57\x77"
+    b"\x75\x55\x75\x05\x57\x57\x53\x57\x77\x72\x01\x75\x75\x57\x57\x55\x57\x10\x20\x00\x10\x70\x01\x02\x00\x01\x17\x20\x00\x10\x00\x01"
+    b"\x02\x00\x01\x17\x20\x00\x10\x70\x01\x02\x00\x01\x10\x20\x00\x10\x70\x01\x02\x00\x01\x17\x20\x00\x10\x00\x77\x77\x73\x77\x77\x72"
+    b"\x01\x77\x77\x77\x77\x77\x77\x70\x77\x37\x77\x77\x27\x17\x70\x77\x77\x77\x77\x77\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x55\x54\x53\x51\x63\x62\x01\x65\x65\x55\x52\x55\x51\x50\x55\x35\x55"
+    b"\x35\x26\x16\x50\x56\x56\x25\x55\x15\x05\x51\x50\x03\x51\x60\x02\x01\x60\x05\x51\x50\x05\x51\x10\x20\x00\x10\x30\x01\x02\x00\x01"
+    b"\x16\x20\x00\x10\x00\x01\x02\x00\x01\x16\x20\x00\x10\x60\x01\x02\x00\x01\x10\x00\x00\x10\x00\x01\x00\x00\x01\x10\x00\x00\x10\x00"
+    b"\x33\x32\x33\x33\x63\x62\x01\x66\x66\x00\x00\x00\x00\x30\x33\x33\x33\x33\x26\x16\x60\x66\x06\x00\x00\x00\x00\x21\x10\x03\x31\x60"
+    b"\x02\x01\x60\x06\x00\x00\x00\x00\x30\x33\x33\x33\x33\x00\x00\x00\x00\x50\x25\x55\x15\x05\x33\x33\x33\x33\x03\x00\x00\x00\x00\x55"
+    b"\x55\x55\x55\x30\x03\x33\x30\x03\x00\x00\x00\x00\x10\x05\x55\x10\x05\x01\x02\x00\x01\x03\x00\x00\x00\x00\x01\x02\x00\x01\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x01\x00\x00\x00\x00\x00\x01\x00\x00\x01\x30\x33\x33\x33\x33\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x00\x00\x00\x00\x30\x03\x33\x30\x03\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x55\x54\x53\x51\x13\x42\x01\x15\x45\x55\x52\x55\x51\x50\x25\x35\x15\x35\x21\x12\x50\x51\x55\x25\x55\x15\x05\x51\x50\x03"
+    b"\x51\x10\x02\x01\x10\x05\x51\x50\x05\x51\x10\x20\x00\x10\x30\x01\x02\x00\x01\x14\x20\x00\x10\x00\x01\x02\x00\x01\x13\x20\x00\x10"
+    b"\x00\x01\x02\x00\x01\x10\x00\x00\x10\x00\x01\x00\x00\x01\x10\x00\x00\x10\x00\x21\x12\x33\x31\x43\x42\x01\x44\x44\x00\x00\x00\x00"
+    b"\x30\x33\x33\x33\x33\x21\x12\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x25\x31\x53\x35"
+    b"\x26\x16\x60\x56\x26\x25\x51\x14\x05\x51\x16\x63\x55\x63\x62\x01\x66\x65\x51\x12\x55\x51\x30\x75\x31\x57\x35\x26\x16\x60\x56\x16"
+    b"\x25\x55\x17\x05\x01\x13\x30\x01\x13\x60\x01\x16\x60\x01\x12\x40\x01\x10\x60\x01\x16\x60\x01\x16\x60\x01\x16\x60\x01\x16\x00\x01"
+    b"\x17\x70\x01\x13\x60\x01\x16\x60\x01\x12\x70\x01\x20\x22\x33\x03\x00\x26\x16\x60\x00\x10\x22\x77\x07\x00\x72\x12\x33\x00\x60\x62"
+    b"\x01\x06\x00\x71\x72\x77\x00\x10\x22\x36\x03\x00\x26\x16\x60\x00\x10\x22\x61\x06\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x55\x52"
+    b"\x45\x51\x30\x33\x33\x33\x33\x00\x00\x00\x00\x50\x55\x55\x55\x05\x33\x33\x33\x33\x03\x00\x00\x00\x00\x51\x12\x75\x51\x10\x30\x01"
+    b"\x13\x30\x00\x00\x00\x00\x10\x40\x01\x14\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x30\x01\x13\x30\x00\x00\x00"
+    b"\x00\x10\x20\x01\x17\x00\x33\x33\x33\x00\x00\x00\x00\x00\x00\x21\x72\x77\x00\x30\x33\x33\x03\x00\x00\x00\x00\x00\x10\x27\x77\x07"
+    b"\x00\x33\x33\x33\x00\x00\x00\x00\x00\x00\x21\x72\x77\x00\x20\x55\x31\x54\x35\x21\x14\x40\x55\x55\x25\x54\x14\x05\x51\x12\x33\x55"
+    b"\x13\x22\x01\x55\x55\x51\x12\x55\x51\x50\x25\x35\x53\x35\x25\x12\x50\x55\x55\x25\x55\x15\x05\x01\x12\x30\x01\x13\x70\x01\x17\x70"
+    b"\x01\x12\x40\x01\x10\x20\x01\x13\x30\x01\x17\x70\x01\x17\x20\x01\x17\x00\x01\x17\x70\x01\x13\x70\x01\x17\x70\x01\x12\x70\x01\x10"
+    b"\x22\x34\x04\x00\x21\x12\x40\x00\x10\x22\x41\x04\x00\x72\x12\x33\x00\x20\x22\x01\x07\x00\x71\x72\x77\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x41\x13\x33\x45\x53\x52\x01\x55\x54\x41\x12\x44\x41\x10\x30\x01\x13\x30\x01\x15\x50\x01\x15\x20"
+    b"\x01\x15\x00\x53\x13\x33\x55\x53\x52\x01\x55\x55\x52\x12\x55\x51\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x20\x01\x14\x00\x01\x13"
+    b"\x30\x01\x03\x00\x00\x00\x00\x01\x16\x60\x01\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x20\x01\x16\x00\x42\x12\x33\x00\x60\x62\x01"
+    b"\x06\x00\x42\x12\x44\x00\x10\x20\x01\x03\x00\x01\x16\x60\x00\x10\x20\x01\x06\x00\x21\x62\x63\x00\x60\x62\x01\x06\x00\x21\x62\x66"
+    b"\x00\x30\x33\x33\x33\x33\x00\x00\x00\x00\x10\x24\x41\x14\x04\x01\x13\x30\x01\x03\x00\x00\x00\x00\x01\x15\x50\x01\x30\x33\x33\x33"
+    b"\x33\x00\x00\x00\x00\x10\x25\x51\x15\x05\x01\x13\x30\x01\x03\x00\x00\x00\x00\x01\x14\x40\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x01\x13\x30\x01\x03\x00\x00\x00\x00\x01\x12\x00\x01\x30\x33\x33\x03\x00\x00\x00\x00\x00\x20\x24\x41\x04\x00"
+    b"\x01\x13\x30\x00\x00\x00\x00\x00\x00\x01\x12\x00\x00\x30\x33\x33\x03\x00\x00\x00\x00\x00\x20\x22\x01\x00\x00\x41\x12\x33\x45\x53"
+    b"\x52\x01\x55\x54\x41\x12\x44\x41\x10\x20\x01\x13\x30\x01\x15\x50\x01\x15\x20\x01\x15\x00\x55\x55\x53\x55\x53\x52\x01\x55\x55\x55"
+    b"\x52\x55\x51\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x20\x01\x14\x00\x01\x13\x30\x01\x03\x00\x00\x00\x00\x01\x12\x00\x01\x10\x30"
+    b"\x01\x13\x30\x00\x00\x00\x00\x10\x20\x01\x10\x00\x41\x42\x43\x00\x10\x22\x01\x04\x00\x41\x42\x44\x00\x10\x20\x01\x03\x00\x01\x12"
+    b"\x00\x00\x10\x20\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x45\x31\x54\x35\x26\x16\x60\x56\x56\x25\x55"
+    b"\x14\x05\x55\x16\x63\x55\x63\x62\x01\x66\x65\x55\x52\x55\x51\x10\x05\x31\x10\x05\x26\x10\x00\x56\x10\x05\x51\x10\x05\x01\x14\x40"
+    b"\x01\x13\x60\x01\x16\x60\x01\x12\x40\x01\x10\x60\x01\x16\x60\x01\x16\x60\x01\x16\x60\x01\x16\x00\x01\x10\x00\x01\x10\x00\x01\x10"
+    b"\x00\x01\x10\x00\x01\x10\x22\x33\x03\x00\x26\x16\x60\x00\x00\x00\x00\x00\x00\x21\x32\x33\x00\x60\x62\x01\x06\x00\x00\x00\x00\x00"
+    b"\x10\x02\x31\x00\x00\x26\x10\x00\x00\x00\x00\x00\x00\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x55\x52\x45\x51\x30\x33\x33\x33\x33"
+    b"\x00\x00\x00\x00\x50\x55\x55\x55\x05\x33\x30\x03\x33\x00\x00\x00\x00\x00\x51\x10\x05\x51\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10"
+    b"\x40\x01\x14\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x01\x10\x00\x00\x00\x00\x00\x10\x00\x01\x10\x00\x33"
+    b"\x33\x33\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x33\x33\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x33\x30\x03\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x50\x45\x31\x54\x35\x21\x14\x40\x55\x54\x25\x55\x14\x05\x52\x12\x33\x55\x13\x22\x01\x55\x55\x55\x52"
+    b"\x55\x51\x10\x05\x31\x10\x05\x21\x10\x00\x51\x10\x05\x51\x10\x05\x01\x14\x40\x01\x13\x40\x01\x14\x40\x01\x12\x40\x01\x10\x20\x01"
+    b"\x13\x30\x01\x12\x00\x01\x10\x20\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x22\x31\x03\x00\x21\x12\x40"
+    b"\x00\x00\x00\x00\x00\x00\x21\x32\x33\x00\x20\x22\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x35\x35\x53\x51\x13\x52\x01\x55\x57\x66\x62\x46\x61\x70\x57\x31\x55\x37\x21\x15\x50\x75\x65\x27\x76\x15\x07\x31\x52\x33\x51"
+    b"\x13\x22\x01\x15\x55\x66\x62\x56\x61\x10\x22\x38\x18\x34\x27\x17\x70\x77\x67\x26\x88\x18\x06\x66\x66\x63\x66\x66\x62\x01\x66\x66"
+    b"\x66\x66\x66\x66\x10\x72\x38\x18\x33\x27\x17\x70\x77\x67\x26\x88\x18\x06\x31\x10\x03\x81\x10\x02\x01\x10\x08\x21\x10\x04\x41\x10"
+    b"\x07\x31\x10\x07\x21\x10\x00\x71\x10\x07\x71\x10\x07\x61\x10\x03\x31\x10\x02\x01\x10\x06\x21\x10\x06\x61\x10\x54\x35\x55\x34\x25"
+    b"\x15\x50\x45\x55\x24\x45\x15\x04\x55\x55\x53\x55\x55\x52\x01\x55\x55\x55\x55\x55\x55\x10\x22\x31\x13\x35\x21\x12\x50\x51\x15\x25"
+    b"\x55\x15\x05\x44\x44\x43\x44\x44\x42\x01\x44\x44\x44\x44\x44\x44\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x21\x87"
+    b"\x83\x31\x73\x72\x01\x77\x77\x21\x82\x88\x71\x10\x02\x31\x10\x08\x21\x10\x00\x81\x10\x07\x71\x10\x04\x71\x10\x03\x71\x10\x02\x01"
+    b"\x10\x07\x71\x10\x07\x71\x10\x02\x31\x10\x08\x21\x10\x00\x81\x10\x07\x71\x10\x07\x33\x32\x33\x33\x13\x52\x01\x55\x57\x00\x00\x00"
+    b"\x00\x30\x27\x33\x33\x37\x21\x15\x50\x77\x05\x00\x00\x00\x00\x21\x12\x33\x31\x53\x22\x01\x55\x55\x00\x00\x00\x00\x30\x33\x38\x38"
+    b"\x33\x27\x17\x70\x77\x07\x00\x00\x00\x00\x73\x83\x83\x73\x73\x72\x01\x77\x77\x00\x00\x00\x00\x30\x23\x38\x38\x33\x27\x17\x70\x77"
+    b"\x07\x00\x00\x00\x00\x21\x10\x03\x31\x10\x02\x01\x10\x04\x00\x00\x00\x00\x10\x07\x31\x10\x07\x21\x10\x00\x71\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x54\x31\x15\x34\x25\x15\x50\x45\x65\x24\x46\x14\x04\x01\x15\x50\x01\x13"
+    b"\x50\x01\x15\x50\x01\x12\x50\x01\x50\x53\x33\x15\x35\x25\x15\x50\x55\x65\x26\x66\x15\x06\x33\x33\x33\x33\x03\x00\x00\x00\x00\x46"
+    b"\x82\x84\x41\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x60\x01\x16\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x66\x82\x88\x61\x10\x04"
+    b"\x31\x10\x04\x21\x10\x00\x41\x10\x04\x41\x10\x04\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x06\x31\x10\x03\x21\x10"
+    b"\x00\x61\x10\x06\x61\x10\x06\x44\x15\x53\x44\x53\x52\x01\x55\x54\x44\x42\x54\x41\x10\x50\x01\x15\x50\x01\x15\x50\x01\x15\x50\x01"
+    b"\x15\x00\x31\x35\x53\x31\x53\x52\x01\x55\x55\x21\x12\x55\x51\x30\x33\x33\x33\x33\x00\x00\x00\x00\x40\x44\x44\x44\x04\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x33\x33\x33\x33\x00\x00\x00\x00\x10\x22\x88\x18\x08\x41\x10\x03\x41\x10\x02\x01\x10"
+    b"\x04\x41\x10\x04\x41\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x00\x21\x10\x03\x81\x10\x02\x01\x10\x08\x21\x10\x08\x81"
+    b"\x30\x24\x33\x33\x34\x25\x15\x50\x45\x05\x00\x00\x00\x00\x01\x12\x30\x01\x13\x50\x01\x15\x50\x00\x00\x00\x00\x10\x22\x31\x13\x33"
+    b"\x25\x15\x50\x55\x05\x00\x00\x00\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x00\x00\x00\x00\x10\x30\x01\x13\x30\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x00\x00\x00\x00\x10\x04\x31\x10\x04\x21\x10\x00\x41\x00\x00\x00\x00\x00\x01"
+    b"\x10\x00\x01\x10\x00\x01\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x88\x82\x33\x88\x83\x22"
+    b"\x01\x84\x48\x21\x12\x44\x41\x80\x28\x38\x83\x38\x28\x12\x50\x88\x15\x22\x51\x15\x05\x81\x10\x03\x81\x10\x02\x01\x10\x08\x21\x10"
+    b"\x05\x51\x80\x28\x38\x88\x38\x28\x12\x80\x88\x14\x22\x88\x18\x04\x66\x66\x63\x66\x66\x62\x01\x66\x66\x66\x66\x66\x66\x10\x08\x38"
+    b"\x10\x08\x21\x10\x00\x81\x10\x02\x88\x10\x06\x21\x10\x03\x31\x10\x02\x01\x10\x08\x00\x00\x00\x00\x10\x02\x31\x10\x03\x21\x10\x00"
+    b"\x81\x00\x00\x00\x00\x00\x21\x10\x03\x31\x10\x02\x01\x10\x06\x00\x00\x00\x00\x80\x28\x38\x83\x38\x28\x12\x40\x88\x14\x22\x41\x14"
+    b"\x04\x55\x55\x53\x55\x55\x52\x01\x55\x55\x55\x55\x55\x55\x10\x08\x31\x10\x08\x21\x10\x00\x81\x10\x02\x51\x10\x05\x44\x44\x43\x44"
+    b"\x44\x42\x01\x44\x44\x44\x44\x44\x44\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x81\x80\x03\x81\x10\x02\x01\x10\x08"
+    b"\x81\x80\x08\x81\x10\x02\x31\x10\x03\x21\x10\x00\x81\x00\x00\x00\x00\x00\x21\x10\x03\x31\x10\x02\x01\x10\x08\x00\x00\x00\x00\x10"
+    b"\x02\x31\x10\x03\x21\x10\x00\x81\x00\x00\x00\x00\x00\x21\x12\x33\x31\x83\x22\x01\x84\x48\x00\x00\x00\x00\x10\x22\x31\x13\x33\x28"
+    b"\x12\x50\x88\x05\x00\x00\x00\x00\x21\x10\x03\x31\x10\x02\x01\x10\x05\x00\x00\x00\x00\x10\x22\x38\x18\x33\x28\x12\x80\x88\x04\x00"
+    b"\x00\x00\x00\x21\x82\x83\x31\x83\x82\x01\x88\x88\x00\x00\x00\x00\x10\x02\x38\x10\x03\x21\x10\x00\x81\x00\x00\x00\x00\x00\x21\x10"
+    b"\x03\x31\x10\x02\x01\x10\x04\x00\x00\x00\x00\x10\x02\x31\x10\x03\x21\x10\x00\x81\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x10\x52\x35\x15\x33\x22\x15\x50\x71\x65\x26\x55\x15\x06\x75\x55\x53\x71\x13\x52\x01\x55\x57\x76\x52\x55"
+    b"\x71\x50\x22\x35\x15\x33\x22\x12\x50\x51\x65\x26\x55\x15\x06\x22\x02\x00\x41\x23\x22\x00\x70\x77\x22\x02\x00\x61\x20\x22\x00\x60"
+    b"\x66\x22\x02\x00\x66\x26\x22\x00\x60\x06\x22\x02\x00\x31\x23\x22\x00\x70\x77\x22\x02\x00\x61\x10\x03\x31\x10\x03\x21\x10\x00\x41"
+    b"\x10\x02\x41\x10\x04\x71\x10\x03\x71\x10\x02\x01\x10\x07\x71\x10\x07\x71\x10\x06\x31\x10\x06\x21\x10\x00\x61\x10\x02\x61\x10\x06"
+    b"\x25\x55\x53\x41\x23\x52\x01\x55\x54\x45\x52\x55\x41\x50\x55\x35\x55\x55\x25\x15\x50\x55\x55\x55\x55\x55\x05\x21\x52\x53\x31\x23"
+    b"\x22\x01\x15\x55\x21\x52\x55\x51\x20\x22\x00\x40\x44\x22\x02\x00\x44\x24\x22\x00\x40\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x20\x22\x00\x10\x33\x22\x02\x00\x77\x27\x22\x00\x10\x07\x21\x10\x03\x31\x10\x02\x01\x10\x04\x71\x10\x07\x71\x10\x07"
+    b"\x31\x10\x07\x21\x10\x00\x71\x10\x07\x71\x10\x07\x21\x10\x03\x31\x10\x02\x01\x10\x07\x71\x10\x07\x71\x30\x23\x35\x35\x33\x22\x15"
+    b"\x50\x71\x05\x00\x00\x00\x00\x73\x52\x53\x73\x13\x52\x01\x75\x57\x00\x00\x00\x00\x10\x22\x35\x15\x33\x25\x12\x50\x55\x05\x00\x00"
+    b"\x00\x00\x22\x02\x00\x33\x23\x22\x00\x70\x77\x00\x00\x00\x00\x20\x22\x00\x30\x37\x22\x02\x00\x77\x07\x00\x00\x00\x00\x22\x02\x00"
+    b"\x33\x23\x22\x00\x70\x77\x00\x00\x00\x00\x10\x02\x31\x10\x03\x21\x10\x00\x41\x00\x00\x00\x00\x00\x71\x10\x03\x71\x10\x02\x01\x10"
+    b"\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x55\x53\x41\x53\x52\x01\x55\x54\x46\x52\x54\x41"
+    b"\x10\x50\x01\x15\x30\x01\x15\x50\x01\x15\x20\x01\x15\x00\x25\x55\x53\x31\x53\x52\x01\x55\x55\x66\x52\x55\x61\x20\x22\x00\x30\x33"
+    b"\x00\x00\x00\x00\x20\x22\x00\x10\x04\x01\x02\x00\x01\x03\x00\x00\x00\x00\x01\x02\x00\x01\x20\x22\x00\x30\x33\x00\x00\x00\x00\x20"
+    b"\x22\x00\x10\x06\x41\x10\x03\x41\x10\x02\x01\x10\x04\x41\x10\x04\x41\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x00\x61"
+    b"\x10\x03\x61\x10\x02\x01\x10\x06\x61\x10\x06\x61\x40\x54\x35\x45\x34\x25\x15\x50\x45\x45\x24\x45\x15\x04\x01\x15\x50\x01\x15\x50"
+    b"\x01\x15\x50\x01\x15\x50\x01\x50\x52\x35\x15\x33\x25\x15\x50\x55\x15\x22\x55\x15\x05\x22\x02\x00\x33\x03\x00\x00\x00\x00\x22\x02"
+    b"\x00\x44\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x22\x02\x00\x33\x03\x00\x00\x00\x00\x22\x02\x00\x01\x10\x04\x31"
+    b"\x10\x04\x21\x10\x00\x41\x10\x04\x41\x10\x04\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x00\x01\x10\x02\x31\x10\x03\x21\x10\x00"
+    b"\x01\x10\x02\x01\x10\x00\x43\x52\x53\x43\x53\x52\x01\x55\x54\x00\x00\x00\x00\x10\x20\x01\x15\x30\x01\x15\x50\x01\x05\x00\x00\x00"
+    b"\x00\x21\x52\x53\x31\x53\x52\x01\x55\x55\x00\x00\x00\x00\x20\x22\x00\x30\x33\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x00\x01"
+    b"\x03\x00\x00\x00\x00\x00\x00\x00\x00\x20\x22\x00\x30\x33\x00\x00\x00\x00\x00\x00\x00\x00\x00\x41\x10\x03\x41\x10\x02\x01\x10\x04"
+    b"\x00\x00\x00\x00\x10\x00\x01\x10\x00\x01\x10\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x50"
+    b"\x22\x35\x15\x33\x22\x12\x50\x41\x14\x22\x55\x15\x04\x25\x55\x53\x33\x23\x52\x01\x15\x55\x21\x52\x55\x51\x10\x02\x35\x10\x03\x21"
+    b"\x10\x00\x51\x10\x02\x55\x10\x05\x22\x02\x00\x31\x23\x22\x00\x10\x44\x22\x02\x00\x61\x20\x22\x00\x60\x66\x22\x02\x00\x66\x26\x22"
+    b"\x00\x60\x06\x22\x00\x00\x31\x20\x02\x00\x10\x06\x22\x00\x00\x61\x10\x03\x31\x10\x03\x21\x10\x00\x41\x00\x00\x00\x00\x00\x31\x10"
+    b"\x03\x31\x10\x02\x01\x10\x06\x00\x00\x00\x00\x10\x02\x31\x10\x03\x21\x10\x00\x61\x00\x00\x00\x00\x00\x25\x52\x53\x31\x23\x22\x01"
+    b"\x15\x44\x55\x52\x55\x51\x50\x55\x35\x55\x55\x25\x15\x50\x55\x55\x55\x55\x55\x05\x21\x50\x03\x31\x10\x02\x01\x10\x05\x51\x50\x05"
+    b"\x51\x20\x22\x00\x40\x44\x22\x02\x00\x44\x24\x22\x00\x40\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x00\x10"
+    b"\x03\x22\x00\x00\x01\x20\x02\x00\x10\x00\x31\x10\x03\x31\x10\x02\x01\x10\x04\x00\x00\x00\x00\x10\x03\x31\x10\x03\x21\x10\x00\x01"
+    b"\x00\x00\x00\x00\x00\x31\x10\x03\x31\x10\x02\x01\x10\x00\x00\x00\x00\x00\x30\x23\x35\x35\x33\x22\x12\x50\x41\x04\x00\x00\x00\x00"
+    b"\x33\x52\x53\x33\x23\x52\x01\x15\x55\x00\x00\x00\x00\x10\x02\x35\x10\x03\x21\x10\x00\x51\x00\x00\x00\x00\x00\x22\x02\x00\x33\x23"
+    b"\x22\x00\x10\x44\x00\x00\x00\x00\x20\x22\x00\x30\x33\x22\x02\x00\x01\x00\x00\x00\x00\x00\x22\x00\x00\x31\x20\x02\x00\x10\x00\x00"
+    b"\x00\x00\x00\x10\x02\x31\x10\x03\x21\x10\x00\x41\x00\x00\x00\x00\x00\x31\x10\x03\x31\x10\x02\x01\x10\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x77\x72\x33\x31\x73\x22\x01\x14\x44\x21\x12\x44\x41\x70\x27\x37\x13\x37\x27\x12"
+    b"\x50\x71\x15\x27\x71\x15\x07\x77\x72\x33\x31\x73\x22\x01\x15\x55\x21\x12\x55\x51\x70\x77\x37\x77\x37\x27\x17\x70\x77\x17\x22\x41"
+    b"\x14\x04\x66\x66\x63\x66\x66\x62\x01\x66\x66\x66\x66\x66\x66\x70\x77\x37\x77\x37\x27\x17\x70\x77\x17\x22\x61\x16\x06\x21\x10\x03"
+    b"\x00\x10\x02\x01\x00\x00\x21\x10\x04\x00\x10\x07\x31\x00\x00\x21\x10\x00\x00\x10\x07\x71\x00\x00\x21\x10\x03\x00\x10\x02\x01\x00"
+    b"\x00\x21\x10\x06\x00\x70\x27\x37\x13\x33\x27\x12\x40\x41\x74\x27\x77\x14\x04\x55\x55\x53\x55\x55\x52\x01\x55\x55\x55\x55\x55\x55"
+    b"\x70\x27\x37\x13\x33\x27\x12\x50\x51\x75\x27\x77\x15\x05\x44\x44\x43\x44\x44\x42\x01\x44\x44\x44\x44\x44\x44\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x77\x77\x73\x77\x73\x72\x01\x77\x77\x77\x72\x77\x71\x10\x02\x31\x00\x00\x21\x10\x00\x00\x10"
+    b"\x02\x71\x00\x00\x71\x10\x03\x00\x10\x02\x01\x00\x00\x71\x10\x07\x00\x10\x02\x31\x00\x00\x21\x10\x00\x00\x10\x02\x71\x00\x00\x21"
+    b"\x12\x33\x31\x73\x22\x01\x14\x44\x00\x00\x00\x00\x10\x27\x31\x13\x37\x27\x12\x50\x71\x05\x00\x00\x00\x00\x21\x12\x33\x31\x13\x22"
+    b"\x01\x15\x55\x00\x00\x00\x00\x10\x22\x31\x13\x33\x27\x17\x70\x77\x07\x00\x00\x00\x00\x71\x12\x33\x71\x73\x72\x01\x77\x77\x00\x00"
+    b"\x00\x00\x10\x22\x31\x13\x33\x27\x17\x70\x77\x07\x00\x00\x00\x00\x21\x10\x03\x00\x10\x02\x01\x00\x00\x00\x00\x00\x00\x10\x07\x31"
+    b"\x00\x00\x21\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x54\x31\x55\x34\x25\x15\x50"
+    b"\x45\x65\x24\x46\x14\x04\x01\x15\x50\x01\x13\x50\x01\x15\x50\x01\x12\x50\x01\x50\x53\x33\x55\x35\x25\x15\x50\x55\x65\x26\x66\x15"
+    b"\x05\x33\x33\x33\x33\x03\x00\x00\x00\x00\x46\x62\x64\x41\x10\x30\x01\x13\x30\x00\x00\x00\x00\x10\x60\x01\x16\x00\x33\x33\x33\x33"
+    b"\x03\x00\x00\x00\x00\x66\x62\x66\x61\x10\x04\x31\x00\x00\x21\x10\x00\x00\x10\x04\x41\x00\x00\x01\x10\x00\x00\x10\x00\x01\x00\x00"
+    b"\x01\x10\x00\x00\x10\x02\x31\x00\x00\x21\x10\x00\x00\x10\x02\x61\x00\x00\x44\x15\x53\x45\x53\x52\x01\x55\x54\x44\x42\x54\x41\x10"
+    b"\x50\x01\x15\x50\x01\x15\x50\x01\x15\x50\x01\x15\x00\x31\x35\x53\x55\x53\x52\x01\x55\x55\x21\x12\x55\x51\x30\x33\x33\x33\x33\x00"
+    b"\x00\x00\x00\x40\x44\x44\x44\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x30\x33\x33\x33\x33\x00\x00\x00\x00\x10\x22"
+    b"\x01\x10\x00\x41\x10\x03\x00\x10\x02\x01\x00\x00\x41\x10\x04\x00\x10\x00\x01\x00\x00\x01\x10\x00\x00\x10\x00\x01\x00\x00\x21\x10"
+    b"\x03\x00\x10\x02\x01\x00\x00\x21\x10\x00\x00\x30\x24\x33\x13\x34\x25\x15\x50\x45\x05\x00\x00\x00\x00\x01\x12\x30\x01\x13\x50\x01"
+    b"\x15\x50\x00\x00\x00\x00\x10\x22\x31\x13\x33\x25\x15\x50\x55\x05\x00\x00\x00\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x10\x30\x01\x13\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00\x33\x33\x33\x33\x03\x00\x00\x00\x00\x00\x00\x00\x00\x10\x04\x31\x00"
+    b"\x00\x21\x10\x00\x00\x00\x00\x00\x00\x00\x01\x10\x00\x00\x10\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+)
+
+WEIGHT = (
+    b"\x00\x00\x01\x00\x03\x00\x04\x00\x09\x00\x0a\x00\x0c\x00\x0d\x00\x1b\x00\x1c\x00\x1e\x00\x1f\x00\x24\x00\x25\x00\x27\x00\x28\x00"
+    b"\x51\x00\x52\x00\x54\x00\x55\x00\x5a\x00\x5b\x00\x5d\x00\x5e\x00\x6c\x00\x6d\x00\x6f\x00\x70\x00\x75\x00\x76\x00\x78\x00\x79\x00"
+    b"\xf3\x00\xf4\x00\xf6\x00\xf7\x00\xfc\x00\xfd\x00\xff\x00\x00\x01\x0e\x01\x0f\x01\x11\x01\x12\x01\x17\x01\x18\x01\x1a\x01\x1b\x01"
+    b"\x44\x01\x45\x01\x47\x01\x48\x01\x4d\x01\x4e\x01\x50\x01\x51\x01\x5f\x01\x60\x01\x62\x01\x63\x01\x68\x01\x69\x01\x6b\x01\x6c\x01"
+    b"\xd9\x02\xda\x02\xdc\x02\xdd\x02\xe2\x02\xe3\x02\xe5\x02\xe6\x02\xf4\x02\xf5\x02\xf7\x02\xf8\x02\xfd\x02\xfe\x02\x00\x03\x01\x03"
+    b"\x2a\x03\x2b\x03\x2d\x03\x2e\x03\x33\x03\x34\x03\x36\x03\x37\x03\x45\x03\x46\x03\x48\x03\x49\x03\x4e\x03\x4f\x03\x51\x03\x52\x03"
+    b"\xcc\x03\xcd\x03\xcf\x03\xd0\x03\xd5\x03\xd6\x03\xd8\x03\xd9\x03\xe7\x03\xe8\x03\xea\x03\xeb\x03\xf0\x03\xf1\x03\xf3\x03\xf4\x03"
+    b"\x1d\x04\x1e\x04\x20\x04\x21\x04\x26\x04\x27\x04\x29\x04\x2a\x04\x38\x04\x39\x04\x3b\x04\x3c\x04\x41\x04\x42\x04\x44\x04\x45\x04"
+    b"\x8b\x08\x8c\x08\x8e\x08\x8f\x08\x94\x08\x95\x08\x97\x08\x98\x08\xa6\x08\xa7\x08\xa9\x08\xaa\x08\xaf\x08\xb0\x08\xb2\x08\xb3\x08"
+    b"\xdc\x08\xdd\x08\xdf\x08\xe0\x08\xe5\x08\xe6\x08\xe8\x08\xe9\x08\xf7\x08\xf8\x08\xfa\x08\xfb\x08\x00\x09\x01\x09\x03\x09\x04\x09"
+    b"\x7e\x09\x7f\x09\x81\x09\x82\x09\x87\x09\x88\x09\x8a\x09\x8b\x09\x99\x09\x9a\x09\x9c\x09\x9d\x09\xa2\x09\xa3\x09\xa5\x09\xa6\x09"
+    b"\xcf\x09\xd0\x09\xd2\x09\xd3\x09\xd8\x09\xd9\x09\xdb\x09\xdc\x09\xea\x09\xeb\x09\xed\x09\xee\x09\xf3\x09\xf4\x09\xf6\x09\xf7\x09"
+    b"\x64\x0b\x65\x0b\x67\x0b\x68\x0b\x6d\x0b\x6e\x0b\x70\x0b\x71\x0b\x7f\x0b\x80\x0b\x82\x0b\x83\x0b\x88\x0b\x89\x0b\x8b\x0b\x8c\x0b"
+    b"\xb5\x0b\xb6\x0b\xb8\x0b\xb9\x0b\xbe\x0b\xbf\x0b\xc1\x0b\xc2\x0b\xd0\x0b\xd1\x0b\xd3\x0b\xd4\x0b\xd9\x0b\xda\x0b\xdc\x0b\xdd\x0b"
+    b"\x57\x0c\x58\x0c\x5a\x0c\x5b\x0c\x60\x0c\x61\x0c\x63\x0c\x64\x0c\x72\x0c\x73\x0c\x75\x0c\x76\x0c\x7b\x0c\x7c\x0c\x7e\x0c\x7f\x0c"
+    b"\xa8\x0c\xa9\x0c\xab\x0c\xac\x0c\xb1\x0c\xb2\x0c\xb4\x0c\xb5\x0c\xc3\x0c\xc4\x0c\xc6\x0c\xc7\x0c\xcc\x0c\xcd\x0c\xcf\x0c\xd0\x0c"
+    b"\xa1\x19\xa2\x19\xa4\x19\xa5\x19\xaa\x19\xab\x19\xad\x19\xae\x19\xbc\x19\xbd\x19\xbf\x19\xc0\x19\xc5\x19\xc6\x19\xc8\x19\xc9\x19"
+    b"\xf2\x19\xf3\x19\xf5\x19\xf6\x19\xfb\x19\xfc\x19\xfe\x19\xff\x19\x0d\x1a\x0e\x1a\x10\x1a\x11\x1a\x16\x1a\x17\x1a\x19\x1a\x1a\x1a"
+    b"\x94\x1a\x95\x1a\x97\x1a\x98\x1a\x9d\x1a\x9e\x1a\xa0\x1a\xa1\x1a\xaf\x1a\xb0\x1a\xb2\x1a\xb3\x1a\xb8\x1a\xb9\x1a\xbb\x1a\xbc\x1a"
+    b"\xe5\x1a\xe6\x1a\xe8\x1a\xe9\x1a\xee\x1a\xef\x1a\xf1\x1a\xf2\x1a\x00\x1b\x01\x1b\x03\x1b\x04\x1b\x09\x1b\x0a\x1b\x0c\x1b\x0d\x1b"
+    b"\x7a\x1c\x7b\x1c\x7d\x1c\x7e\x1c\x83\x1c\x84\x1c\x86\x1c\x87\x1c\x95\x1c\x96\x1c\x98\x1c\x99\x1c\x9e\x1c\x9f\x1c\xa1\x1c\xa2\x1c"
+    b"\xcb\x1c\xcc\x1c\xce\x1c\xcf\x1c\xd4\x1c\xd5\x1c\xd7\x1c\xd8\x1c\xe6\x1c\xe7\x1c\xe9\x1c\xea\x1c\xef\x1c\xf0\x1c\xf2\x1c\xf3\x1c"
+    b"\x6d\x1d\x6e\x1d\x70\x1d\x71\x1d\x76\x1d\x77\x1d\x79\x1d\x7a\x1d\x88\x1d\x89\x1d\x8b\x1d\x8c\x1d\x91\x1d\x92\x1d\x94\x1d\x95\x1d"
+    b"\xbe\x1d\xbf\x1d\xc1\x1d\xc2\x1d\xc7\x1d\xc8\x1d\xca\x1d\xcb\x1d\xd9\x1d\xda\x1d\xdc\x1d\xdd\x1d\xe2\x1d\xe3\x1d\xe5\x1d\xe6\x1d"
+    b"\x2c\x22\x2d\x22\x2f\x22\x30\x22\x35\x22\x36\x22\x38\x22\x39\x22\x47\x22\x48\x22\x4a\x22\x4b\x22\x50\x22\x51\x22\x53\x22\x54\x22"
+    b"\x7d\x22\x7e\x22\x80\x22\x81\x22\x86\x22\x87\x22\x89\x22\x8a\x22\x98\x22\x99\x22\x9b\x22\x9c\x22\xa1\x22\xa2\x22\xa4\x22\xa5\x22"
+    b"\x1f\x23\x20\x23\x22\x23\x23\x23\x28\x23\x29\x23\x2b\x23\x2c\x23\x3a\x23\x3b\x23\x3d\x23\x3e\x23\x43\x23\x44\x23\x46\x23\x47\x23"
+    b"\x70\x23\x71\x23\x73\x23\x74\x23\x79\x23\x7a\x23\x7c\x23\x7d\x23\x8b\x23\x8c\x23\x8e\x23\x8f\x23\x94\x23\x95\x23\x97\x23\x98\x23"
+    b"\x05\x25\x06\x25\x08\x25\x09\x25\x0e\x25\x0f\x25\x11\x25\x12\x25\x20\x25\x21\x25\x23\x25\x24\x25\x29\x25\x2a\x25\x2c\x25\x2d\x25"
+    b"\x56\x25\x57\x25\x59\x25\x5a\x25\x5f\x25\x60\x25\x62\x25\x63\x25\x71\x25\x72\x25\x74\x25\x75\x25\x7a\x25\x7b\x25\x7d\x25\x7e\x25"
+    b"\xf8\x25\xf9\x25\xfb\x25\xfc\x25\x01\x26\x02\x26\x04\x26\x05\x26\x13\x26\x14\x26\x16\x26\x17\x26\x1c\x26\x1d\x26\x1f\x26\x20\x26"
+    b"\x49\x26\x4a\x26\x4c\x26\x4d\x26\x52\x26\x53\x26\x55\x26\x56\x26\x64\x26\x65\x26\x67\x26\x68\x26\x6d\x26\x6e\x26\x70\x26\x71\x26"
+)
@@ -0,0 +1,178 @@
+# Bitboard tic tac toe engine shared by host.py and join.py.
+
+# Each side is stored as a 9-bit integer, bit (square - 1) set when the side
+# holds that square:
+#   1 | 2 | 3        bit 0 | bit 1 | bit 2
+#   4 | 5 | 6   ->   bit 3 | bit 4 | bit 5
+#   7 | 8 | 9        bit 6 | bit 7 | bit 8
+# Player 1 is the host (X) and player 2 is the guest (O), matching the
+# player_num convention used by both TicTacToe classes.
+#
+# Other sizes (width x height, k in a row to win) use MNKBoard, which has the
+# same interface; new_board() picks the right one.
+
+try:
+    from micropython import const
+except ImportError:
+    # Also imported by CPython tools such as gen_ai_table.py.
+    def const(x):
+        return x
+
+_FULL = const(0x1FF)
+
+# Moves and steps travel as single bytes, which caps the number of squares.
+MAX_CELLS = const(255)
+
+WIN_MASKS = (
+    0x007, 0x038, 0x1C0,  # rows
+    0x049, 0x092, 0x124,  # columns
+    0x111, 0x054,  # diagonals
+)
+
+# _WINS[bits] is 1 when the 9-bit pattern contains a complete line, so a win
+# check is a single table lookup instead of eight comparisons.
+_WINS = bytearray(_FULL + 1)
+for _bits in range(_FULL + 1):
+    for _mask in WIN_MASKS:
+        if _bits & _mask == _mask:
+            _WINS[_bits] = 1
+            break
+
+
+class Board:
+    width = 3
+    height = 3
+    k = 3
+    size = 9
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.p1 = 0
+        self.p2 = 0
+
+    def is_free(self, move):
+        return 1 <= move <= 9 and not (self.p1 | self.p2) & (1 << (move - 1))
+
+    def place(self, player_num, move):
+        if player_num == 1:
+            self.p1 |= 1 << (move - 1)
+        else:
+            self.p2 |= 1 << (move - 1)
+
+    def is_winner(self, player_num):
+        return _WINS[self.p1 if player_num == 1 else self.p2] == 1
+
+    def is_full(self):
+        return self.p1 | self.p2 == _FULL
+
+    def owner(self, i):
+        # 1 or 2 if that player holds square index i (0-8), else 0.
+        bit = 1 << i
+        if self.p1 & bit:
+            return 1
+        if self.p2 & bit:
+            return 2
+        return 0
+
+    def cell(self, i):
+        # Printable contents of square index i (0-8).
+        return _CELL_NAMES[self.owner(i)] or str(i + 1)
+
+
+_CELL_NAMES = (None, "X", "O")
+
+# Index step for each line direction: right, down, down-right and up-right,
+# given as (dx, dy).
+_DIRECTIONS = ((1, 0), (0, 1), (1, 1), (1, -1))
+
+
+def valid_rules(width, height, k):
+    return 1 <= width and 1 <= height and width * height <= MAX_CELLS and 2 <= k <= max(width, height)
+
+
+def new_board(width=3, height=3, k=3):
+    if width == 3 and height == 3 and k == 3:
+        return Board()
+    return MNKBoard(width, height, k)
+
+
+# A width x height board where k in a row wins. Squares are numbered row by
+# row from 1, as on the 3x3 board.
+#
+# Wins are found incrementally: for each direction, the two end squares of
+# every run of one player's stones hold that run's length. A new stone joins
+# the runs ending next to it on either side, so placing one is four lookups
+# and four pairs of writes however big the board is, and nothing is
+# rescanned.
+class MNKBoard:
+    def __init__(self, width, height, k):
+        if not valid_rules(width, height, k):
+            raise ValueError("bad board size")
+        self.width = width
+        self.height = height
+        self.k = k
+        self.size = width * height
+        self._owner = bytearray(self.size)
+        self._runs = [bytearray(self.size) for _ in _DIRECTIONS]
+        self.clear()
+
+    def clear(self):
+        for i in range(self.size):
+            self._owner[i] = 0
+        self._placed = 0
+        self._winner = 0
+
+    def is_free(self, move):
+        return 1 <= move <= self.size and not self._owner[move - 1]
+
+    # Lengths of player_num's runs ending next to square index i in
+    # direction d, before and after it.
+    def _neighbours(self, player_num, i, d):
+        dx, dy = _DIRECTIONS[d]
+        step = dy * self.width + dx
+        x = i % self.width
+        y = i // self.width
+        runs = self._runs[d]
+        before = after = 0
+        if 0 <= x - dx < self.width and 0 <= y - dy < self.height and self._owner[i - step] == player_num:
+            before = runs[i - step]
+        if 0 <= x + dx < self.width and 0 <= y + dy < self.height and self._owner[i + step] == player_num:
+            after = runs[i + step]
+        return before, after, step
+
+    def place(self, player_num, move):
+        i = move - 1
+        self._owner[i] = player_num
+        self._placed += 1
+        for d in range(len(_DIRECTIONS)):
+            before, after, step = self._neighbours(player_num, i, d)
+            total = min(before + 1 + after, 255)
+            runs = self._runs[d]
+            runs[i - before * step] = total
+            runs[i + after * step] = total
+            runs[i] = total
+            if total >= self.k and not self._winner:
+                self._winner = player_num
+
+    # Longest line player_num would have through move if they took it.
+    def run_through(self, player_num, move):
+        best = 0
+        for d in range(len(_DIRECTIONS)):
+            before, after, _ = self._neighbours(player_num, move - 1, d)
+            if before + 1 + after > best:
+                best = before + 1 + after
+        return best
+
+    def is_winner(self, player_num):
+        return self._winner == player_num
+
+    def is_full(self):
+        return self._placed == self.size
+
+    def owner(self, i):
+        return self._owner[i]
+
+    def cell(self, i):
+        return _CELL_NAMES[self._owner[i]] or str(i + 1)
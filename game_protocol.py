@@ -0,0 +1,394 @@
+# Wire format for the game-state, snapshot and rules characteristics.
+
+# Frames are fixed-size and little-endian:
+#   offset 0: version (VERSION)
+#   offset 1: flags
+#   offset 2: sequence number (uint16)
+#   offset 4: starts (0 = host, 1 = guest)
+#   offset 5: step
+#   offset 6: last move (1 to the number of squares, 0 for none)
+#   offset 7: ack, the low byte of the last sequence number received from
+#             the other side (only meaningful with FLAG_ACK set)
+#
+# The snapshot characteristic holds the whole game: the same eight bytes with
+# FLAG_SNAPSHOT set, followed by uint16s for
+#   offset 8:  host's board (9-bit mask)
+#   offset 10: guest's board
+#   offset 12: host wins
+#   offset 14: guest wins
+#   offset 16: draws
+# so a guest that missed a notification, or rejoins mid-session, can rebuild
+# everything from a single read. At 18 bytes it fits one ATT read or
+# notification even at the default MTU.
+#
+# Other board sizes (see game_engine.MNKBoard) don't fit two 16-bit
+# masks, so their snapshots set FLAG_CELLS as well and carry
+#   offset 8:  host wins
+#   offset 10: guest wins
+#   offset 12: draws
+#   offset 14: width, height, k (one byte each)
+#   offset 17: the squares, 2 bits each (0 empty, 1 host, 2 guest), four to
+#              a byte starting from the low bits
+# which for the largest board (255 squares) is MAX_SNAPSHOT_SIZE bytes. The
+# host updates the squares in place as moves are made; see set_cell().
+#
+# The rules characteristic holds the board size the host is playing, as
+# RULES_SIZE bytes: version, width, height, k. A guest writes its own to ask
+# for a different game; the host notifies the new rules when it agrees.
+#
+# Beacons let spectators follow a game without connecting (see
+# spectator.py). The host puts one in the manufacturer-specific field of its
+# scan response, so it must fit in BEACON_SIZE bytes:
+#   offset 0:  version
+#   offset 1:  game, the low byte of the guest's connection handle; a change
+#              means the host switched to another of its games
+#   offset 2:  low byte of the sequence number
+#   offset 3:  starts
+#   offset 4:  step
+#   offset 5:  last move
+#   offset 6:  width, height, k
+#   offset 9:  host wins, guest wins, draws (low bytes)
+#   offset 12: the squares, packed as in a FLAG_CELLS snapshot
+# Boards with more than BEACON_MAX_CELLS squares don't fit, so their beacons
+# carry the last BEACON_HISTORY moves there instead, newest first (0 before
+# the first move), and spectators follow them move by move.
+#
+# Sequence numbers count state changes per sender and wrap at 16 bits; use
+# seq_diff() to compare them. The host acks the guest's writes in its frames
+# so a guest sending moves without a response can tell when to retransmit.
+#
+# Older firmware sent str(starts) + str(step) + str(move) as three ASCII
+# digits. Those frames are still recognised by length and decoded into the
+# same fields so mixed pairs keep working during the transition.
+
+from micropython import const
+import struct
+
+VERSION = const(1)
+FRAME_SIZE = const(8)
+SNAPSHOT_SIZE = const(18)
+RULES_SIZE = const(4)
+
+FLAG_SNAPSHOT = const(0x01)
+FLAG_ACK = const(0x02)
+FLAG_CELLS = const(0x04)
+
+_FRAME_FORMAT = "<BBHBBBB"
+_SNAPSHOT_FORMAT = "<BBHBBBBHHHHH"
+_CELLS_FORMAT = "<BBHBBBBHHHBBB"
+_CELLS_AT = const(17)
+MAX_SNAPSHOT_SIZE = const(81)
+_BEACON_CELLS_AT = const(12)
+BEACON_SIZE = const(23)
+BEACON_MAX_CELLS = const(44)
+BEACON_HISTORY = const(11)
+_LEGACY_SIZE = const(3)
+_ASCII_ZERO = const(0x30)
+
+
+class Frame:
+    __slots__ = (
+        "version",
+        "flags",
+        "seq",
+        "starts",
+        "step",
+        "move",
+        "ack",
+        "p1",
+        "p2",
+        "p1_wins",
+        "p2_wins",
+        "draws",
+        "width",
+        "height",
+        "k",
+        "game",
+    )
+
+    def __init__(self):
+        self.version = 0
+        self.flags = 0
+        self.seq = 0
+        self.starts = 0
+        self.step = 0
+        self.move = 0
+        self.ack = 0
+        # Only set by snapshots.
+        self.p1 = 0
+        self.p2 = 0
+        self.p1_wins = 0
+        self.p2_wins = 0
+        self.draws = 0
+        # Set by snapshots and rules frames. A FLAG_CELLS snapshot's squares
+        # are read from its buffer with cell().
+        self.width = 3
+        self.height = 3
+        self.k = 3
+        # Only set by beacons.
+        self.game = 0
+
+
+def new_buffer():
+    return bytearray(FRAME_SIZE)
+
+
+def new_snapshot_buffer(width=3, height=3, k=3):
+    return bytearray(snapshot_size(width, height, k))
+
+
+def new_rules_buffer():
+    return bytearray(RULES_SIZE)
+
+
+def snapshot_size(width, height, k):
+    if width == 3 and height == 3 and k == 3:
+        return SNAPSHOT_SIZE
+    return _CELLS_AT + (width * height + 3) // 4
+
+
+# ack is the peer's last sequence number, or -1 for none.
+def encode(buf, starts, step, move, seq=0, flags=0, ack=-1):
+    if ack >= 0:
+        flags |= FLAG_ACK
+    struct.pack_into(_FRAME_FORMAT, buf, 0, VERSION, flags, seq & 0xFFFF, starts, step, move, ack & 0xFF)
+    return buf
+
+
+def encode_snapshot(buf, starts, step, move, seq, p1, p2, p1_wins, p2_wins, draws, ack=-1):
+    flags = FLAG_SNAPSHOT
+    if ack >= 0:
+        flags |= FLAG_ACK
+    struct.pack_into(
+        _SNAPSHOT_FORMAT,
+        buf,
+        0,
+        VERSION,
+        flags,
+        seq & 0xFFFF,
+        starts,
+        step,
+        move,
+        ack & 0xFF,
+        p1,
+        p2,
+        p1_wins & 0xFFFF,
+        p2_wins & 0xFFFF,
+        draws & 0xFFFF,
+    )
+    return buf
+
+
+# Snapshot header for a FLAG_CELLS snapshot. The squares that follow are left
+# alone: they are kept up to date with set_cell() and cleared with
+# clear_cells().
+def encode_cells_snapshot(buf, starts, step, move, seq, width, height, k, p1_wins, p2_wins, draws, ack=-1):
+    flags = FLAG_SNAPSHOT | FLAG_CELLS
+    if ack >= 0:
+        flags |= FLAG_ACK
+    struct.pack_into(
+        _CELLS_FORMAT,
+        buf,
+        0,
+        VERSION,
+        flags,
+        seq & 0xFFFF,
+        starts,
+        step,
+        move,
+        ack & 0xFF,
+        p1_wins & 0xFFFF,
+        p2_wins & 0xFFFF,
+        draws & 0xFFFF,
+        width,
+        height,
+        k,
+    )
+    return buf
+
+
+def set_cell(buf, i, owner):
+    at = _CELLS_AT + (i >> 2)
+    shift = 2 * (i & 3)
+    buf[at] = (buf[at] & (0xFF ^ (3 << shift))) | (owner << shift)
+
+
+def cell(data, i):
+    return (data[_CELLS_AT + (i >> 2)] >> (2 * (i & 3))) & 3
+
+
+def clear_cells(buf):
+    for i in range(_CELLS_AT, len(buf)):
+        buf[i] = 0
+
+
+def encode_rules(buf, width, height, k):
+    buf[0] = VERSION
+    buf[1] = width
+    buf[2] = height
+    buf[3] = k
+    return buf
+
+
+def decode_rules(data, frame, n=-1):
+    if n < 0:
+        n = len(data)
+    if n != RULES_SIZE or data[0] != VERSION:
+        return False
+    frame.width = data[1]
+    frame.height = data[2]
+    frame.k = data[3]
+    return True
+
+
+def beacon_size(width, height):
+    if width * height > BEACON_MAX_CELLS:
+        return BEACON_SIZE
+    return _BEACON_CELLS_AT + (width * height + 3) // 4
+
+
+# Write a beacon for board (a game_engine board) into buf at offset at and
+# return its length. recent holds the latest moves, newest first, for boards
+# too big to send whole.
+def encode_beacon(buf, at, game, seq, starts, step, move, width, height, k, p1_wins, p2_wins, draws, board, recent):
+    buf[at] = VERSION
+    buf[at + 1] = game & 0xFF
+    buf[at + 2] = seq & 0xFF
+    buf[at + 3] = starts
+    buf[at + 4] = step
+    buf[at + 5] = move
+    buf[at + 6] = width
+    buf[at + 7] = height
+    buf[at + 8] = k
+    buf[at + 9] = p1_wins & 0xFF
+    buf[at + 10] = p2_wins & 0xFF
+    buf[at + 11] = draws & 0xFF
+    n = beacon_size(width, height)
+    if width * height > BEACON_MAX_CELLS:
+        for i in range(BEACON_HISTORY):
+            buf[at + _BEACON_CELLS_AT + i] = recent[i]
+    else:
+        cells = at + _BEACON_CELLS_AT
+        for i in range(cells, at + n):
+            buf[i] = 0
+        for i in range(width * height):
+            owner = board.owner(i)
+            if owner:
+                buf[cells + (i >> 2)] |= owner << (2 * (i & 3))
+    return n
+
+
+# Fill frame from the beacon in data[start:end], allocation-free. Returns
+# False if it isn't one. Read its squares with beacon_cell().
+def decode_beacon(data, frame, start, end):
+    n = end - start
+    if n < _BEACON_CELLS_AT or data[start] != VERSION:
+        return False
+    width = data[start + 6]
+    height = data[start + 7]
+    if n != beacon_size(width, height):
+        return False
+    frame.version = VERSION
+    frame.flags = 0
+    frame.game = data[start + 1]
+    frame.seq = data[start + 2]
+    frame.starts = data[start + 3]
+    frame.step = data[start + 4]
+    frame.move = data[start + 5]
+    frame.width = width
+    frame.height = height
+    frame.k = data[start + 8]
+    frame.p1_wins = data[start + 9]
+    frame.p2_wins = data[start + 10]
+    frame.draws = data[start + 11]
+    return True
+
+
+# Whether beacons for this board carry its squares.
+def beacon_has_cells(width, height):
+    return width * height <= BEACON_MAX_CELLS
+
+
+def beacon_cell(data, start, i):
+    return (data[start + _BEACON_CELLS_AT + (i >> 2)] >> (2 * (i & 3))) & 3
+
+
+# The move made `back` moves before the beacon's latest (0 for the latest),
+# for boards without cells. back must be under BEACON_HISTORY.
+def beacon_move(data, start, back):
+    return data[start + _BEACON_CELLS_AT + back]
+
+
+# Push move onto recent, a BEACON_HISTORY-byte history for encode_beacon().
+def add_recent(recent, move):
+    for i in range(BEACON_HISTORY - 1, 0, -1):
+        recent[i] = recent[i - 1]
+    recent[0] = move
+
+
+# Update the ack of an already encoded frame or snapshot in place.
+def set_ack(buf, ack):
+    buf[1] |= FLAG_ACK
+    buf[7] = ack & 0xFF
+
+
+# Signed distance from sequence number b to a: positive if a is newer.
+def seq_diff(a, b):
+    d = (a - b) & 0xFFFF
+    return d - 0x10000 if d & 0x8000 else d
+
+
+# Fill frame from data (bytes, bytearray or memoryview) by indexing straight
+# into the buffer, so no intermediate objects are created. Pass n when only
+# the first n bytes of a larger buffer are valid. Returns False if data is not
+# a frame we understand.
+def decode(data, frame, n=-1):
+    if n < 0:
+        n = len(data)
+    if n >= FRAME_SIZE and data[0] == VERSION:
+        flags = data[1]
+        if flags & FLAG_CELLS:
+            if n < _CELLS_AT or not flags & FLAG_SNAPSHOT or n != _CELLS_AT + (data[14] * data[15] + 3) // 4:
+                return False
+        elif n == SNAPSHOT_SIZE:
+            if not flags & FLAG_SNAPSHOT:
+                return False
+        elif n != FRAME_SIZE or flags & FLAG_SNAPSHOT:
+            return False
+        frame.version = VERSION
+        frame.flags = flags
+        frame.seq = data[2] | (data[3] << 8)
+        frame.starts = data[4]
+        frame.step = data[5]
+        frame.move = data[6]
+        frame.ack = data[7]
+        if flags & FLAG_CELLS:
+            frame.p1_wins = data[8] | (data[9] << 8)
+            frame.p2_wins = data[10] | (data[11] << 8)
+            frame.draws = data[12] | (data[13] << 8)
+            frame.width = data[14]
+            frame.height = data[15]
+            frame.k = data[16]
+        elif flags & FLAG_SNAPSHOT:
+            frame.p1 = data[8] | (data[9] << 8)
+            frame.p2 = data[10] | (data[11] << 8)
+            frame.p1_wins = data[12] | (data[13] << 8)
+            frame.p2_wins = data[14] | (data[15] << 8)
+            frame.draws = data[16] | (data[17] << 8)
+            frame.width = 3
+            frame.height = 3
+            frame.k = 3
+        return True
+    if n == _LEGACY_SIZE:
+        starts = data[0] - _ASCII_ZERO
+        step = data[1] - _ASCII_ZERO
+        move = data[2] - _ASCII_ZERO
+        if 0 <= starts <= 9 and 0 <= step <= 9 and 0 <= move <= 9:
+            frame.version = 0
+            frame.flags = 0
+            frame.seq = 0
+            frame.starts = starts
+            frame.step = step
+            frame.move = move
+            return True
+    return False
@@ -0,0 +1,115 @@
+# Compact record of one game, and an append-only file of them.
+
+# Each game is a fixed 6-byte record:
+#   byte 0, bits 0-3: number of moves (0-9; SPOILED if we lost track)
+#   byte 0, bit 4:    who started (0 = host, 1 = guest)
+#   byte 0, bits 5-6: result (HOST_WON, GUEST_WON or DRAW)
+#   bytes 1-5:        moves 1-9 as nibbles in play order, low nibble first
+#
+# The host is always X and the guest O, so the record reads the same on
+# either device. Fixed-size records let analysis tools map a file straight
+# into an array; see analyze_games.py.
+
+from micropython import const
+import os
+
+RECORD_SIZE = const(6)
+
+HOST_WON = const(0)
+GUEST_WON = const(1)
+DRAW = const(2)
+
+SPOILED = const(0x0F)
+
+_MAX_MOVES = const(9)
+
+
+def new_record():
+    return bytearray(RECORD_SIZE)
+
+
+def begin(rec, starts):
+    for i in range(RECORD_SIZE):
+        rec[i] = 0
+    rec[0] = (starts & 1) << 4
+
+
+def add_move(rec, move):
+    n = rec[0] & 0x0F
+    if n >= _MAX_MOVES:
+        return
+    i = 1 + (n >> 1)
+    if n & 1:
+        rec[i] |= move << 4
+    else:
+        rec[i] |= move
+    rec[0] += 1
+
+
+def finish(rec, result):
+    rec[0] = (rec[0] & 0x1F) | (result << 5)
+
+
+# Mark a game whose moves we didn't all see, e.g. after a resync.
+def spoil(rec):
+    rec[0] |= SPOILED
+
+
+def is_complete(rec):
+    return (rec[0] & 0x0F) != SPOILED
+
+
+# (starts, result, moves) for a record; for tests and debugging.
+def decode(rec):
+    n = rec[0] & 0x0F
+    moves = [(rec[1 + (k >> 1)] >> (4 * (k & 1))) & 0x0F for k in range(min(n, _MAX_MOVES))]
+    return ((rec[0] >> 4) & 1, (rec[0] >> 5) & 3, moves)
+
+
+# Finished games, appended to a file in batches to spare the flash. When the
+# file reaches max_bytes it is renamed to path + ".old" (replacing any
+# previous one) and a new file is started.
+class GameLog:
+    def __init__(self, path="games.bin", batch=32, max_bytes=65536):
+        self._path = path
+        self._batch = batch
+        self._max_bytes = max_bytes
+        self._pending = bytearray(batch * RECORD_SIZE)
+        self._n_pending = 0
+        self._size = -1
+        self.games = 0
+
+    def append(self, rec):
+        if not is_complete(rec):
+            return
+        base = self._n_pending * RECORD_SIZE
+        for i in range(RECORD_SIZE):
+            self._pending[base + i] = rec[i]
+        self._n_pending += 1
+        self.games += 1
+        if self._n_pending == self._batch:
+            self.flush()
+
+    def flush(self):
+        if not self._n_pending:
+            return
+        if self._size < 0:
+            try:
+                self._size = os.stat(self._path)[6]
+            except OSError:
+                self._size = 0
+        n = self._n_pending * RECORD_SIZE
+        if self._size + n > self._max_bytes:
+            try:
+                os.remove(self._path + ".old")
+            except OSError:
+                pass
+            try:
+                os.rename(self._path, self._path + ".old")
+            except OSError:
+                pass
+            self._size = 0
+        with open(self._path, "ab") as f:
+            f.write(memoryview(self._pending)[:n])
+        self._size += n
+        self._n_pending = 0
@@ -0,0 +1,172 @@
+# Resolved GATT handles per host, so a reconnect can skip discovery.
+
+# A host's attribute handles only change when its service layout does, and
+# hosts advertise a layout version (see host._LAYOUT_VERSION). Each entry
+# keeps a host's address, the layout version the handles were found under,
+# the game service's handle range and the value handles of the game state,
+# snapshot and rules characteristics (0 for one the host doesn't have). A
+# lookup only hits if the version still matches, so a host with new
+# firmware is rediscovered.
+#
+# Entries live in fixed tables; when full, the least recently used goes.
+# With a path the cache is also saved to flash, rewritten only when an
+# entry is added, changed or dropped, so it survives a reboot of the guest:
+#   header:  b"gh", version, count
+#   entries: address (6 bytes), layout, start, end, game state, snapshot,
+#            rules (uint16 each)
+
+from array import array
+from micropython import const
+import struct
+
+_VERSION = const(1)
+_ADDR_SIZE = const(6)
+_HANDLES = const(5)
+_MAGIC = b"gh"
+_HEADER_FORMAT = "<2sBB"
+_HEADER_SIZE = const(4)
+_ENTRY_FORMAT = "<6sBHHHHH"
+_ENTRY_SIZE = const(17)
+
+START = const(0)
+END = const(1)
+GAME_STATE = const(2)
+SNAPSHOT = const(3)
+RULES = const(4)
+
+
+class HandleCache:
+    def __init__(self, capacity=4, path=None):
+        self.capacity = capacity
+        self._path = path
+        self._addrs = bytearray(capacity * _ADDR_SIZE)
+        self._layouts = bytearray(capacity)
+        self._used = bytearray(capacity)
+        # Handles for entry e live at _HANDLES * e + START etc.
+        self._handles = array("H", bytes(2 * _HANDLES * capacity))
+        # Last-use stamps for eviction.
+        self._stamps = array("H", bytes(2 * capacity))
+        self._clock = 0
+        self.hits = 0
+        self.misses = 0
+        # Read on first use, once we've found a host, not at boot.
+        self._loaded = path is None
+
+    def _find(self, addr):
+        if not self._loaded:
+            self._load()
+        for e in range(self.capacity):
+            if self._used[e]:
+                base = e * _ADDR_SIZE
+                j = 0
+                while j < _ADDR_SIZE and self._addrs[base + j] == addr[j]:
+                    j += 1
+                if j == _ADDR_SIZE:
+                    return e
+        return -1
+
+    def _touch(self, e):
+        self._clock = (self._clock + 1) & 0xFFFF
+        self._stamps[e] = self._clock
+
+    # Entry index for addr under layout, or -1. Read the handles with
+    # handle(e, GAME_STATE) etc.
+    def lookup(self, addr, layout):
+        e = self._find(addr)
+        if e < 0 or self._layouts[e] != layout:
+            self.misses += 1
+            return -1
+        self.hits += 1
+        self._touch(e)
+        return e
+
+    def handle(self, e, which):
+        return self._handles[_HANDLES * e + which]
+
+    def store(self, addr, layout, start, end, game_state, snapshot, rules):
+        e = self._find(addr)
+        if e < 0:
+            e = 0
+            for k in range(self.capacity):
+                if not self._used[k]:
+                    e = k
+                    break
+                if _age(self._clock, self._stamps[k]) > _age(self._clock, self._stamps[e]):
+                    e = k
+        base = e * _ADDR_SIZE
+        for j in range(_ADDR_SIZE):
+            self._addrs[base + j] = addr[j]
+        self._used[e] = 1
+        self._layouts[e] = layout
+        h = _HANDLES * e
+        self._handles[h + START] = start
+        self._handles[h + END] = end
+        self._handles[h + GAME_STATE] = game_state
+        self._handles[h + SNAPSHOT] = snapshot or 0
+        self._handles[h + RULES] = rules or 0
+        self._touch(e)
+        self._save()
+
+    # Drop addr's entry, e.g. when its handles turned out to be stale.
+    def forget(self, addr):
+        e = self._find(addr)
+        if e >= 0:
+            self._used[e] = 0
+            self._save()
+
+    def _load(self):
+        self._loaded = True
+        try:
+            with open(self._path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return
+        if len(data) < _HEADER_SIZE:
+            return
+        magic, version, count = struct.unpack_from(_HEADER_FORMAT, data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            return
+        count = min(count, self.capacity, (len(data) - _HEADER_SIZE) // _ENTRY_SIZE)
+        for e in range(count):
+            addr, layout, start, end, game_state, snapshot, rules = struct.unpack_from(
+                _ENTRY_FORMAT, data, _HEADER_SIZE + e * _ENTRY_SIZE
+            )
+            self._addrs[e * _ADDR_SIZE : (e + 1) * _ADDR_SIZE] = addr
+            self._layouts[e] = layout
+            self._used[e] = 1
+            h = _HANDLES * e
+            self._handles[h + START] = start
+            self._handles[h + END] = end
+            self._handles[h + GAME_STATE] = game_state
+            self._handles[h + SNAPSHOT] = snapshot
+            self._handles[h + RULES] = rules
+            self._touch(e)
+
+    def _save(self):
+        if self._path is None:
+            return
+        # A write cut short by a reset only loses the entries past the cut;
+        # _load() trusts the file's length over its count.
+        with open(self._path, "wb") as f:
+            f.write(struct.pack(_HEADER_FORMAT, _MAGIC, _VERSION, sum(self._used)))
+            for e in range(self.capacity):
+                if self._used[e]:
+                    base = e * _ADDR_SIZE
+                    h = _HANDLES * e
+                    f.write(
+                        struct.pack(
+                            _ENTRY_FORMAT,
+                            bytes(self._addrs[base : base + _ADDR_SIZE]),
+                            self._layouts[e],
+                            self._handles[h + START],
+                            self._handles[h + END],
+                            self._handles[h + GAME_STATE],
+                            self._handles[h + SNAPSHOT],
+                            self._handles[h + RULES],
+                        )
+                    )
+
+
+# How long ago stamp was, on the 16-bit use clock.
+def _age(clock, stamp):
+    return (clock - stamp) & 0xFFFF
@@ -0,0 +1,103 @@
+# Generate game_ai_table.py, the perfect-play move table used by game_ai.
+#
+# Run under CPython: python3 gen_ai_table.py
+#
+# Positions are indexed from the point of view of the side to move: square i
+# contributes 3**i if it is ours and 2 * 3**i if it is the opponent's. Each
+# entry is the best square (1-9) to take, or 0 if the game is already over.
+# Two entries are packed per byte, low nibble first.
+
+from game_engine import WIN_MASKS
+
+_POSITIONS = 3 ** 9
+
+
+def _won(bits):
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+
+def _unpack(index):
+    mine = theirs = 0
+    for i in range(9):
+        index, cell = divmod(index, 3)
+        if cell == 1:
+            mine |= 1 << i
+        elif cell == 2:
+            theirs |= 1 << i
+    return mine, theirs
+
+
+_scores = {}
+
+
+# Score from the point of view of the side to move: positive wins, negative
+# loses, with faster wins and slower losses preferred.
+def _score(mine, theirs):
+    key = (mine, theirs)
+    if key in _scores:
+        return _scores[key]
+    if _won(theirs):
+        result = -10 - (9 - bin(mine | theirs).count("1"))
+    elif mine | theirs == 0x1FF:
+        result = 0
+    else:
+        result = max(-_score(theirs, mine | (1 << i)) for i in range(9) if not (mine | theirs) & (1 << i))
+    _scores[key] = result
+    return result
+
+
+def best_move(mine, theirs):
+    if _won(mine) or _won(theirs) or mine | theirs == 0x1FF:
+        return 0
+    best = None
+    best_score = None
+    for i in range(9):
+        if (mine | theirs) & (1 << i):
+            continue
+        score = -_score(theirs, mine | (1 << i))
+        if best_score is None or score > best_score:
+            best, best_score = i + 1, score
+    return best
+
+
+def build():
+    table = bytearray((_POSITIONS + 1) // 2)
+    for index in range(_POSITIONS):
+        move = best_move(*_unpack(index))
+        table[index >> 1] |= move << (4 * (index & 1))
+    return bytes(table)
+
+
+# WEIGHT[bits] is the base-3 weight of a 9-bit board, the sum of 3**i over
+# its set bits, as little-endian uint16s.
+def build_weights():
+    weights = bytearray(2 * 512)
+    for bits in range(512):
+        w = sum(3 ** i for i in range(9) if bits & (1 << i))
+        weights[2 * bits] = w & 0xFF
+        weights[2 * bits + 1] = w >> 8
+    return bytes(weights)
+
+
+def _write_bytes(f, name, data):
+    f.write(name + " = (\n")
+    for i in range(0, len(data), 32):
+        f.write("    b\"" + "".join("\\x%02x" % b for b in data[i : i + 32]) + "\"\n")
+    f.write(")\n")
+
+
+def main(path="game_ai_table.py"):
+    table = build()
+    with open(path, "w") as f:
+        f.write("# Generated by gen_ai_table.py; do not edit.\n")
+        f.write("# Perfect-play move table, see game_ai for the layout.\n\n")
+        _write_bytes(f, "TABLE", table)
+        f.write("\n")
+        _write_bytes(f, "WEIGHT", build_weights())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,35 @@
-
-
-import asyncio
+# Only what it takes to start advertising is imported here. asyncio, random,
+# uselect and game_ai are imported where they're used, after we're
+# discoverable; see start().
 import bluetooth
-import random
 import struct
 import time
-import uselect
 import sys
-from ble_advertising import advertising_payload
+from alloc_meter import AllocMeter
+from ble_advertising import MANUFACTURER_TEST, advertising_payload
+from board_render import BoardRenderer
+from duty_cycle import DutyCycle
+import duty_cycle
+from event_queue import EventQueue
+from game_engine import new_board, valid_rules
+import game_protocol
+import game_record
+import stage_trace
+import stats_log
 
 from micropython import const
 
+# When our imports were done, for the boot profile.
+_IMPORTED_US = time.ticks_us()
+
 _IRQ_CENTRAL_CONNECT = const(1)
 _IRQ_CENTRAL_DISCONNECT = const(2)
 _IRQ_GATTS_WRITE = const(3)
+_IRQ_GATTS_READ_REQUEST = const(4)
 _IRQ_GATTS_INDICATE_DONE = const(20)
 
 _FLAG_READ = const(0x0002)
+_FLAG_WRITE_NO_RESPONSE = const(0x0004)
 _FLAG_WRITE = const(0x0008)
 _FLAG_NOTIFY = const(0x0010)
 _FLAG_INDICATE = const(0x0020)
@@ -25,6 +38,22 @@ _GAME_UUID = bluetooth.UUID("d314caba614b43c3a05fec9a48d85750")
 
 _GAME_STATE_CHAR = (
     bluetooth.UUID("a3d11e79-dfe4-461a-83c1-da99f708018d"),
+    _FLAG_READ | _FLAG_WRITE | _FLAG_WRITE_NO_RESPONSE | _FLAG_NOTIFY,
+)
+
+# Copy of the whole game (boards, turn and scores), see game_protocol.
+# Guests write anything to it to have their own game's snapshot notified
+# back, which resyncs in one round trip. Reading it only gives the guest's
+# own game on ports that raise read requests (see _irq).
+_SNAPSHOT_CHAR = (
+    bluetooth.UUID("5f0a8b0e-3c8e-4b6e-9a57-2d4f0b9e6c11"),
+    _FLAG_READ | _FLAG_WRITE | _FLAG_NOTIFY,
+)
+
+# The board size and win length (see game_protocol). Guests write it to ask
+# for a different game and we notify it when the rules change.
+_RULES_CHAR = (
+    bluetooth.UUID("5f0a8b0e-3c8e-4b6e-9a57-2d4f0b9e6c12"),
     _FLAG_READ | _FLAG_WRITE | _FLAG_NOTIFY,
 )
 
@@ -35,269 +64,805 @@ _P2_MOVE_CHAR = (
 
 _GAME_SERVICE = (
     _GAME_UUID,
-    (_GAME_STATE_CHAR,),
+    (_GAME_STATE_CHAR, _SNAPSHOT_CHAR, _RULES_CHAR),
 )
 
 
+_ADV_TYPE_APPEARANCE = const(0x19)
+_ADV_TYPE_MANUFACTURER = const(0xFF)
 _ADV_APPEARANCE_GENERIC_GAMING = const(0x0A80)
 
+# Advertised so guests can cache our attribute handles (see gatt_cache).
+# Bump it whenever _GAME_SERVICE changes, or guests will use stale handles.
+# Version 2 answers snapshot requests, so guests only send them from 2 on.
+_LAYOUT_VERSION = const(2)
+
+# The scan response is the appearance (4 bytes), then a manufacturer-specific
+# field holding a game_protocol beacon for spectators.
+_RESP_SIZE = const(31)
+_BEACON_AT = const(8)
+
+
+# BLE controllers cap the number of simultaneous links; the Pico W's default
+# build allows a handful, so stop advertising once this many guests are in.
+_MAX_CONNECTIONS = const(4)
+
+_EVENT_QUEUE_SIZE = const(16)
+
+# Our lifetime stats result for each game_record result.
+_STATS_RESULT = (stats_log.WIN, stats_log.LOSS, stats_log.DRAW)
+_ADDR_SIZE = const(6)
+
+# Offered when a guest exchanges MTU. The default of 23 already fits a 3x3
+# snapshot, so nothing breaks if a guest never asks; snapshots of bigger
+# boards need up to game_protocol.MAX_SNAPSHOT_SIZE.
+_MTU = const(96)
+
+_STANDARD_RULES = (3, 3, 3)
+
+
+# One game per connected guest, keyed by conn_handle in TicTacToe._sessions.
+# Sessions come from a pool made at startup (see TicTacToe._pool) and are
+# reused for later guests, buffers and all.
+class Session:
+    __slots__ = (
+        "conn_handle",
+        "addr",
+        "tx",
+        "rules_buf",
+        "rules",
+        "board",
+        "cells",
+        "snap",
+        "seq",
+        "sent_seq",
+        "rx_seq",
+        "starts",
+        "step",
+        "move",
+        "p1_wins",
+        "p2_wins",
+        "draws",
+        "input_waiting",
+        "rec",
+        "recent",
+    )
+
+    def __init__(self, conn_handle, addr=None, rules=_STANDARD_RULES):
+        self.tx = game_protocol.new_buffer()
+        self.rules_buf = game_protocol.new_rules_buffer()
+        self.rec = game_record.new_record()
+        # Latest moves, newest first, for spectator beacons.
+        self.recent = bytearray(game_protocol.BEACON_HISTORY)
+        self.rules = None
+        self.reuse(conn_handle, addr, rules)
+
+    # Start afresh for a new guest. The board is only replaced if the rules
+    # differ; the caller resets it before the first game.
+    def reuse(self, conn_handle, addr, rules):
+        self.conn_handle = conn_handle
+        self.addr = addr
+        if rules != self.rules:
+            self.set_rules(*rules)
+        self.seq = 0
+        # Last seq notified to the guest, and last seq received from it.
+        self.sent_seq = -1
+        self.rx_seq = -1
+        self.starts = 0
+        self.step = 0
+        self.move = 0
+        self.p1_wins = 0
+        self.p2_wins = 0
+        self.draws = 0
+        self.input_waiting = False
+
+    def is_our_turn(self):
+        return (self.starts + self.step) % 2 == 0
+
+    # Switch to a width x height board with k in a row to win. Allocates, so
+    # only done when the rules change.
+    def set_rules(self, width, height, k):
+        self.rules = (width, height, k)
+        self.board = new_board(width, height, k)
+        # Any board but 3x3 has a FLAG_CELLS snapshot.
+        self.cells = self.rules != _STANDARD_RULES
+        # What a snapshot request (or read) of this game returns.
+        self.snap = game_protocol.new_snapshot_buffer(width, height, k)
+        game_protocol.encode_rules(self.rules_buf, width, height, k)
+
 
 class TicTacToe:
-    def __init__(self, ble):
+    # stats is an optional stats_log.StatsLog for lifetime results per guest,
+    # and games an optional game_record.GameLog to record every game in.
+    # rules is (width, height, k) for new guests' games; a guest may ask for
+    # other rules. profile_boot=True prints how long startup took once the
+    # first guest connects.
+    def __init__(
+        self,
+        ble,
+        max_connections=_MAX_CONNECTIONS,
+        ansi=False,
+        stats=None,
+        games=None,
+        rules=_STANDARD_RULES,
+        profile_boot=False,
+    ):
+        if not valid_rules(*rules):
+            raise ValueError("bad rules")
         self._ble = ble
+        self._stats = stats
+        self._games = games
+        self._rules = rules
+        # Time from reset to each startup milestone; see stage_trace.
+        self.boot = stage_trace.BootTimes()
+        self.boot.mark(stage_trace.IMPORTED, _IMPORTED_US)
+        self._profile_boot = profile_boot
         self._ble.active(True)
+        self._ble.config(mtu=_MTU)
         self._ble.irq(self._irq)
-        ((self._handle_game_state,),) = self._ble.gatts_register_services((_GAME_SERVICE,))
-        self._connections = set()
+        ((self._handle_game_state, self._handle_snapshot, self._handle_rules),) = self._ble.gatts_register_services(
+            (_GAME_SERVICE,)
+        )
+        self._ble.gatts_set_buffer(self._handle_snapshot, game_protocol.MAX_SNAPSHOT_SIZE)
+        self.boot.mark(stage_trace.RADIO_UP)
+        self._sessions = {}
+        # Games of guests that dropped out, most recent last, so a guest that
+        # reconnects picks up where it left off.
+        self._parked = []
+        self._max_connections = max_connections
+        # Sessions waiting on a move from our console, oldest first. Console
+        # input always goes to the head of this queue.
+        self._waiting = []
+        self._advertising = False
+        # Whether our advertising accepts connections (see _advertise).
+        self._connectable = False
+        self._frame = game_protocol.Frame()
+        self._render = BoardRenderer(ansi)
+        # _irq only records events here; _handle_event does the work later.
+        self._events = EventQueue(_EVENT_QUEUE_SIZE, game_protocol.FRAME_SIZE, self._handle_event)
         self._payload = advertising_payload(
-            name="tic", services=[_GAME_UUID], appearance=_ADV_APPEARANCE_GENERIC_GAMING
+            name="tic", services=[_GAME_UUID], manufacturer=(MANUFACTURER_TEST, bytes((_LAYOUT_VERSION,)))
         )
-        # self.reset_board()
-        self._step = 0
-        self._starts = 0
+        # The layout version fills the advertisement, so the appearance and
+        # the spectator beacon go in the scan response (which mustn't carry
+        # flags, hence by hand). There's no beacon until the first game.
+        self._resp = bytearray(_RESP_SIZE)
+        struct.pack_into(
+            "<BBHBBH",
+            self._resp,
+            0,
+            3,
+            _ADV_TYPE_APPEARANCE,
+            _ADV_APPEARANCE_GENERIC_GAMING,
+            0,
+            _ADV_TYPE_MANUFACTURER,
+            MANUFACTURER_TEST,
+        )
+        self._resp_len = 4
+        # Views of the first n bytes of _resp by n, made once per length so
+        # re-advertising a beacon doesn't allocate.
+        self._resp_views = [None] * (_RESP_SIZE + 1)
+        # Timestamps of each stage of connecting and moving; see stage_trace.
+        self.trace = stage_trace.StageTrace()
+        # Fast advertising at boot and after a guest leaves, slower later on.
+        self._adv_cycle = DutyCycle(duty_cycle.ADVERTISE)
+        # Milliseconds from (re)starting advertising to the last connection.
+        self.connect_ms = -1
+        self.trace.mark(stage_trace.ADVERTISE)
         self._advertise()
-        
-
-    def reset_board(self):
-        self._board = ['1','2','3','4','5','6','7','8','9']
-        self._step = 0
+        # Bytes allocated per move and per game, when switched on.
+        self.alloc = AllocMeter()
+        # Enough sessions for every slot plus as many parked games, made
+        # now (we're already discoverable) so a guest connecting allocates
+        # no more than its address.
+        self._pool = [Session(None, None, rules) for _ in range(2 * max_connections)]
+
+    def reset_board(self, s):
+        import random
+
+        s.board.clear()
+        if s.cells:
+            game_protocol.clear_cells(s.snap)
+        for i in range(len(s.recent)):
+            s.recent[i] = 0
         # make who starts random and print who's starting this round
-        self._starts = random.randint(0, 1)   # 0 = host, 1 = joined user
-        self._step = 0
-        self._move = 0
-        if (self._starts + self._step) % 2 == 0:
-            self._input_waiting = True
+        s.starts = random.randint(0, 1)   # 0 = host, 1 = joined user
+        s.step = 0
+        s.move = 0
+        game_record.begin(s.rec, s.starts)
+        if s.cells:
+            # Records only have room for 3x3 games.
+            game_record.spoil(s.rec)
+        if s.is_our_turn():
+            s.input_waiting = True
             print("We go first this time!")
         else:
             print("Guest goes first this time!")
-            self._input_waiting = False
-        self.write_instructions()
+            s.input_waiting = False
+        self.write_instructions(s)
 
 
     def _irq(self, event, data):
+        if event == _IRQ_GATTS_READ_REQUEST:
+            # All guests share the characteristics, so load the reader's own
+            # game into them before the read is served. This has to happen
+            # inside the IRQ, but only copies a preallocated buffer. Only
+            # ports built with MICROPY_PY_BLUETOOTH_GATTS_ON_READ_CALLBACK
+            # raise this, and the Pico W's doesn't: there a read returns
+            # whichever game was written last. Our guests ask for snapshots
+            # by writing instead, which works everywhere.
+            conn_handle, attr_handle = data
+            s = self._sessions.get(conn_handle)
+            if s is not None:
+                if attr_handle == self._handle_game_state:
+                    self._ble.gatts_write(self._handle_game_state, s.tx)
+                elif attr_handle == self._handle_snapshot:
+                    self._ble.gatts_write(self._handle_snapshot, s.snap)
+                elif attr_handle == self._handle_rules:
+                    self._ble.gatts_write(self._handle_rules, s.rules_buf)
+            return 0
+        elif event == _IRQ_GATTS_WRITE:
+            conn_handle, value_handle = data
+            if value_handle == self._handle_game_state:
+                self.trace.mark(stage_trace.FRAME_IN)
+            # Capture the value now: another guest may overwrite it before
+            # the event is handled. Writes longer than a frame don't fit in
+            # the queue and are dropped there.
+            self._events.push(event, conn_handle, value_handle, 0, self._ble.gatts_read(value_handle))
+        elif event == _IRQ_GATTS_INDICATE_DONE:
+            conn_handle, value_handle, status = data
+            self._events.push(event, conn_handle, value_handle, status)
+        elif event == _IRQ_CENTRAL_CONNECT or event == _IRQ_CENTRAL_DISCONNECT:
+            if event == _IRQ_CENTRAL_CONNECT:
+                self.trace.mark(stage_trace.CONNECT)
+            conn_handle, addr_type, addr = data
+            self._events.push(event, conn_handle, addr_type, 0, None, addr)
+
+    # Handle all queued events; also called by the main loop as a fallback.
+    def process_events(self):
+        return self._events.drain()
+
+    def _handle_event(self, q, i):
+        event = q.event[i]
+        conn_handle = q.arg0[i]
         # Track connections so we can send notifications.
         if event == _IRQ_CENTRAL_CONNECT:
-            print("Guest connected!")
-            conn_handle, _, _ = data
-            self._connections.add(conn_handle)
-            self.new_player()
-            self.reset_board()
-            if (self._starts + self._step) % 2 == 0:
-                self.get_p1_move()
+            # Reported so the advertising schedule can be tuned.
+            self.connect_ms = self._adv_cycle.elapsed_ms()
+            interval_ms = self._adv_cycle.interval_us() // 1000
+            print(f"Connected {self.connect_ms} ms after advertising started (every {interval_ms} ms)")
+            if self.boot.mark(stage_trace.FIRST_CONNECT) and self._profile_boot:
+                self.boot.report()
+            addr = bytes(q.payload(i)[:_ADDR_SIZE])
+            s = self._resume(conn_handle, addr)
+            if s is not None:
+                # The guest reads the snapshot to catch up.
+                print("Guest rejoined!")
+                if s.is_our_turn():
+                    self.get_p1_move(s)
+            else:
+                print("Guest connected!")
+                s = self.new_player(conn_handle, addr)
+                self.reset_board(s)
+                if s.is_our_turn():
+                    self.get_p1_move(s)
+            # Advertising stops when a central connects; resume it while we
+            # still have room for more guests.
+            self._advertising = False
+            self._advertise()
         elif event == _IRQ_CENTRAL_DISCONNECT:
             print("Goodbye guest!")
-            conn_handle, _, _ = data
-            self._connections.remove(conn_handle)
-            # Start advertising again to allow a new connection.
-            # TODO: does this mean we won't get a second connection?
-            print("Waiting for guest to connect...")
+            s = self._sessions.pop(conn_handle, None)
+            if s is not None:
+                self._park(s)
+            if self._stats is not None:
+                self._stats.flush()
+            if self._games is not None:
+                self._games.flush()
+            if s in self._waiting:
+                self._waiting.remove(s)
+                if self._waiting:
+                    self.get_p1_move(self._waiting[0])
+            # Start advertising again to allow a new connection, fast for a
+            # while since the guest may well come straight back.
+            if not self._connectable:
+                print("Waiting for guest to connect...")
+            self._adv_cycle.restart()
+            self.trace.mark(stage_trace.ADVERTISE)
+            self._advertising = False
             self._advertise()
         elif event == _IRQ_GATTS_INDICATE_DONE:
-            conn_handle, value_handle, status = data
+            pass
         elif event == _IRQ_GATTS_WRITE:
-            conn_handle, value_handle = data
-            if conn_handle in self._connections:
-                    instructions = list(self._ble.gatts_read(self._handle_game_state).decode("UTF-8"))
-                    if len(instructions) == 3:
-                        starts = int(instructions.pop(0))
-                        step = int(instructions.pop(0))
-                        move = int(instructions.pop(0))
-                        print(f"starts: {starts}, step: {step}, move: {move}")
-                        if self._starts != starts:
-                            print("Whoa, players changed starter?")
-                        if self._step + 1 != step:
-                            print(f"Did we miss a step?  Our last step was {self._step} but player 2 sent step {step}")
-                        self._step = step
-                        if (self._starts + self._step) % 2 == 0:  # 0 because it's our turn now - just capturing what p2 did
-                            # handle connected players movement
-                            # TODO: validate input before switching turns...
-                            if self.is_free(move):
-                                self._board[move - 1] = 'O'
-                                print("Guest took square " + str(move))
-                                if self.is_winner(2):
-                                    print("Guest wins!")
-                                    self._p2_wins += 1
-                                    self.print_board()
-                                    self.print_stats()
-                                    self.reset_board()
-                                    if (self._starts + self._step) % 2 == 0:
-                                        # p1 was picked to start the next game
-                                        self.get_p1_move()
-                                elif self.is_board_full():
-                                    print("It's a draw!!")
-                                    self._draws += 1
-                                    self.print_board()
-                                    self.print_stats()
-                                    self.reset_board()
-                                    if (self._starts + self._step) % 2 == 0:
-                                        # p1 was picked to start the next game
-                                        self.get_p1_move()
-                                else:
-                                    self.get_p1_move()
-                            
-                            else:
-                                print("Guest tried to take square " + str(move) + " but it's not free...")
-                            
-                        else:
-                            print("Naughty!  Wait your turn!")
+            s = self._sessions.get(conn_handle)
+            if s is not None and q.arg1[i] == self._handle_rules:
+                self._on_rules(s, q.payload(i), q.length[i])
+            elif s is not None and q.arg1[i] == self._handle_snapshot:
+                # A request for this guest's snapshot. The write replaced the
+                # stored value, so put a whole snapshot back as well.
+                self._ble.gatts_write(self._handle_snapshot, s.snap)
+                self._ble.gatts_notify(s.conn_handle, self._handle_snapshot, s.snap)
+            elif s is not None:
+                    self.alloc.begin()
+                    # A game_record result if this write ended the game.
+                    over = -1
+                    frame = self._frame
+                    n = q.length[i]
+                    if not game_protocol.decode(q.payload(i), frame, n):
+                        print("Unrecognised game state: " + str(n) + " bytes")
+                    elif frame.version and s.rx_seq >= 0 and game_protocol.seq_diff(frame.seq, s.rx_seq) <= 0:
+                        # A repeat of a write we've already handled: the
+                        # guest missed our ack, so send it again.
+                        self.tell_turn(s, True)
+                    elif not self._valid_move(s, frame):
+                        # Leave the game as it is and send the guest our
+                        # current state again, so it can catch up.
+                        self.tell_turn(s, True)
                     else:
-                        print("Wrong number of instructions: " + str(len(instructions)))
-
-                        
-    def is_winner(self, player_num):
-        p = 'X'
-        if player_num == 2:
-            p = 'O'
-        b = self._board
-        if b[0] == b[1] == b[2] == p:
-            return True
-        elif b[3] == b[4] == b[5] == p:
-            return True
-        elif b[6] == b[7] == b[8] == p:
-            return True
-        elif b[0] == b[3] == b[6] == p:
-            return True
-        elif b[1] == b[4] == b[7] == p:
-            return True
-        elif b[2] == b[5] == b[8] == p:
-            return True
-        elif b[0] == b[4] == b[8] == p:
-            return True
-        elif b[2] == b[4] == b[6] == p:
-            return True
-        else:
+                        s.rx_seq = frame.seq
+                        # Ack it in whatever we send next.
+                        game_protocol.set_ack(s.tx, s.rx_seq)
+                        game_protocol.set_ack(s.snap, s.rx_seq)
+                        move = frame.move
+                        s.step = frame.step
+                        self._place(s, 2, move)
+                        self.trace.mark(stage_trace.MOVE_APPLIED)
+                        s.move = move
+                        print("Guest took square", move)
+                        if s.board.is_winner(2):
+                            print("Guest wins!")
+                            s.p2_wins += 1
+                            over = game_record.GUEST_WON
+                        elif s.board.is_full():
+                            print("It's a draw!!")
+                            s.draws += 1
+                            over = game_record.DRAW
+                        else:
+                            # Only encode a state we are going to send; game
+                            # over sends the new game.
+                            self._encode(s)
+                            self.get_p1_move(s)
+                    self.alloc.end(over >= 0)
+                    if over >= 0:
+                        self._end_game(s, over)
+
+    # Whether the move in frame is the guest's next one in game s. Checked
+    # before anything changes, so a bad write leaves the game as it was.
+    def _valid_move(self, s, frame):
+        if s.starts != frame.starts:
+            print("Whoa, players changed starter?")
+            return False
+        if s.step + 1 != frame.step:
+            print(f"Did we miss a step?  Our last step was {s.step} but player 2 sent step {frame.step}")
+            return False
+        if s.is_our_turn():
+            print("Naughty!  Wait your turn!")
+            return False
+        if not s.board.is_free(frame.move):
+            print("Guest tried to take square " + str(frame.move) + " but it's not free...")
             return False
-        
-    def is_board_full(self):
-        for square in self._board:
-            if square != 'X' and square != 'O':
-                # still at least one square left to play...
-                return False
         return True
-           
-    def print_board(self):
-        b = self._board
-        print("-------------")
-        print(f"| {b[0]} | {b[1]} | {b[2]} |")
-        print("-------------")
-        print(f"| {b[3]} | {b[4]} | {b[5]} |")
-        print("-------------")
-        print(f"| {b[6]} | {b[7]} | {b[8]} |")
-        print("-------------")
-           
-    def is_free(self, move):
-        if self._board[move - 1] == str(move):
-            return True
+
+    # A guest asking to play on a different board. We play anything valid;
+    # the game in progress is abandoned and a new one starts. Either way the
+    # guest is told the rules, since it holds its moves until it hears back.
+    def _on_rules(self, s, data, n):
+        f = self._frame
+        if not game_protocol.decode_rules(data, f, n) or not valid_rules(f.width, f.height, f.k):
+            print("Guest asked for rules we can't play")
+            self.tell_rules(s)
+            return
+        if (f.width, f.height, f.k) == s.rules:
+            self.tell_rules(s)
+            return
+        print(f"Guest asked for a {f.width}x{f.height} board, {f.k} in a row. New game!")
+        if s in self._waiting:
+            self._waiting.remove(s)
+        s.set_rules(f.width, f.height, f.k)
+        self.tell_rules(s)
+        # Skip a sequence number so the new game looks like a gap: a guest
+        # that missed the rules then reads the snapshot, which has them.
+        s.seq = (s.seq + 1) & 0xFFFF
+        self.reset_board(s)
+        if s.is_our_turn():
+            self.get_p1_move(s)
+        elif self._waiting:
+            self.get_p1_move(self._waiting[0])
+
+    def tell_rules(self, s):
+        self._ble.gatts_write(self._handle_rules, s.rules_buf)
+        self._ble.gatts_notify(s.conn_handle, self._handle_rules, s.rules_buf)
+
+    def _place(self, s, player_num, move):
+        s.board.place(player_num, move)
+        game_record.add_move(s.rec, move)
+        game_protocol.add_recent(s.recent, move)
+        if s.cells:
+            game_protocol.set_cell(s.snap, move - 1, player_num)
+
+    def print_board(self, s, status=None):
+        self._render.draw(s.board, status)
+
+    # Refresh the session's outgoing frame and snapshot from its current
+    # state. Each call is a new state, so only call it for states we send.
+    def _encode(self, s):
+        s.seq = (s.seq + 1) & 0xFFFF
+        game_protocol.encode(s.tx, s.starts, s.step, s.move, s.seq, 0, s.rx_seq)
+        if s.cells:
+            width, height, k = s.rules
+            game_protocol.encode_cells_snapshot(
+                s.snap, s.starts, s.step, s.move, s.seq, width, height, k, s.p1_wins, s.p2_wins, s.draws, s.rx_seq
+            )
         else:
-            return False
-           
-    def write_instructions(self):
-        instructions = str(self._starts) + str(self._step) + str(self._move)
-        self._ble.gatts_write(self._handle_game_state, instructions.encode("UTF-8"))
-        for conn in self._connections:
-            self._ble.gatts_notify(conn, self._handle_game_state)
-
-           
+            game_protocol.encode_snapshot(
+                s.snap, s.starts, s.step, s.move, s.seq, s.board.p1, s.board.p2, s.p1_wins, s.p2_wins, s.draws, s.rx_seq
+            )
+        self._broadcast(s)
+
+    # Put the session's state in the spectator beacon and re-advertise so
+    # the scan response carries it. With several guests, spectators see
+    # whichever game changed last.
+    def _broadcast(self, s):
+        width, height, k = s.rules
+        n = game_protocol.encode_beacon(
+            self._resp,
+            _BEACON_AT,
+            s.conn_handle,
+            s.seq,
+            s.starts,
+            s.step,
+            s.move,
+            width,
+            height,
+            k,
+            s.p1_wins,
+            s.p2_wins,
+            s.draws,
+            s.board,
+            s.recent,
+        )
+        # Manufacturer field length: type, company ID and the beacon.
+        self._resp[4] = 3 + n
+        self._resp_len = _BEACON_AT + n
+        if self._advertising:
+            self._advertising = False
+            self._advertise()
+
+    def write_instructions(self, s):
+        self._encode(s)
+        # Keep the stored value current for single-guest hosts and ports
+        # without read requests, but only notify the guest playing this game.
+        self._ble.gatts_write(self._handle_game_state, s.tx)
+        self._ble.gatts_write(self._handle_snapshot, s.snap)
+        self.tell_turn(s)
+
+    # Play a move from our console in the game at the head of the queue.
     def make_move(self, move):
+        if not self._waiting:
+            return
+        s = self._waiting[0]
         #TODO check input and move the move
-        if self.is_free(move):
-            self._move = move
-            self._step += 1
-            self._board[move - 1] = 'X'
-            self.write_instructions()
-            if self.is_winner(1):
+        if s.board.is_free(move):
+            self.alloc.begin()
+            over = -1
+            self.trace.mark(stage_trace.INPUT)
+            self._waiting.pop(0)
+            s.move = move
+            s.step += 1
+            self._place(s, 1, move)
+            self.write_instructions(s)
+            self.trace.mark(stage_trace.MOVE_SENT)
+            if s.board.is_winner(1):
                 print("We won!")
-                self._p1_wins += 1
-                self.print_board()
-                self.print_stats()
-                self.reset_board()
-                if (self._starts + self._step) % 2 == 0:
-                    self.get_p1_move()
-            elif self.is_board_full():
+                s.p1_wins += 1
+                over = game_record.HOST_WON
+            elif s.board.is_full():
                 print("It's a draw!!")
-                self._draws += 1
-                self.print_board()
-                self.print_stats()
-                self.reset_board()
-                if (self._starts + self._step) % 2 == 0:
-                    self.get_p1_move()
+                s.draws += 1
+                over = game_record.DRAW
             else:
-                print("We took square " + str(move) + ".")
-                self.print_board()
-                print("Waiting for guest...")
-                self._input_waiting = False
-            
+                print("We took square", move, end=".\n")
+                self.print_board(s, b"Waiting for guest...")
+                s.input_waiting = False
+            self.alloc.end(over >= 0)
+            if over >= 0:
+                self._end_game(s, over)
+            if self._waiting and self._waiting[0] is not s:
+                self.get_p1_move(self._waiting[0])
+
         else:
             print(f"Move {move} is not available, try again...")
-            self.print_board()
-
-    def print_stats(self):
+            self.print_board(s)
+
+    # Log game s, which just ended with a game_record result, show the score
+    # and start the next game. Logging and the lifetime totals allocate and
+    # may write to flash, so this runs after the move is metered.
+    def _end_game(self, s, result):
+        self._record(s, result)
+        self.print_board(s)
+        self.print_stats(s)
+        self.reset_board(s)
+        if s.is_our_turn():
+            # p1 was picked to start the next game
+            self.get_p1_move(s)
+
+    # Log a finished game; result is a game_record result.
+    def _record(self, s, result):
+        game_record.finish(s.rec, result)
+        if self._games is not None:
+            self._games.append(s.rec)
+        if self._stats is not None and s.addr is not None:
+            self._stats.record(s.addr, _STATS_RESULT[result])
+
+    def print_stats(self, s):
         print("Stats so far:")
-        print("    Us:    " + str(self._p1_wins))
-        print("    Guest: " + str(self._p2_wins))
-        print("    Draws: " + str(self._draws))
-
-    def get_p1_move(self):
-        self.print_board()
-        print("What's your move (X)?")
-        self.tell_turn()
-        self._input_waiting = True
-
-    def new_player(self):
-        self._p1_wins = 0
-        self._p2_wins = 0
-        self._draws = 0
-        self._input_waiting = False
-        self._board = ['1','2','3','4','5','6','7','8','9']
-        
+        print("    Us:   ", s.p1_wins)
+        print("    Guest:", s.p2_wins)
+        print("    Draws:", s.draws)
+        if self._stats is not None and s.addr is not None:
+            wins, losses, draws = self._stats.totals(s.addr)
+            print(f"Lifetime against this guest: {wins} won, {losses} lost, {draws} drawn")
+
+    def get_p1_move(self, s):
+        if s not in self._waiting:
+            self._waiting.append(s)
+        s.input_waiting = True
+        self.tell_turn(s)
+        if self._waiting[0] is s:
+            if len(self._sessions) > 1:
+                print("Game with guest", s.conn_handle, end=":\n")
+            self.print_board(s, b"What's your move (X)?")
+
+    def new_player(self, conn_handle, addr=None):
+        if self._pool:
+            s = self._pool.pop()
+            s.reuse(conn_handle, addr, self._rules)
+        else:
+            s = Session(conn_handle, addr, self._rules)
+        self._sessions[conn_handle] = s
+        return s
+
+    # Keep a finished session's game for its guest coming back, and put
+    # whatever is no longer kept back in the pool.
+    def _park(self, s):
+        if s.addr is None:
+            self._pool.append(s)
+            return
+        self._parked.append(s)
+        if len(self._parked) > self._max_connections:
+            self._pool.append(self._parked.pop(0))
+
+    # Move a parked game for this address back into play, or return None.
+    def _resume(self, conn_handle, addr):
+        for s in self._parked:
+            if s.addr == addr:
+                self._parked.remove(s)
+                s.conn_handle = conn_handle
+                s.sent_seq = -1
+                s.rx_seq = -1
+                self._sessions[conn_handle] = s
+                return s
+        return None
+
     # TODO: rename
-    def tell_turn(self):
-        for conn_handle in self._connections:
-            # Notify connected centrals.
-            self._ble.gatts_notify(conn_handle, self._handle_game_state)
+    def tell_turn(self, s, force=False):
+        # Notify the guest playing this game, once per state unless forced.
+        if force or s.sent_seq != s.seq:
+            s.sent_seq = s.seq
+            self._ble.gatts_notify(s.conn_handle, self._handle_game_state, s.tx)
+
+
+    def is_our_turn(self):
+        return len(self._waiting) > 0
+
+    # Number of squares on the board we're being asked to move on.
+    def squares(self):
+        if not self._waiting:
+            return 9
+        return self._waiting[0].board.size
+
+    # Perfect-play move for the game at the head of the queue, or 0.
+    def suggest_move(self):
+        if not self._waiting:
+            return 0
+        import game_ai
+        return game_ai.choose(self._waiting[0].board, 1)
+
+    # Step the advertising schedule, slowing down if the current burst is
+    # over. Returns how many ms until it needs calling again (0: never).
+    def poll_advertising(self):
+        if self._adv_cycle.update() and self._advertising:
+            # Advertising again just changes the interval.
+            self._advertising = False
+            self._advertise()
+        return self._adv_cycle.remaining_ms()
+
+    def _resp_view(self):
+        n = self._resp_len
+        view = self._resp_views[n]
+        if view is None:
+            view = self._resp_views[n] = memoryview(self._resp)[:n]
+        return view
+
+    # Once full we keep advertising for spectators, but not connectably.
+    def _advertise(self):
+        if self._advertising:
+            return
+        connectable = len(self._sessions) < self._max_connections
+        try:
+            self._ble.gap_advertise(
+                self._adv_cycle.interval_us(),
+                adv_data=self._payload,
+                resp_data=self._resp_view(),
+                connectable=connectable,
+            )
+            self._advertising = True
+            self._connectable = connectable
+            self.boot.mark(stage_trace.DISCOVERABLE)
+        except OSError:
+            # The controller has no room for another connection.
+            pass
 
 
-    def _advertise(self, interval_us=500000):
-        self._ble.gap_advertise(interval_us, adv_data=self._payload)
+# Besides a square number, "trace" dumps the stage trace, "hist" prints its
+# latency histograms, "boot" how long startup took and "alloc" switches the
+# allocation meter on or off.
+def handle_input(game, input_line):
+    if input_line == "trace":
+        game.trace.dump()
+        return
+    if input_line == "hist":
+        game.trace.histogram()
+        return
+    if input_line == "boot":
+        game.boot.report()
+        return
+    if input_line == "alloc":
+        game.alloc.toggle()
+        return
+    try:
+        move = int(input_line)
+    except ValueError:
+        return
+    if move >= 1 and move <= game.squares():
+        game.make_move(move)
+    else:
+        print("That is not a valid move.  Please try again.")
+
+
+async def _event_task(game, wake, turn):
+    while True:
+        await wake.wait()
+        wake.clear()
+        if game.process_events():
+            turn.set()
 
 
-def start():
-    
-    ble = bluetooth.BLE()
+async def _input_task(game, ai, turn):
+    import asyncio
 
-    game = TicTacToe(ble)
+    reader = None if ai else asyncio.StreamReader(sys.stdin)
+    while True:
+        if not game.is_our_turn():
+            # Sleep until a BLE event may have handed us the turn.
+            await turn.wait()
+            turn.clear()
+            continue
+        if ai:
+            game.make_move(game.suggest_move())
+            await asyncio.sleep(0)
+            continue
+        input_line = await reader.readline()
+        if isinstance(input_line, bytes):
+            input_line = input_line.decode()
+        handle_input(game, input_line.strip())
+
+
+async def _heartbeat_task(game, interval_ms):
+    # Re-send the current state so a guest that missed a notification catches
+    # up; guests that didn't miss it drop the repeat by its sequence number.
+    import asyncio
 
-    # TODO: call new player only on connection?
-    game.new_player()
+    while True:
+        await asyncio.sleep(interval_ms / 1000)
+        for s in list(game._sessions.values()):
+            game.tell_turn(s, True)
 
-    print("Running as host")
-    print(f"Waiting for guest to join...")
+
+async def _advertise_task(game):
+    # Wake when the advertising schedule is due to slow down, and at least
+    # once a second in case a disconnect restarted it meanwhile.
+    import asyncio
+
+    while True:
+        ms = game.poll_advertising()
+        await asyncio.sleep(min(ms or 1000, 1000) / 1000)
+
+
+# With ai=True the computer plays our moves instead of reading the console.
+async def run(game, notify_interval_ms=None, ai=False):
+    import asyncio
+
+    # Ports without ThreadSafeFlag fall back to Event, which _event_task
+    # clears by hand.
+    wake = getattr(asyncio, "ThreadSafeFlag", asyncio.Event)()
+    turn = asyncio.Event()
+    # Events queued by _irq are now handled by _event_task instead of
+    # micropython.schedule.
+    game._events.wake = wake
+    tasks = [
+        asyncio.create_task(_event_task(game, wake, turn)),
+        asyncio.create_task(_input_task(game, ai, turn)),
+        asyncio.create_task(_advertise_task(game)),
+    ]
+    if notify_interval_ms:
+        tasks.append(asyncio.create_task(_heartbeat_task(game, notify_interval_ms)))
+    await asyncio.gather(*tasks)
+
+
+def run_blocking(game, ai=False):
+    import uselect
 
     i = 0
 
     while True:
+        # Events are normally handled via micropython.schedule; this catches
+        # any left behind if the scheduler queue was full.
+        game.process_events()
+        game.poll_advertising()
         # Write every second, notify every 10 seconds.
         i = (i + 1) % 10
         if i == 0:
             pass
             #game.tell_turn()
-        
-        if (game._starts + game._step) % 2 == 0 and game._input_waiting:
-            move = -1
+
+        if game.is_our_turn() and ai:
+            game.make_move(game.suggest_move())
+            continue
+        if game.is_our_turn():
             if uselect.select([sys.stdin], [], [], 0.01)[0]:
-                input_line = sys.stdin.readline().strip()
-                try:
-                    move = int(input_line)
-                except ValueError:
-                    pass
-            
-                if move != -1:
-                    if move >= 1 and move <= 9:
-                        game.make_move(move)
-                    else:
-                        print("That is not a valid move.  Please try again.")
+                handle_input(game, sys.stdin.readline().strip())
         time.sleep_ms(1000)
-        
+
+
+# mode is "async" (default) for the event-driven runtime, or "blocking" for the
+# original polling loop. ansi=True keeps the board pinned at the top of an
+# ANSI terminal and only redraws the squares that change. stats=True keeps
+# lifetime results per guest on flash, and record=True logs every game.
+# rules=(width, height, k) picks the board, e.g. (15, 15, 5) for five in a
+# row on 15x15; guests can ask for something else. profile=True reports the
+# time from reset to advertising and to the first guest (also available as
+# the "boot" command). alloc=True prints the bytes allocated by every move
+# and game (also the "alloc" command).
+def start(
+    mode="async", ai=False, ansi=False, stats=True, record=True, rules=_STANDARD_RULES, profile=False, alloc=False
+):
+
+    ble = bluetooth.BLE()
+
+    # Advertising starts in here; everything after runs while guests can
+    # already find us.
+    game = TicTacToe(
+        ble,
+        ansi=ansi,
+        stats=stats_log.StatsLog() if stats else None,
+        games=game_record.GameLog() if record else None,
+        rules=rules,
+        profile_boot=profile,
+    )
+    game.alloc.enabled = alloc
+
+    print("Running as host")
+    if profile:
+        print(f"Discoverable {game.boot.us(stage_trace.DISCOVERABLE) // 1000} ms after reset")
+    print(f"Waiting for guest to join...")
+
+    if mode == "blocking":
+        run_blocking(game, ai)
+    else:
+        import asyncio
+
+        asyncio.run(run(game, ai=ai))
 
 
 if __name__ == "__main__":
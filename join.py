@@ -1,10 +1,25 @@
+from alloc_meter import AllocMeter
 import bluetooth
-from ble_advertising import decode_services, decode_name
+from ble_advertising import MANUFACTURER_TEST, UUIDMatcher, find_manufacturer
+from board_render import BoardRenderer
+from duty_cycle import DutyCycle
+import duty_cycle
+from event_queue import EventQueue
+from game_engine import new_board, valid_rules
+from gatt_cache import HandleCache
+import gatt_cache
+import game_protocol
+import game_record
+import stage_trace
+import stats_log
 from micropython import const
 import sys
 import time
 import uselect
 
+# When our imports were done, for the boot profile.
+_IMPORTED_US = time.ticks_us()
+
 _IRQ_SCAN_RESULT = const(5)
 _IRQ_SCAN_DONE = const(6)
 _IRQ_PERIPHERAL_CONNECT = const(7)
@@ -12,58 +27,318 @@ _IRQ_PERIPHERAL_DISCONNECT = const(8)
 _IRQ_GATTC_SERVICE_RESULT = const(9)
 _IRQ_GATTC_SERVICE_DONE = const(10)
 _IRQ_GATTC_CHARACTERISTIC_RESULT = const(11)
+_IRQ_GATTC_CHARACTERISTIC_DONE = const(12)
 _IRQ_GATTC_READ_RESULT = const(15)
+_IRQ_GATTC_READ_DONE = const(16)
+_IRQ_GATTC_WRITE_DONE = const(17)
 _IRQ_GATTC_NOTIFY = const(18)
+_IRQ_MTU_EXCHANGED = const(21)
 
 _ADV_IND = const(0x00)
 _ADV_DIRECT_IND = const(0x01)
 
 _GAME_UUID = bluetooth.UUID("d314caba614b43c3a05fec9a48d85750")
 _GAME_STATE_UUID = bluetooth.UUID("a3d11e79-dfe4-461a-83c1-da99f708018d")
+_SNAPSHOT_UUID = bluetooth.UUID("5f0a8b0e-3c8e-4b6e-9a57-2d4f0b9e6c11")
+_RULES_UUID = bluetooth.UUID("5f0a8b0e-3c8e-4b6e-9a57-2d4f0b9e6c12")
+
+# Values of the event's arg2 for a discovered characteristic.
+_CHAR_OTHER = const(0)
+_CHAR_GAME_STATE = const(1)
+_CHAR_SNAPSHOT = const(2)
+_CHAR_RULES = const(3)
+
+# MTU we ask for on connect; until then the default applies. Snapshots of
+# boards bigger than 3x3 need up to game_protocol.MAX_SNAPSHOT_SIZE.
+_MTU = const(96)
+_DEFAULT_MTU = const(23)
+
+# Connection states, advanced by tick() and _irq:
+#   IDLE        -> no link; next tick reconnects to the last host or scans
+#   SCANNING    -> looking for a host advertisement
+#   CHOOSING    -> lobby scan finished, waiting for choose_host()
+#   CONNECTING  -> gap_connect issued, waiting for _IRQ_PERIPHERAL_CONNECT
+#   DISCOVERING -> connected, resolving the game service and characteristic
+#   SYNCED      -> ready, waiting for the host to start a game
+#   PLAYING     -> a game is in progress
+_STATE_IDLE = const(0)
+_STATE_SCANNING = const(1)
+_STATE_CHOOSING = const(2)
+_STATE_CONNECTING = const(3)
+_STATE_DISCOVERING = const(4)
+_STATE_SYNCED = const(5)
+_STATE_PLAYING = const(6)
+
+# In lobby mode we listen for the whole window to hear every table in the room.
+_LOBBY_WINDOW_MS = const(3000)
+# A direct connect to a known address only needs to catch one advertisement.
+_RECONNECT_TIMEOUT_MS = const(1000)
+_CONNECT_TIMEOUT_MS = const(3000)
+_DISCOVER_TIMEOUT_MS = const(3000)
+_READ_RETRY_MS = const(500)
+# How long to hold our moves waiting for the host to answer a rules request.
+_RULES_TIMEOUT_MS = const(3000)
+# While waiting on the host, poll for a snapshot this often in case its last
+# notification was lost.
+_STATE_POLL_MS = const(2000)
+# In fast mode, resend a move the host hasn't acked after this long. The ack
+# rides on the host's very next notification, so this only fires on loss.
+_RETRANSMIT_MS = const(100)
+# Connection interval asked for in fast mode; the controller's default is
+# used otherwise. Shorter means lower move latency but more radio wake-ups.
+_FAST_CONN_INTERVAL_MS = const(15)
+_CONN_HANDLE_NONE = const(0xFFFF)
+
+_EVENT_QUEUE_SIZE = const(16)
+
+# Our lifetime stats result for each game_record result.
+_STATS_RESULT = (stats_log.LOSS, stats_log.WIN, stats_log.DRAW)
+# Room for a 6-byte address followed by a full 31-byte advertising payload,
+# or a snapshot of the largest board (game_protocol.MAX_SNAPSHOT_SIZE).
+_EVENT_PAYLOAD_SIZE = const(81)
+_ADDR_SIZE = const(6)
+_HANDLES_PATH = "handles.bin"
+# Written to the snapshot characteristic to ask for our game's snapshot; any
+# value will do. Hosts from this layout version on answer with a notification.
+_SNAPSHOT_REQUEST = b"\x00"
+_SNAPSHOT_REQUEST_LAYOUT = const(2)
+
+
+# The service layout version a host advertises (see host._LAYOUT_VERSION),
+# or 0 if it doesn't, in which case its handles aren't cached.
+def _advertised_layout(payload, start, end):
+    i = find_manufacturer(payload, MANUFACTURER_TEST, start, end)
+    if i < 0 or payload[i] < 4:
+        return 0
+    return payload[i + 4]
+
 
 class TicTacToe:
-    def __init__(self, ble):
+    # With lobby=True the guest scans for a full window, caches every host it
+    # hears and then connects to the strongest one (auto_pick=True) or lists
+    # them and waits for choose_host(). ansi=True pins the board to the top of
+    # an ANSI terminal and only redraws squares that change.
+    #
+    # fast=True sends moves as write-without-response and relies on the
+    # host's ack plus a timed retransmit; fast=False waits for each write's
+    # response. conn_interval_ms trades move latency against power in either
+    # mode. stats is an optional stats_log.StatsLog for lifetime results per
+    # host, and games an optional game_record.GameLog to record every game in.
+    # handles is a gatt_cache.HandleCache of hosts' attribute handles, so a
+    # reconnect skips discovery; by default one is kept in RAM only.
+    #
+    # rules=(width, height, k) asks the host for that board when we connect;
+    # None plays whatever the host is set up for. profile_boot=True prints
+    # how long startup took once we first connect.
+    def __init__(
+        self,
+        ble,
+        lobby=False,
+        auto_pick=True,
+        ansi=False,
+        fast=False,
+        conn_interval_ms=None,
+        stats=None,
+        games=None,
+        rules=None,
+        handles=None,
+        profile_boot=False,
+    ):
+        if rules is not None and not valid_rules(*rules):
+            raise ValueError("bad rules")
         self._ble = ble
+        # Time from reset to each startup milestone; see stage_trace.
+        self.boot = stage_trace.BootTimes()
+        self.boot.mark(stage_trace.IMPORTED, _IMPORTED_US)
+        self._profile_boot = profile_boot
+        self._stats = stats
+        self._games = games
+        self._handles = handles if handles is not None else HandleCache()
+        self._game_rec = game_record.new_record()
+        # Result of a game that just ended, until _log_result() logs it.
+        self._result = -1
         self._ble.active(True)
+        self._ble.config(mtu=_MTU)
         self._ble.irq(self._irq)
+        self.boot.mark(stage_trace.RADIO_UP)
+        self._want_rules = rules
+        self._rules = (3, 3, 3)
+        self._board = new_board()
+        self._frame = game_protocol.Frame()
+        self._tx = game_protocol.new_buffer()
+        self._seq = 0
+        self._fast = fast
+        if conn_interval_ms is None and fast:
+            conn_interval_ms = _FAST_CONN_INTERVAL_MS
+        self._conn_interval_us = conn_interval_ms * 1000 if conn_interval_ms else None
+        # Host frames dropped as repeats, gaps that needed a snapshot and
+        # moves sent again for want of an ack.
+        self.duplicates = 0
+        self.resyncs = 0
+        self.retransmits = 0
+        self._render = BoardRenderer(ansi)
+        # Timestamps of each stage of connecting and moving; see stage_trace.
+        self.trace = stage_trace.StageTrace()
+        # Bytes allocated per move and per game, when switched on.
+        self.alloc = AllocMeter()
+        # _irq only records events here; _handle_event does the work later.
+        self._events = EventQueue(_EVENT_QUEUE_SIZE, _EVENT_PAYLOAD_SIZE, self._handle_event)
+        self._matcher = UUIDMatcher(_GAME_UUID)
+        self._lobby = None
+        if lobby:
+            from lobby import Lobby
+
+            self._lobby = Lobby()
+        self._auto_pick = auto_pick
+        # Last host we found; kept across disconnects for fast reconnects.
+        self._addr_type = None
+        self._addr = None
+        self._name = None
+        # The last host's advertised layout version, 0 if unknown.
+        self._layout = 0
+        self._scan_callback = None
+        # Scan hard at boot and after losing the host, less so later on.
+        self._scan_cycle = DutyCycle(duty_cycle.SCAN)
+        # Milliseconds from starting to look for a host to connecting.
+        self.connect_ms = -1
         self._reset()
         
     def _reset(self):
-        self._board = ['1','2','3','4','5','6','7','8','9']
+        if self._stats is not None:
+            self._stats.flush()
+        if self._games is not None:
+            self._games.flush()
+        self._board.clear()
         self._step = -1
         self._starts = -1
         self._p1_wins = 0
         self._p2_wins = 0
         self._draws = 0
         self._input_waiting = False
-        self._addr_type = None
-        self._addr = None
         
-        self._scan_callback = None
         # self._conn_callback = None
         # self._read_callback = None
-        
-        self._name = None
         # self._notify_callback = None
         
+        self._state = _STATE_IDLE
+        self._deadline = 0
         self._conn_handle = None
         self._start_handle = None
         self._end_handle = None
         
         self._handle_game_state = None
+        self._handle_snapshot = None
+        self._handle_rules = None
+        # Whether the handles came from self._handles rather than discovery.
+        self._cached = False
+        self._cache_deadline = 0
+        # Whether we've asked this host for _want_rules yet, and whether we're
+        # still waiting to hear back. Moves are held meanwhile, as the host
+        # would take them as moves in the new game.
+        self._asked_rules = False
+        self._rules_pending = False
+        self._rules_deadline = 0
+        self._mtu = _DEFAULT_MTU
+        # Last sequence number seen from the host, -1 until the first frame.
+        self._rx_seq = -1
+        # Waiting on a snapshot after missing a notification.
+        self._resync = False
+        # Whether a frame has arrived since connecting, for the trace.
+        self._got_state = False
+        # Fast mode: our last write hasn't been acked yet.
+        self._unacked = False
+        self._retransmit_at = 0
         
         
     def _irq(self, event, data):
         if event == _IRQ_SCAN_RESULT:
             addr_type, addr, adv_type, rssi, adv_data = data
-            if adv_type in (_ADV_IND, _ADV_DIRECT_IND):
-                type_list = decode_services(adv_data)
-                if _GAME_UUID in type_list:
-                    self._addr_type = addr_type
-                    self._addr = bytes(addr)
-                    self._name = decode_name(adv_data) or "?"
-                    self._ble.gap_scan(None)
+            # Only game hosts are queued; matching is done in place on the
+            # IRQ buffer, so the flood of other advertisements costs nothing.
+            if adv_type in (_ADV_IND, _ADV_DIRECT_IND) and self._matcher.match(adv_data):
+                self._events.push(event, addr_type, adv_type, rssi, adv_data, addr)
+        elif event == _IRQ_PERIPHERAL_CONNECT or event == _IRQ_PERIPHERAL_DISCONNECT:
+            if event == _IRQ_PERIPHERAL_CONNECT:
+                self.trace.mark(stage_trace.CONNECT)
+            conn_handle, addr_type, addr = data
+            self._events.push(event, conn_handle, addr_type, 0, None, addr)
+        elif event == _IRQ_GATTC_SERVICE_RESULT:
+            conn_handle, start_handle, end_handle, uuid = data
+            if uuid == _GAME_UUID:
+                self._events.push(event, conn_handle, start_handle, end_handle)
+        elif event == _IRQ_GATTC_CHARACTERISTIC_RESULT:
+            conn_handle, def_handle, value_handle, properties, uuid = data
+            if uuid == _GAME_STATE_UUID:
+                kind = _CHAR_GAME_STATE
+            elif uuid == _SNAPSHOT_UUID:
+                kind = _CHAR_SNAPSHOT
+            elif uuid == _RULES_UUID:
+                kind = _CHAR_RULES
+            else:
+                kind = _CHAR_OTHER
+            self._events.push(event, conn_handle, value_handle, kind)
+        elif event == _IRQ_GATTC_READ_RESULT or event == _IRQ_GATTC_NOTIFY:
+            conn_handle, value_handle, char_data = data
+            if event == _IRQ_GATTC_NOTIFY and self._state < _STATE_SYNCED:
+                # The host notifies as soon as we connect, while discovery
+                # is still finding its handles. Nothing is lost: we ask for
+                # the state once we're SYNCED.
+                return
+            if event == _IRQ_GATTC_NOTIFY and value_handle == self._handle_game_state:
+                self.trace.mark(stage_trace.FRAME_IN)
+            self._events.push(event, conn_handle, value_handle, 0, char_data)
+        elif event == _IRQ_GATTC_READ_DONE or event == _IRQ_GATTC_WRITE_DONE:
+            conn_handle, value_handle, status = data
+            # Only failures matter: they show cached handles have gone stale.
+            if status:
+                self._events.push(event, conn_handle, value_handle, status)
+        elif event == _IRQ_SCAN_DONE:
+            self._events.push(event)
+        elif event == _IRQ_MTU_EXCHANGED:
+            conn_handle, mtu = data
+            self._events.push(event, conn_handle, mtu)
+        elif event == _IRQ_GATTC_SERVICE_DONE or event == _IRQ_GATTC_CHARACTERISTIC_DONE:
+            conn_handle, status = data
+            self._events.push(event, conn_handle, status)
+
+    # Handle all queued events; also called from tick() as a fallback.
+    def process_events(self):
+        return self._events.drain()
+
+    def _handle_event(self, q, i):
+        event = q.event[i]
+        if event == _IRQ_SCAN_RESULT:
+            if self._lobby is not None:
+                if self._state == _STATE_SCANNING:
+                    payload = q.payload(i)
+                    self._lobby.update(
+                        q.arg0[i],
+                        payload,
+                        0,
+                        q.arg2[i],
+                        payload,
+                        _ADDR_SIZE,
+                        q.length[i],
+                        self._matcher.name,
+                        _advertised_layout,
+                    )
+            elif self._state == _STATE_SCANNING and self._addr is None:
+                self.trace.mark(stage_trace.SCAN_HIT)
+                payload = q.payload(i)
+                self._addr_type = q.arg0[i]
+                self._addr = bytes(payload[:_ADDR_SIZE])
+                self._name = self._matcher.name(payload, _ADDR_SIZE, q.length[i]) or "?"
+                self._layout = _advertised_layout(payload, _ADDR_SIZE, q.length[i])
+                self._ble.gap_scan(None)
         elif event == _IRQ_SCAN_DONE:
+            if self._state == _STATE_SCANNING and self._lobby is not None:
+                self._lobby_done()
+            elif self._state == _STATE_SCANNING:
+                if self._addr:
+                    self._connect(_CONNECT_TIMEOUT_MS)
+                else:
+                    print("Searching for host...")
+                    self._state = _STATE_IDLE
             if self._scan_callback:
                 if self._addr:
                     self._scan_callback(self._addr_type, self._addr, self._name)
@@ -72,63 +347,302 @@ class TicTacToe:
                     self._scan_callback(None, None, None)
                  
         elif event == _IRQ_PERIPHERAL_CONNECT:
-            conn_handle, addr_type, addr = data
-            if addr_type == self._addr_type and addr == self._addr:
+            conn_handle = q.arg0[i]
+            if q.arg1[i] == self._addr_type and self._is_host_addr(q.payload(i)):
+                # Reported so the scan schedule can be tuned.
+                self.connect_ms = self._scan_cycle.elapsed_ms()
+                print(f"Connected {self.connect_ms} ms after we started looking")
+                if self.boot.mark(stage_trace.FIRST_CONNECT) and self._profile_boot:
+                    self.boot.report()
                 self._conn_handle = conn_handle
-                self._ble.gattc_discover_services(self._conn_handle)
+                try:
+                    self._ble.gattc_exchange_mtu(self._conn_handle)
+                except OSError:
+                    # Not fatal: a snapshot fits the default MTU.
+                    pass
+                if self._use_cached_handles():
+                    self._request_state()
+                else:
+                    self._state = _STATE_DISCOVERING
+                    self._deadline = time.ticks_add(time.ticks_ms(), _DISCOVER_TIMEOUT_MS)
+                    self._ble.gattc_discover_services(self._conn_handle)
             
         elif event == _IRQ_PERIPHERAL_DISCONNECT:
-            conn_handle, _, _ = data
+            conn_handle = q.arg0[i]
             if conn_handle == self._conn_handle:
                 self._reset()
+                self._scan_cycle.restart()
+            elif conn_handle == _CONN_HANDLE_NONE and self._state == _STATE_CONNECTING:
+                # The connection attempt timed out in the controller.
+                self._connect_failed()
                 
         elif event == _IRQ_GATTC_SERVICE_RESULT:
-            conn_handle, start_handle, end_handle, uuid = data
-            if conn_handle == self._conn_handle and uuid == _GAME_UUID:
-                self._start_handle, self._end_handle = start_handle, end_handle
+            if q.arg0[i] == self._conn_handle:
+                self._start_handle, self._end_handle = q.arg1[i], q.arg2[i]
                 
         elif event == _IRQ_GATTC_SERVICE_DONE:
+            self.trace.mark(stage_trace.SERVICES)
             if self._start_handle and self._end_handle:
                 self._ble.gattc_discover_characteristics(
                     self._conn_handle, self._start_handle, self._end_handle   
                 )
             else:
                 print("Failed to find game service!")
+                self.disconnect()
                 
         elif event == _IRQ_GATTC_CHARACTERISTIC_RESULT:
-            conn_handle, def_handle, value_handle, properties, uuid = data
-            if conn_handle == self._conn_handle:
-                if uuid == _GAME_STATE_UUID:
-                    self._handle_game_state = value_handle
+            if q.arg0[i] == self._conn_handle:
+                if q.arg2[i] == _CHAR_GAME_STATE:
+                    self._handle_game_state = q.arg1[i]
+                elif q.arg2[i] == _CHAR_SNAPSHOT:
+                    self._handle_snapshot = q.arg1[i]
+                elif q.arg2[i] == _CHAR_RULES:
+                    self._handle_rules = q.arg1[i]
+                else:
+                    print(f"Unknown characteristic at handle {q.arg1[i]}")
+
+        elif event == _IRQ_GATTC_CHARACTERISTIC_DONE:
+            if q.arg0[i] == self._conn_handle:
+                self.trace.mark(stage_trace.CHARACTERISTICS)
+                if self._handle_game_state is not None:
+                    if self._layout:
+                        self._handles.store(
+                            self._addr,
+                            self._layout,
+                            self._start_handle,
+                            self._end_handle,
+                            self._handle_game_state,
+                            self._handle_snapshot,
+                            self._handle_rules,
+                        )
+                    self._state = _STATE_SYNCED
+                    self._request_state()
                 else:
-                    print(f"Unknown characteristic {uuid}")
+                    print("Failed to find game state characteristic!")
+                    self.disconnect()
         
+        elif event == _IRQ_MTU_EXCHANGED:
+            if q.arg0[i] == self._conn_handle:
+                self._mtu = q.arg1[i]
+
         elif event == _IRQ_GATTC_READ_RESULT:
-            conn_handle, value_handle, char_data = data
-            if conn_handle == self._conn_handle:
-                if self._handle_game_state == value_handle:
-                    instructions = list(bytes(char_data).decode("UTF-8"))
-                    if len(instructions) == 3:
-                        starts = int(instructions.pop(0))
-                        step = int(instructions.pop(0))
-                        move = int(instructions.pop(0))
-                        self.advance_game_state(starts, step, move)
+            if q.arg0[i] == self._conn_handle:
+                if q.arg1[i] == self._handle_game_state or q.arg1[i] == self._handle_snapshot:
+                    frame = self._frame
+                    payload = q.payload(i)
+                    if game_protocol.decode(payload, frame, q.length[i]):
+                        self._on_frame(frame, True, payload)
+                        self._log_result()
+                    else:
+                        print("Unrecognised game state: " + str(q.length[i]) + " bytes")
                     
+        elif event == _IRQ_GATTC_READ_DONE or event == _IRQ_GATTC_WRITE_DONE:
+            if q.arg0[i] == self._conn_handle and self._cached and not self._got_state:
+                self._stale_handles()
+
         elif event == _IRQ_GATTC_NOTIFY:
-            conn_handle, value_handle, notify_data = data
+            value_handle = q.arg1[i]
             if self._handle_game_state is not None and value_handle == self._handle_game_state:
-                instructions = list(bytes(notify_data).decode("UTF-8"))
-                if len(instructions) == 3:
-                    starts = int(instructions.pop(0))
-                    step = int(instructions.pop(0))
-                    move = int(instructions.pop(0))
-                    self.advance_game_state(starts, step, move)
+                self.alloc.begin()
+                frame = self._frame
+                payload = q.payload(i)
+                if game_protocol.decode(payload, frame, q.length[i]):
+                    self._on_frame(frame, False, payload)
                 else:
-                    print("Wrong number of instructions: " + str(len(instructions)))
-                
+                    print("Unrecognised game state: " + str(q.length[i]) + " bytes")
+                self.alloc.end(self._result >= 0)
+                self._log_result()
+            elif self._handle_rules is not None and value_handle == self._handle_rules:
+                frame = self._frame
+                if game_protocol.decode_rules(q.payload(i), frame, q.length[i]):
+                    self._on_rules(frame)
+            elif self._handle_snapshot is not None and value_handle == self._handle_snapshot:
+                # The answer to a snapshot request, so treated like a read.
+                frame = self._frame
+                payload = q.payload(i)
+                if game_protocol.decode(payload, frame, q.length[i]):
+                    self._on_frame(frame, True, payload)
+                    self._log_result()
+                else:
+                    print("Unrecognised game state: " + str(q.length[i]) + " bytes")
             else:
                 print("Unhandled notify!")
                 print(value_handle)
+
+    # Apply a frame from the host. Repeats are dropped by sequence number; a
+    # gap means we missed a notification, so fetch a snapshot rather than
+    # trying to replay the steps in between. data is the buffer f came from.
+    def _on_frame(self, f, is_read, data):
+        if not self._got_state:
+            self._got_state = True
+            self.trace.mark(stage_trace.FIRST_STATE)
+        if not self._resync:
+            self._deadline = time.ticks_add(time.ticks_ms(), _STATE_POLL_MS)
+        # Check the ack before dropping repeats: a repeat may be the host
+        # re-sending an ack we missed.
+        if self._unacked and f.flags & game_protocol.FLAG_ACK and f.ack == self._seq & 0xFF:
+            self._unacked = False
+        if f.version == 0:
+            # Legacy hosts don't number their frames.
+            self.advance_game_state(f.starts, f.step, f.move)
+            return
+        if self._rx_seq >= 0:
+            d = game_protocol.seq_diff(f.seq, self._rx_seq)
+            if d <= 0:
+                self.duplicates += 1
+                return
+            in_order = d == 1
+        else:
+            in_order = f.step == 0
+        if f.flags & game_protocol.FLAG_SNAPSHOT:
+            self._resync = False
+            self._load_snapshot(f, data)
+        elif in_order or is_read:
+            # A plain frame from a read means the host can't send snapshots,
+            # so it's the best we'll get.
+            self._rx_seq = f.seq
+            self.advance_game_state(f.starts, f.step, f.move)
+        elif not self._resync:
+            self.resyncs += 1
+            self._resync = True
+            self._request_state()
+
+    # Replace our copy of the game with the host's snapshot.
+    def _load_snapshot(self, f, data):
+        self._rx_seq = f.seq
+        self._p1_wins = f.p1_wins
+        self._p2_wins = f.p2_wins
+        self._draws = f.draws
+        if (f.width, f.height, f.k) != self._rules:
+            self._set_rules(f.width, f.height, f.k)
+        if self._rules == self._want_rules:
+            self._rules_pending = False
+        self._ask_rules()
+        if f.step == 0:
+            # Nothing played yet, so start the game the usual way.
+            self.reset_board()
+            self.advance_game_state(f.starts, 0, 0)
+            return
+        if f.flags & game_protocol.FLAG_CELLS:
+            board = self._board
+            board.clear()
+            for i in range(board.size):
+                owner = game_protocol.cell(data, i)
+                if owner:
+                    board.place(owner, i + 1)
+        else:
+            self._board.p1 = f.p1
+            self._board.p2 = f.p2
+        # We don't know what order the moves we missed came in.
+        game_record.spoil(self._game_rec)
+        self._starts = f.starts
+        self._step = f.step
+        self._move = f.move
+        if self._state == _STATE_SYNCED:
+            self._state = _STATE_PLAYING
+        print("Caught up with host")
+        if (f.starts + f.step) % 2 == 1:
+            self._input_waiting = True
+            self.print_board(b"What's your move (O)?")
+        else:
+            self._input_waiting = False
+            self.print_board(b"Waiting for host to move...")
+
+    # The host changed the board, at our request or its own.
+    def _on_rules(self, f):
+        self._rules_pending = False
+        if (f.width, f.height, f.k) != self._rules:
+            self._set_rules(f.width, f.height, f.k)
+            self.reset_board()
+
+    def _set_rules(self, width, height, k):
+        self._rules = (width, height, k)
+        self._board = new_board(width, height, k)
+        print(f"Playing on a {width}x{height} board, {k} in a row")
+
+    # Ask the host for the board we were started with, once per connection.
+    # It starts a new game if it agrees, which we pick up as usual.
+    def _ask_rules(self):
+        want = self._want_rules
+        if want is None or want == self._rules or self._asked_rules or self._handle_rules is None:
+            return
+        self._asked_rules = True
+        buf = game_protocol.encode_rules(game_protocol.new_rules_buffer(), *want)
+        try:
+            self._ble.gattc_write(self._conn_handle, self._handle_rules, buf, 1)
+        except OSError:
+            self._asked_rules = False
+            return
+        self._rules_pending = True
+        self._rules_deadline = time.ticks_add(time.ticks_ms(), _RULES_TIMEOUT_MS)
+
+    def _lobby_done(self):
+        lobby = self._lobby
+        lobby.expire()
+        if len(lobby) == 0:
+            print("Searching for host...")
+            self._state = _STATE_IDLE
+            return
+        print("Hosts nearby:")
+        lobby.show()
+        if self._auto_pick:
+            self.choose_host(1)
+        else:
+            self._state = _STATE_CHOOSING
+            print("Which host (number)?")
+
+    def is_choosing(self):
+        return self._state == _STATE_CHOOSING
+
+    # Connect to the n-th host (1 = strongest signal) from the last lobby scan.
+    def choose_host(self, n):
+        ranked = self._lobby.ranked()
+        if n < 1 or n > len(ranked):
+            print("No such host.  Please try again.")
+            return False
+        e = ranked[n - 1]
+        self._addr_type = self._lobby.addr_type(e)
+        self._addr = self._lobby.addr(e)
+        self._name = self._lobby.name(e)
+        self._layout = self._lobby.layout(e)
+        print("Joining " + self._name + "...")
+        self._connect(_CONNECT_TIMEOUT_MS)
+        return True
+
+    # Take the host's handles from the cache if we've seen this layout of it
+    # before. The first state must then arrive within _DISCOVER_TIMEOUT_MS,
+    # or tick() drops the entry and reconnects to discover afresh.
+    def _use_cached_handles(self):
+        if not self._layout:
+            return False
+        e = self._handles.lookup(self._addr, self._layout)
+        if e < 0:
+            return False
+        handles = self._handles
+        self._start_handle = handles.handle(e, gatt_cache.START)
+        self._end_handle = handles.handle(e, gatt_cache.END)
+        self._handle_game_state = handles.handle(e, gatt_cache.GAME_STATE)
+        self._handle_snapshot = handles.handle(e, gatt_cache.SNAPSHOT) or None
+        self._handle_rules = handles.handle(e, gatt_cache.RULES) or None
+        self._cached = True
+        self._state = _STATE_SYNCED
+        self._cache_deadline = time.ticks_add(time.ticks_ms(), _DISCOVER_TIMEOUT_MS)
+        return True
+
+    # Drop the cache entry and reconnect, which will discover afresh.
+    def _stale_handles(self):
+        print("Cached handles went stale; rediscovering")
+        self._handles.forget(self._addr)
+        self.disconnect()
+
+    def _is_host_addr(self, buf):
+        addr = self._addr
+        if addr is None:
+            return False
+        for j in range(_ADDR_SIZE):
+            if buf[j] != addr[j]:
+                return False
+        return True
         
     def advance_game_state(self, starts, step, move):
         # print(f"starts: {starts}, step: {step}, move: {move}, self._step: {self._step}")
@@ -136,6 +650,10 @@ class TicTacToe:
         self._starts = starts
         if self._step == -1 and step == 0:
             # new game
+            game_record.begin(self._game_rec, starts)
+            if self._rules != (3, 3, 3):
+                # Records only have room for 3x3 games.
+                game_record.spoil(self._game_rec)
             if self._p2_wins + self._p1_wins + self._draws == 0:
                 print("Let's play!")
             else:
@@ -147,198 +665,326 @@ class TicTacToe:
                 print("We go first this time.")
         # the host will be one step ahead of us after they move
         elif self._step + 1 == step and move != 0:
-            if self.is_free(move):
-                self._board[move - 1] = 'X'  # host
-                print("Host took square " + str(move))
-                if self.is_winner(1):
+            if self._board.is_free(move):
+                self._board.place(1, move)  # host
+                self.trace.mark(stage_trace.MOVE_APPLIED)
+                game_record.add_move(self._game_rec, move)
+                print("Host took square", move)
+                if self._board.is_winner(1):
                     print("Host wins!")
                     self._p1_wins += 1
+                    self._record(game_record.HOST_WON)
                     game_over = True
-                elif self.is_board_full():
+                elif self._board.is_full():
                     print("It's a draw!!")
                     self._draws += 1
+                    self._record(game_record.DRAW)
                     game_over = True
             else:
                 print("Host tried to take square " + str(move) + " but it's not free...")
         
         if game_over:
             self.print_board()
-            self.print_stats()
             self.reset_board()
         else:
             self._step = step
             self._move = move
+            if self._step != -1 and self._state == _STATE_SYNCED:
+                self._state = _STATE_PLAYING
         if self._step != -1 and (self._starts + self._step) % 2 == 1:
             if self._input_waiting == False:
-                self.print_board()
-                print("What's your move (O)?")
+                self.print_board(b"What's your move (O)?")
             self._input_waiting = True
 
-    def is_free(self, move):
-        if self._board[move - 1] == str(move):
-            return True
-        else:
-            return False
-        
     def write_instructions(self):
         # the only data we need to replicate between devices is:
         # - who started this game
         # - which step (turn) we are on
         # - what the last move was
-        instructions = str(self._starts) + str(self._step) + str(self._move)
-        self._ble.gattc_write(self._conn_handle, self._handle_game_state, instructions.encode("UTF-8"), 1)
+        self._seq = (self._seq + 1) & 0xFFFF
+        game_protocol.encode(self._tx, self._starts, self._step, self._move, self._seq)
+        self._send()
+
+    def _send(self):
+        if not self._fast:
+            self._ble.gattc_write(self._conn_handle, self._handle_game_state, self._tx, 1)
+            return
+        self._unacked = True
+        self._retransmit_at = time.ticks_add(time.ticks_ms(), _RETRANSMIT_MS)
+        try:
+            self._ble.gattc_write(self._conn_handle, self._handle_game_state, self._tx, 0)
+        except OSError:
+            # Out of buffers; the retransmit will try again.
+            pass
         
     def make_move(self, move):
-        if self.is_free(move):
-            self._board[move - 1] = 'O'
+        if self._board.is_free(move):
+            self.alloc.begin()
+            self.trace.mark(stage_trace.INPUT)
+            self._board.place(2, move)
+            game_record.add_move(self._game_rec, move)
             self._move = move
             self._step += 1
             self.write_instructions()
-            if self.is_winner(2):
+            self.trace.mark(stage_trace.MOVE_SENT)
+            if self._board.is_winner(2):
                 print("We won!!")
                 self._p2_wins += 1
+                self._record(game_record.GUEST_WON)
                 self.print_board()
-                self.print_stats()
                 self.reset_board()
-            elif self.is_board_full():
+            elif self._board.is_full():
                 print("It's a draw!!")
                 self._draws += 1
+                self._record(game_record.DRAW)
                 self.print_board()
-                self.print_stats()
                 self.reset_board()
             else:
-                print("We took square " + str(move) + ".")
-                self.print_board()
-                print("Waiting for host to move...")
+                print("We took square", move, end=".\n")
+                self.print_board(b"Waiting for host to move...")
                 self._input_waiting = False
+            self.alloc.end(self._result >= 0)
+            self._log_result()
         else:
             print(f"Sqare {move} is not available, try again...")
             self.print_board()
     
+    # Note that the game ended with a game_record result. Logging it and the
+    # lifetime totals allocate and may write to flash, so _log_result() does
+    # that once the move has been metered.
+    def _record(self, result):
+        game_record.finish(self._game_rec, result)
+        self._result = result
+
+    # Log the game that just ended, if any, and show the score.
+    def _log_result(self):
+        result = self._result
+        if result < 0:
+            return
+        self._result = -1
+        if self._games is not None:
+            self._games.append(self._game_rec)
+        if self._stats is not None and self._addr is not None:
+            self._stats.record(self._addr, _STATS_RESULT[result])
+        self.print_stats()
+
     def print_stats(self):
         print("Stats so far:")
-        print("    Us:    " + str(self._p2_wins))
-        print("    Host:  " + str(self._p1_wins))
-        print("    Draws: " + str(self._draws))
+        print("    Us:   ", self._p2_wins)
+        print("    Host: ", self._p1_wins)
+        print("    Draws:", self._draws)
+        if self._stats is not None and self._addr is not None:
+            wins, losses, draws = self._stats.totals(self._addr)
+            print(f"Lifetime against this host: {wins} won, {losses} lost, {draws} drawn")
     
     def reset_board(self):
-        self._board = ['1','2','3','4','5','6','7','8','9']
+        self._board.clear()
         self._step = -1
         self._move = 0
         self._input_waiting = False
+        if self._state == _STATE_PLAYING:
+            self._state = _STATE_SYNCED
     
-    def is_winner(self, player_num):
-        p = 'X'
-        if player_num == 2:
-            p = 'O'
-        b = self._board
-        if b[0] == b[1] == b[2] == p:
-            return True
-        elif b[3] == b[4] == b[5] == p:
-            return True
-        elif b[6] == b[7] == b[8] == p:
-            return True
-        elif b[0] == b[3] == b[6] == p:
-            return True
-        elif b[1] == b[4] == b[7] == p:
-            return True
-        elif b[2] == b[5] == b[8] == p:
-            return True
-        elif b[0] == b[4] == b[8] == p:
-            return True
-        elif b[2] == b[4] == b[6] == p:
-            return True
-        else:
-            return False
-    
-    def is_board_full(self):
-        for square in self._board:
-            if square != 'X' and square != 'O':
-                # still at least one square left to play...
-                return False
-        return True
-    
-    def print_board(self):
-        b = self._board
-        print("-------------")
-        print(f"| {b[0]} | {b[1]} | {b[2]} |")
-        print("-------------")
-        print(f"| {b[3]} | {b[4]} | {b[5]} |")
-        print("-------------")
-        print(f"| {b[6]} | {b[7]} | {b[8]} |")
-        print("-------------")        
+    def print_board(self, status=None):
+        self._render.draw(self._board, status)
 
                
     def is_connected(self):
         return self._conn_handle is not None
+
+    def is_our_turn(self):
+        return (self._starts + self._step) % 2 == 1 and self._input_waiting and not self._rules_pending
+
+    # Number of squares on the board.
+    def squares(self):
+        return self._board.size
+
+    # True once we are connected and have received the host's game state.
+    def is_ready(self):
+        return self._state >= _STATE_SYNCED and self._starts != -1
+
+    # Perfect-play move for us in the current game.
+    def suggest_move(self):
+        import game_ai
+        return game_ai.choose(self._board, 2)
+
+    # Advance the connection state machine. Never blocks; call it often.
+    def tick(self):
+        self._events.drain()
+        state = self._state
+        if state == _STATE_IDLE:
+            if self._addr is not None:
+                print("Reconnecting to host...")
+                self._connect(_RECONNECT_TIMEOUT_MS)
+            else:
+                self.scan()
+        elif state == _STATE_CONNECTING:
+            if time.ticks_diff(time.ticks_ms(), self._deadline) >= 0:
+                self._ble.gap_connect(None)
+                self._connect_failed()
+        elif state == _STATE_DISCOVERING:
+            if time.ticks_diff(time.ticks_ms(), self._deadline) >= 0:
+                print("Service discovery timed out")
+                self.disconnect()
+        elif state >= _STATE_SYNCED:
+            if self._cached and not self._got_state and time.ticks_diff(time.ticks_ms(), self._cache_deadline) >= 0:
+                self._stale_handles()
+                return
+            if self._unacked and time.ticks_diff(time.ticks_ms(), self._retransmit_at) >= 0:
+                self.retransmits += 1
+                self._send()
+            if self._rules_pending and time.ticks_diff(time.ticks_ms(), self._rules_deadline) >= 0:
+                # The host's answer got lost; play on with what we have.
+                self._rules_pending = False
+            # On our first game there isn't an event to push the game state to
+            # us, and after a gap we need a snapshot, so keep requesting it
+            # until it arrives. While it's the host's turn, poll now and then
+            # in case its move was lost.
+            if self._starts == -1 or self._resync or not self._input_waiting or self._rules_pending:
+                if time.ticks_diff(time.ticks_ms(), self._deadline) >= 0:
+                    self._request_state()
+
+    # Ask for our game's snapshot if the host has one (and it fits a single
+    # notification or read), otherwise read the plain game state. Asking is
+    # preferred: a read from a host serving several guests only gives our
+    # game on ports that raise read requests (see host._irq).
+    def _request_state(self):
+        self._deadline = time.ticks_add(time.ticks_ms(), _READ_RETRY_MS)
+        handle = self._handle_game_state
+        size = game_protocol.snapshot_size(*self._rules)
+        try:
+            if self._handle_snapshot is not None:
+                if self._layout >= _SNAPSHOT_REQUEST_LAYOUT and self._mtu - 3 >= size:
+                    self._ble.gattc_write(self._conn_handle, self._handle_snapshot, _SNAPSHOT_REQUEST, 1)
+                    return
+                if self._mtu - 1 >= size:
+                    handle = self._handle_snapshot
+            self._ble.gattc_read(self._conn_handle, handle)
+        except OSError:
+            # ignore any failures and keep trying...
+            pass
+
+    def _connect(self, timeout_ms):
+        self._state = _STATE_CONNECTING
+        self._deadline = time.ticks_add(time.ticks_ms(), timeout_ms)
+        self._ble.gap_connect(
+            self._addr_type, self._addr, timeout_ms, self._conn_interval_us, self._conn_interval_us
+        )
+
+    def _connect_failed(self):
+        # The host may have moved or gone away, so fall back to a full scan.
+        self._addr_type = None
+        self._addr = None
+        self._layout = 0
+        self._state = _STATE_IDLE
     
     def scan(self, callback=None):
         self._addr_type = None
         self._addr = None
+        self._layout = 0
         self._scan_callback = callback
-        self._ble.gap_scan(2000, 30000, 30000)
+        self._state = _STATE_SCANNING
+        self.trace.mark(stage_trace.SCAN)
+        cycle = self._scan_cycle
+        cycle.update()
+        # Outside lobby mode, scan until the schedule is due to slow down
+        # (0 is until stopped).
+        duration_ms = _LOBBY_WINDOW_MS if self._lobby is not None else cycle.remaining_ms()
+        self._ble.gap_scan(duration_ms, cycle.interval_us(), cycle.window_us())
+        self.boot.mark(stage_trace.DISCOVERABLE)
         
     # TODO: remove the callback from connect?
     def connect(self, addr_type=None, addr=None, callback=None):
+        if addr and addr != self._addr:
+            self._layout = 0
         self._addr_type = addr_type or self._addr_type
         self._addr = addr or self._addr
         # self._conn_callback = callback
         if self._addr_type is None or self._addr is None:
             return False
-        self._ble.gap_connect(self._addr_type, self._addr)
+        self._connect(_CONNECT_TIMEOUT_MS)
         return True
     
     def disconnect(self):
-        if not self._conn_handle:
+        if self._conn_handle is None:
             return
         self._ble.gap_disconnect(self._conn_handle)
         self._reset()
 
-def game(ble, central):
 
-    not_found = False
-    
-    def on_scan(addr_type, addr, name):
-        if addr_type is not None:
-            central.connect()
-        else:
-            nonlocal not_found
-            not_found = True
-            print("Searching for host...")
-    
-    if not central.is_connected():
-        central.scan(callback=on_scan)
-    
-    while not central.is_connected():
-        time.sleep_ms(100)
-        if not_found:
-            return
-    
-    if (central._starts + central._step) % 2 == 1 and central._input_waiting:
-        move = -1
+# Besides a square number, "trace" dumps the stage trace, "hist" prints its
+# latency histograms, "boot" how long startup took and "alloc" switches the
+# allocation meter on or off.
+def handle_input(central, input_line):
+    if input_line == "trace":
+        central.trace.dump()
+        return
+    if input_line == "hist":
+        central.trace.histogram()
+        return
+    if input_line == "boot":
+        central.boot.report()
+        return
+    if input_line == "alloc":
+        central.alloc.toggle()
+        return
+    try:
+        move = int(input_line)
+    except ValueError:
+        return
+    if move >= 1 and move <= central.squares():
+        central.make_move(move)
+    else:
+        print("That is not a valid move.  Please try again.")
+
+
+# With ai=True the computer plays our moves instead of reading the console.
+def game(ble, central, ai=False):
+    central.tick()
+    if central.is_choosing():
         if uselect.select([sys.stdin], [], [], 0.01)[0]:
-            input_line = sys.stdin.readline().strip()
             try:
-                move = int(input_line)
+                central.choose_host(int(sys.stdin.readline().strip()))
             except ValueError:
                 pass
-        if move != -1:
-            if move >= 1 and move <= 9:
-                central.make_move(move)
-            else:
-                print("That is not a valid move.  Please try again.")
-    elif central._starts == -1 and central._step == -1 and central._conn_handle is not None and central._handle_game_state is not None:
-        # on our first game, there isn't an event to push the game state to us, so let's request it
-        try:
-            central._ble.gattc_read(central._conn_handle, central._handle_game_state)
-        except:
-            # ignore any failures and keep trying...
-            pass
+    elif central.is_our_turn() and ai:
+        central.make_move(central.suggest_move())
+    elif central.is_our_turn():
+        if uselect.select([sys.stdin], [], [], 0.01)[0]:
+            handle_input(central, sys.stdin.readline().strip())
 
 
-if __name__ == "__main__":
+# rules=(width, height, k) asks the host for that board, e.g. (4, 4, 4).
+# profile=True reports the time from reset to scanning and to connecting
+# (also available as the "boot" command). alloc=True prints the bytes
+# allocated by every move and game (also the "alloc" command).
+def start(
+    ai=False,
+    lobby=False,
+    auto_pick=True,
+    ansi=False,
+    fast=False,
+    conn_interval_ms=None,
+    stats=True,
+    record=True,
+    rules=None,
+    handles=True,
+    profile=False,
+    alloc=False,
+):
     ble = bluetooth.BLE()
-    central = TicTacToe(ble)
+    stats = stats_log.StatsLog() if stats else None
+    games = game_record.GameLog() if record else None
+    # Kept on flash too, so a reboot doesn't cost a discovery.
+    handles = HandleCache(path=_HANDLES_PATH) if handles else None
+    central = TicTacToe(
+        ble, lobby, auto_pick, ansi, fast, conn_interval_ms, stats, games, rules, handles, profile
+    )
+    central.alloc.enabled = alloc
     while True:
-        game(ble, central)
-        time.sleep(1)
\ No newline at end of file
+        game(ble, central, ai)
+        time.sleep_ms(20)
+
+
+if __name__ == "__main__":
+    start()
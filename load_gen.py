@@ -0,0 +1,447 @@
+# Load test host.TicTacToe with many scripted guests under CPython, using
+# the ble_sim radio in place of real hardware.
+#
+#   python3 load_gen.py --guests 10 50 200 --seconds 5
+#   python3 load_gen.py --guests 100 --malformed 0.05 --out-of-turn 0.05
+#
+# Each guest is a bare central rather than a join.TicTacToe, so hundreds
+# can run at once. It connects at random (--connect-rate attempts per second
+# while disconnected), asks for the snapshot and then plays random free squares
+# when it's its turn (--move-rate moves per second). It also misbehaves on
+# purpose: each time it acts, it may send a malformed frame (--malformed),
+# repeat its last write (--duplicate), write a move out of turn
+# (--out-of-turn) or with a step that isn't the next one (--wrong-step), and
+# after a move it may drop the link (--disconnect). These are the host paths
+# normal games never reach. The host should turn the bad moves down without
+# changing its game, so guests don't change theirs either.
+#
+# Whenever a guest hears the host's latest frame, its starter, step and
+# board are checked against the host's session for it, and the step against
+# the number of squares taken. A game with a mismatch is counted as a desync
+# (the first few are printed) and the guest asks for the snapshot to carry on
+# from the host's view.
+#
+# The host plays every game it's asked to move in with its usual AI. Each
+# guest count in --guests is run in turn on a fresh host, and for each the
+# report gives the host's throughput, how long it spent handling each event,
+# how long guests waited from a write to the host's next notification, and
+# how much the Python heap outside this file grew under load (by
+# tracemalloc, which slows everything down a little). Exceptions raised by
+# the host are counted rather than ending the run; the first few are printed.
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+import traceback
+import tracemalloc
+
+import ble_sim
+from bench import _commit, _percentiles
+
+_IRQ_PERIPHERAL_CONNECT = 7
+_IRQ_PERIPHERAL_DISCONNECT = 8
+_IRQ_GATTC_READ_RESULT = 15
+_IRQ_GATTC_NOTIFY = 18
+
+_FLAG_SNAPSHOT = 0x01
+
+_SHOW_ERRORS = 3
+
+
+class Guest:
+    # A scripted central. Everything it does is decided with rng, so a run
+    # is repeatable apart from wall-clock timing.
+    def __init__(self, load, rng):
+        import bluetooth
+        import game_protocol
+
+        self._load = load
+        self._rng = rng
+        self._protocol = game_protocol
+        self.ble = bluetooth.BLE()
+        self.ble.active(True)
+        self.ble.irq(self._irq)
+        self._frame = game_protocol.Frame()
+        self._tx = game_protocol.new_buffer()
+        self._seq = 0
+        self._conn_handle = None
+        self._connecting = False
+        self._next_at = load.now + rng.expovariate(load.connect_rate)
+        self._reset_game()
+
+    def _reset_game(self):
+        self._starts = 0
+        self._step = -1
+        self._rx_seq = -1
+        self._taken = bytearray(10)
+        # Set once this game has been counted as a desync.
+        self._desynced = False
+        self._sent_at = None
+        self._heard_at = self._load.now
+
+    def _irq(self, event, data):
+        load = self._load
+        if event == _IRQ_PERIPHERAL_CONNECT:
+            conn_handle, _, _ = data
+            self._connecting = False
+            self._conn_handle = conn_handle
+            load.counts["connects"] += 1
+            self._reset_game()
+            # A rejoining guest isn't sent anything until the host moves.
+            self._ask_state()
+            self._next_at = load.now + self._rng.expovariate(load.move_rate)
+        elif event == _IRQ_PERIPHERAL_DISCONNECT:
+            conn_handle, _, _ = data
+            self._connecting = False
+            self._conn_handle = None
+            self._next_at = load.now + self._rng.expovariate(load.connect_rate)
+        elif event == _IRQ_GATTC_NOTIFY or event == _IRQ_GATTC_READ_RESULT:
+            conn_handle, value_handle, char_data = data
+            if conn_handle == self._conn_handle and (value_handle == load.handle or value_handle == load.snapshot):
+                self._on_frame(char_data)
+
+    # Ask for our snapshot, as join does; the host notifies it back.
+    def _ask_state(self):
+        self._write(b"\x00", self._load.snapshot)
+
+    def _on_frame(self, data):
+        load = self._load
+        f = self._frame
+        if not self._protocol.decode(data, f, len(data)):
+            load.counts["bad_replies"] += 1
+            return
+        now = time.perf_counter()
+        self._heard_at = now
+        if self._sent_at is not None:
+            load.reply_s.append(now - self._sent_at)
+            self._sent_at = None
+        if self._rx_seq >= 0:
+            d = self._protocol.seq_diff(f.seq, self._rx_seq)
+            if d <= 0:
+                return
+        else:
+            d = 1 if f.step == 0 else 0
+        if f.flags & _FLAG_SNAPSHOT:
+            taken = f.p1 | f.p2
+            for m in range(1, 10):
+                self._taken[m] = (taken >> (m - 1)) & 1
+        elif d != 1:
+            # We missed a frame, so we don't know the board any more.
+            self._ask_state()
+            return
+        elif f.step == 0:
+            self._taken = bytearray(10)
+            self._desynced = False
+        elif f.move:
+            self._taken[f.move] = 1
+        self._rx_seq = f.seq
+        self._starts = f.starts
+        self._step = f.step
+        self._check(f)
+
+    # If f is the host's latest frame, our game should be the host's, with
+    # one step per square taken.
+    def _check(self, f):
+        load = self._load
+        s = load.host._sessions.get(self._conn_handle)
+        if s is None or s.seq != f.seq or self._desynced:
+            return
+        board = s.board
+        if (
+            s.starts == self._starts
+            and s.step == self._step
+            and s.step == sum(self._taken)
+            and all(board.is_free(m) != self._taken[m] for m in range(1, 10))
+        ):
+            return
+        load.counts["desyncs"] += 1
+        if len(load.desyncs) < _SHOW_ERRORS:
+            ours = "".join(str(m) for m in range(1, 10) if self._taken[m])
+            theirs = "".join(str(m) for m in range(1, 10) if not board.is_free(m))
+            load.desyncs.append(
+                f"desync on {self._conn_handle}: guest starts {self._starts} step {self._step} taken {ours or '-'}, "
+                f"host starts {s.starts} step {s.step} taken {theirs or '-'}"
+            )
+        # Count each game once, and carry on from the host's view of it.
+        self._desynced = True
+        self._rx_seq = -1
+        self._ask_state()
+
+    def _our_turn(self):
+        return self._step >= 0 and (self._starts + self._step) % 2 == 1
+
+    def tick(self, now):
+        load = self._load
+        if self._conn_handle is None:
+            if not self._connecting and now >= self._next_at:
+                self._connecting = True
+                load.counts["connect_attempts"] += 1
+                self.ble.gap_connect(0, load.host_addr, 2000)
+            return
+        if now - self._heard_at > load.stall_s:
+            # Nothing from the host for a while: ask where things stand.
+            load.counts["stalls"] += 1
+            self._heard_at = now
+            self._ask_state()
+        if now < self._next_at:
+            return
+        self._next_at = now + self._rng.expovariate(load.move_rate)
+        rng = self._rng
+        if rng.random() < load.malformed:
+            self._write(self._malformed())
+            load.counts["malformed"] += 1
+        elif rng.random() < load.duplicate and self._seq:
+            # Same sequence number, as if our write's ack went missing.
+            self._write(self._tx)
+            load.counts["duplicates"] += 1
+        elif self._our_turn():
+            if rng.random() < load.wrong_step:
+                # Skip a step, or repeat the last one with a new number.
+                self._send_move(self._step + rng.choice((0, 2)), self._free_square())
+                load.counts["wrong_step"] += 1
+                return
+            self._move()
+            load.counts["moves"] += 1
+            if rng.random() < load.disconnect:
+                load.counts["disconnects"] += 1
+                self.ble.gap_disconnect(self._conn_handle)
+        elif rng.random() < load.out_of_turn and self._step >= 0:
+            self._send_move(self._step + 1, self._free_square())
+            load.counts["out_of_turn"] += 1
+
+    def _free_square(self):
+        free = [m for m in range(1, 10) if not self._taken[m]]
+        return self._rng.choice(free) if free else 1
+
+    def _move(self):
+        move = self._free_square()
+        self._taken[move] = 1
+        self._step += 1
+        self._send_move(self._step, move)
+
+    # Send a move without taking it ourselves; _move() does that first.
+    def _send_move(self, step, move):
+        self._seq = (self._seq + 1) & 0xFFFF
+        self._protocol.encode(self._tx, self._starts, step, move, self._seq)
+        self._sent_at = time.perf_counter()
+        self._write(self._tx)
+
+    # Junk of any length, or a frame of the right length with nonsense in it.
+    # The nonsense starter (never 0 or 1) keeps it from passing as a move.
+    def _malformed(self):
+        rng = self._rng
+        if rng.random() < 0.5:
+            return bytes(rng.randrange(256) for _ in range(rng.randrange(1, self._protocol.FRAME_SIZE + 4)))
+        buf = self._protocol.new_buffer()
+        self._seq = (self._seq + 1) & 0xFFFF
+        self._protocol.encode(buf, rng.randrange(2, 256), rng.randrange(256), rng.randrange(256), self._seq)
+        return buf
+
+    def _write(self, data, handle=None):
+        try:
+            self.ble.gattc_write(self._conn_handle, handle or self._load.handle, data, 1)
+        except OSError:
+            pass
+
+
+class Load:
+    # One host and its guests on a fresh radio.
+    def __init__(self, radio, guests, args, seed):
+        import bluetooth
+        import host
+
+        self.radio = radio
+        slots = args.slots or guests
+        self.host = host.TicTacToe(bluetooth.BLE(max_connections=slots), max_connections=slots)
+        self.host_addr = self.host._ble.addr
+        self.handle = self.host._handle_game_state
+        self.snapshot = self.host._handle_snapshot
+        self.connect_rate = args.connect_rate
+        self.move_rate = args.move_rate
+        self.disconnect = args.disconnect
+        self.malformed = args.malformed
+        self.duplicate = args.duplicate
+        self.out_of_turn = args.out_of_turn
+        self.wrong_step = args.wrong_step
+        self.stall_s = args.stall_s
+        self.now = time.perf_counter()
+        self.counts = dict.fromkeys(
+            (
+                "connect_attempts",
+                "connects",
+                "moves",
+                "disconnects",
+                "malformed",
+                "duplicates",
+                "out_of_turn",
+                "wrong_step",
+                "stalls",
+                "bad_replies",
+                "host_moves",
+                "host_games",
+                "host_errors",
+                "desyncs",
+            ),
+            0,
+        )
+        self.event_s = []
+        self.reply_s = []
+        self.errors = []
+        self.desyncs = []
+        self._wrap_host()
+        rng = random.Random(seed)
+        self.guests = [Guest(self, random.Random(rng.random())) for _ in range(guests)]
+
+    def _wrap_host(self):
+        h = self.host
+        handle_event = h._events._handler
+        record = h._record
+
+        def timed_handle_event(q, i):
+            t0 = time.perf_counter()
+            try:
+                handle_event(q, i)
+            except Exception:
+                self.counts["host_errors"] += 1
+                if len(self.errors) < _SHOW_ERRORS:
+                    self.errors.append(traceback.format_exc())
+            self.event_s.append(time.perf_counter() - t0)
+
+        def counted_record(s, result):
+            self.counts["host_games"] += 1
+            record(s, result)
+
+        h._events._handler = timed_handle_event
+        h._record = counted_record
+
+    def step(self):
+        self.radio.process()
+        h = self.host
+        self.now = now = time.perf_counter()
+        for g in self.guests:
+            g.tick(now)
+        # Play every game waiting on us, like a very quick person at the
+        # console.
+        for _ in range(len(h._waiting)):
+            if not h.is_our_turn():
+                break
+            try:
+                h.make_move(h.suggest_move())
+            except Exception:
+                self.counts["host_errors"] += 1
+                if len(self.errors) < _SHOW_ERRORS:
+                    self.errors.append(traceback.format_exc())
+                h._waiting.pop(0)
+            self.counts["host_moves"] += 1
+        h.poll_advertising()
+
+
+# Bytes traced, leaving out our own samples and counters.
+def _heap():
+    snapshot = tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, __file__),))
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def run_one(guests, args, seed):
+    radio = ble_sim.install(args.latency_ms, args.jitter_ms, seed, args.loss)
+    tracemalloc.start()
+    with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+        load = Load(radio, guests, args, seed)
+        setup_bytes = tracemalloc.get_traced_memory()[0]
+        # Let the first guests in before measuring.
+        end = time.perf_counter() + args.warmup_s
+        while time.perf_counter() < end:
+            load.step()
+        load.event_s = []
+        load.reply_s = []
+        counts0 = dict(load.counts)
+        before = _heap()
+        t0 = time.perf_counter()
+        end = t0 + args.seconds
+        while time.perf_counter() < end:
+            load.step()
+        elapsed = time.perf_counter() - t0
+        growth = _heap() - before
+    tracemalloc.stop()
+    h = load.host
+    counts = {k: v - counts0[k] for k, v in load.counts.items()}
+    return {
+        "guests": guests,
+        "connected": len(h._sessions),
+        "parked": len(h._parked),
+        "elapsed_s": round(elapsed, 3),
+        "host_games_per_s": round(counts["host_games"] / elapsed, 2),
+        "host_events_per_s": round(len(load.event_s) / elapsed, 1),
+        "guest_moves_per_s": round(counts["moves"] / elapsed, 1),
+        "event": _percentiles(load.event_s),
+        "reply": _percentiles(load.reply_s),
+        "queue_high_water": h._events.high_water,
+        "queue_drops": h._events.drops,
+        "setup_bytes": setup_bytes,
+        "heap_growth_bytes": growth,
+        "counts": counts,
+        "errors": load.errors,
+        "desyncs": load.desyncs,
+    }
+
+
+def _report(r):
+    c = r["counts"]
+    print(
+        f"{r['guests']:>5} guests  {r['connected']:>4} connected  "
+        f"{r['host_games_per_s']:>8} games/s  {r['host_events_per_s']:>8} events/s  "
+        f"event p50/p99 {r['event'].get('p50_us', 0):>6}/{r['event'].get('p99_us', 0):<7} us  "
+        f"reply p50/p99 {r['reply'].get('p50_us', 0):>7}/{r['reply'].get('p99_us', 0):<8} us  "
+        f"heap {r['heap_growth_bytes']:+} B"
+    )
+    print(
+        f"       {c['connects']} connects, {c['disconnects']} drops, {c['malformed']} malformed, "
+        f"{c['duplicates']} repeats, {c['out_of_turn']} out of turn, {c['wrong_step']} wrong step, "
+        f"{c['stalls']} stalls, queue high water {r['queue_high_water']} ({r['queue_drops']} dropped), "
+        f"{c['host_errors']} host errors, {c['desyncs']} desyncs"
+    )
+    for e in r["errors"]:
+        print(e)
+    for d in r["desyncs"]:
+        print("       " + d)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test host.TicTacToe with scripted guests over ble_sim.")
+    parser.add_argument("--guests", type=int, nargs="+", default=(10, 50, 100), help="guest counts to run in turn")
+    parser.add_argument("--seconds", type=float, default=5, help="measured time per guest count")
+    parser.add_argument("--warmup-s", type=float, default=1, help="unmeasured time first, for connecting")
+    parser.add_argument("--slots", type=int, default=0, help="host connection limit (default: one per guest)")
+    parser.add_argument("--connect-rate", type=float, default=2, help="connection attempts/s per idle guest")
+    parser.add_argument("--move-rate", type=float, default=20, help="actions/s per connected guest")
+    parser.add_argument("--disconnect", type=float, default=0.01, help="chance of dropping the link after a move")
+    parser.add_argument("--malformed", type=float, default=0.01, help="chance an action is a malformed frame")
+    parser.add_argument("--duplicate", type=float, default=0.01, help="chance an action repeats the last write")
+    parser.add_argument("--out-of-turn", type=float, default=0.01, help="chance of moving while it isn't our turn")
+    parser.add_argument("--wrong-step", type=float, default=0.01, help="chance a move has the wrong step number")
+    parser.add_argument("--stall-s", type=float, default=2, help="re-read the state after this long without news")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = []
+    for guests in args.guests:
+        r = run_one(guests, args, args.seed)
+        _report(r)
+        results.append(r)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"commit": _commit(), "config": vars(args), "runs": results}, f, indent=2)
+        print("Saved " + args.out)
+    return 1 if any(r["counts"]["host_errors"] or r["counts"]["desyncs"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# Cache of game hosts seen while scanning, ranked by signal strength.
+
+# Entries live in fixed-size tables keyed by address. Each entry also keeps
+# a cheap hash of the advertising payload, so a host that keeps advertising
+# the same payload is decoded once and then only has its RSSI and last-seen
+# time refreshed. RSSI is smoothed with an exponential moving average
+# (new = old + (sample - old) / 4) so one noisy packet doesn't reorder the
+# list, and hosts that stop advertising drop out after expire_ms.
+
+from array import array
+from micropython import const
+import time
+
+_ADDR_SIZE = const(6)
+_RSSI_SHIFT = const(2)
+_EMPTY = const(-1)
+_UNDECODED = const(-2)
+
+
+def _payload_hash(payload, start, end):
+    h = 0x811C
+    for i in range(start, end):
+        h = ((h ^ payload[i]) * 0x0101) & 0xFFFF
+    return h
+
+
+class Lobby:
+    def __init__(self, capacity=8, expire_ms=10000):
+        self.capacity = capacity
+        self.expire_ms = expire_ms
+        self._addrs = bytearray(capacity * _ADDR_SIZE)
+        self._addr_types = bytearray(capacity)
+        self._rssi = array("h", bytes(2 * capacity))
+        self._seen = array("i", bytes(4 * capacity))
+        self._hash = array("i", [_EMPTY] * capacity)
+        self._names = [None] * capacity
+        self._layouts = bytearray(capacity)
+
+    def _find(self, addr, addr_start):
+        for e in range(self.capacity):
+            if self._hash[e] == _EMPTY:
+                continue
+            base = e * _ADDR_SIZE
+            j = 0
+            while j < _ADDR_SIZE and self._addrs[base + j] == addr[addr_start + j]:
+                j += 1
+            if j == _ADDR_SIZE:
+                return e
+        return -1
+
+    def _slot(self):
+        # A free slot, or else the weakest entry.
+        weakest = 0
+        for e in range(self.capacity):
+            if self._hash[e] == _EMPTY:
+                return e
+            if self._rssi[e] < self._rssi[weakest]:
+                weakest = e
+        return weakest
+
+    # Record one advertisement. addr is read from addr[addr_start:] and the
+    # advertising data from payload[start:end]; decode_name(payload, start,
+    # end) and decode_layout (likewise, returning a layout version 0-255) are
+    # only called when the host is new or its payload changed.
+    def update(self, addr_type, addr, addr_start, rssi, payload, start, end, decode_name, decode_layout=None):
+        now = time.ticks_ms()
+        h = _payload_hash(payload, start, end)
+        e = self._find(addr, addr_start)
+        if e < 0:
+            e = self._slot()
+            base = e * _ADDR_SIZE
+            for j in range(_ADDR_SIZE):
+                self._addrs[base + j] = addr[addr_start + j]
+            self._rssi[e] = rssi
+            self._hash[e] = _UNDECODED
+        else:
+            self._rssi[e] += (rssi - self._rssi[e]) >> _RSSI_SHIFT
+        if self._hash[e] != h:
+            self._names[e] = decode_name(payload, start, end) or "?"
+            self._layouts[e] = decode_layout(payload, start, end) if decode_layout else 0
+            self._hash[e] = h
+        self._addr_types[e] = addr_type
+        self._seen[e] = now
+
+    def expire(self):
+        now = time.ticks_ms()
+        for e in range(self.capacity):
+            if self._hash[e] != _EMPTY and time.ticks_diff(now, self._seen[e]) > self.expire_ms:
+                self._hash[e] = _EMPTY
+                self._names[e] = None
+
+    def __len__(self):
+        n = 0
+        for e in range(self.capacity):
+            if self._hash[e] != _EMPTY:
+                n += 1
+        return n
+
+    # Entry indexes, strongest signal first.
+    def ranked(self):
+        entries = [e for e in range(self.capacity) if self._hash[e] != _EMPTY]
+        entries.sort(key=lambda e: -self._rssi[e])
+        return entries
+
+    def best(self):
+        ranked = self.ranked()
+        return ranked[0] if ranked else -1
+
+    def addr_type(self, e):
+        return self._addr_types[e]
+
+    def addr(self, e):
+        return bytes(self._addrs[e * _ADDR_SIZE : (e + 1) * _ADDR_SIZE])
+
+    def name(self, e):
+        return self._names[e]
+
+    # The host's advertised service layout version, 0 if unknown.
+    def layout(self, e):
+        return self._layouts[e]
+
+    def rssi(self, e):
+        return self._rssi[e]
+
+    def show(self):
+        ranked = self.ranked()
+        if not ranked:
+            print("No hosts found")
+        for n, e in enumerate(ranked):
+            # Every table is called "tic", so show the end of the address too.
+            base = e * _ADDR_SIZE
+            tag = "%02x%02x" % (self._addrs[base + 4], self._addrs[base + 5])
+            print(f"  {n + 1}: {self._names[e]} [{tag}]  ({self._rssi[e]} dBm)")
@@ -0,0 +1,32 @@
+# Freeze both entry points (host and join) and everything they import into
+# the firmware, so they run as precompiled bytecode straight from flash:
+# nothing is compiled or copied into RAM at import, and the AI tables stay
+# in flash. Build from the MicroPython tree with
+#   make -C ports/rp2 BOARD=RPI_PICO_W FROZEN_MANIFEST=/path/to/manifest.py
+# Then `import host; host.start()` (or join) works with no files on the
+# board. Any copies left on the filesystem take precedence, so delete them.
+#
+# The CPython tools (ble_sim, bench, analyze_games, gen_ai_table) stay out.
+
+include("$(BOARD_DIR)/manifest.py")
+
+for name in (
+    "host",
+    "join",
+    "spectator",
+    "alloc_meter",
+    "ble_advertising",
+    "board_render",
+    "duty_cycle",
+    "event_queue",
+    "game_ai",
+    "game_ai_table",
+    "game_engine",
+    "game_protocol",
+    "game_record",
+    "gatt_cache",
+    "lobby",
+    "stage_trace",
+    "stats_log",
+):
+    module(name + ".py")
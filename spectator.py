@@ -0,0 +1,213 @@
+# Watch a game from the sidelines, without connecting to the host.
+
+# Hosts put a beacon with the game state in their scan response (see
+# game_protocol), so a spectator only has to scan actively and never takes
+# one of the host's connection slots; any number can watch at once. Beacons
+# of boards up to game_protocol.BEACON_MAX_CELLS squares carry every square
+# and the board is rebuilt from each one. Bigger boards are followed move by
+# move from the last few moves each beacon carries, so a spectator that
+# joins mid-game, or misses more than that while out of range, shows the
+# board as incomplete until the next game.
+#
+# We follow the first host we hear, or the one at addr, and move on to
+# another if it goes quiet for _LOST_MS.
+
+import bluetooth
+from ble_advertising import MANUFACTURER_TEST, find_manufacturer
+from board_render import BoardRenderer
+from event_queue import EventQueue
+from game_engine import new_board
+import game_protocol
+from micropython import const
+import time
+
+_IRQ_SCAN_RESULT = const(5)
+_IRQ_SCAN_DONE = const(6)
+
+_SCAN_RSP = const(0x04)
+
+# Listen flat out: spectators are usually plugged in, and a beacon only
+# changes once a move.
+_SCAN_INTERVAL_US = const(30000)
+_SCAN_WINDOW_US = const(30000)
+_LOST_MS = const(10000)
+
+_EVENT_QUEUE_SIZE = const(8)
+# A 6-byte address followed by a full 31-byte scan response.
+_EVENT_PAYLOAD_SIZE = const(37)
+_ADDR_SIZE = const(6)
+
+_HOST_TO_MOVE = b"Host (X) to move"
+_GUEST_TO_MOVE = b"Guest (O) to move"
+_INCOMPLETE = b"Joined mid-game: some moves missing"
+
+
+class Spectator:
+    # addr pins the host to watch (6 bytes); by default the first one heard.
+    # ansi=True pins the board to the top of an ANSI terminal.
+    def __init__(self, ble, addr=None, ansi=False):
+        self._ble = ble
+        self._ble.active(True)
+        self._ble.irq(self._irq)
+        self._pinned = addr is not None
+        self._addr = bytes(addr) if addr is not None else None
+        self._frame = game_protocol.Frame()
+        self._render = BoardRenderer(ansi)
+        self._events = EventQueue(_EVENT_QUEUE_SIZE, _EVENT_PAYLOAD_SIZE, self._handle_event)
+        self._scanning = False
+        self._heard = 0
+        # Beacons applied and repeats skipped, for tuning.
+        self.updates = 0
+        self.repeats = 0
+        self._forget()
+
+    # Drop the game we were following, so the next beacon starts afresh.
+    def _forget(self):
+        self._rules = None
+        self._board = None
+        self._game = -1
+        self._seq = -1
+        self._step = 0
+        self._scores = -1
+        # Whether moves are missing from _board (big boards only).
+        self._incomplete = False
+
+    def _irq(self, event, data):
+        if event == _IRQ_SCAN_RESULT:
+            addr_type, addr, adv_type, rssi, adv_data = data
+            # Only our hosts' scan responses are queued; the check works in
+            # place on the IRQ buffer.
+            if adv_type == _SCAN_RSP and find_manufacturer(adv_data, MANUFACTURER_TEST) >= 0:
+                self._events.push(event, addr_type, adv_type, rssi, adv_data, addr)
+        elif event == _IRQ_SCAN_DONE:
+            self._events.push(event)
+
+    def process_events(self):
+        return self._events.drain()
+
+    def _handle_event(self, q, i):
+        event = q.event[i]
+        if event == _IRQ_SCAN_RESULT:
+            payload = q.payload(i)
+            if not self._is_followed(payload):
+                return
+            end = q.length[i]
+            at = find_manufacturer(payload, MANUFACTURER_TEST, _ADDR_SIZE, end)
+            if at < 0:
+                return
+            # The beacon follows the field's length, type and company ID.
+            start = at + 4
+            frame = self._frame
+            if game_protocol.decode_beacon(payload, frame, start, at + 1 + payload[at]):
+                if self._addr is None:
+                    self._addr = bytes(payload[:_ADDR_SIZE])
+                    print("Watching host %02x%02x" % (self._addr[4], self._addr[5]))
+                self._heard = time.ticks_ms()
+                self._on_beacon(frame, payload, start)
+        elif event == _IRQ_SCAN_DONE:
+            self._scanning = False
+
+    # Whether buf starts with the address of the host we follow (any host
+    # until we've picked one).
+    def _is_followed(self, buf):
+        addr = self._addr
+        if addr is None:
+            return True
+        for j in range(_ADDR_SIZE):
+            if buf[j] != addr[j]:
+                return False
+        return True
+
+    def _on_beacon(self, f, data, start):
+        if f.game == self._game and f.seq == self._seq:
+            # Most beacons are repeats of the last advertisement.
+            self.repeats += 1
+            return
+        self.updates += 1
+        rules = self._rules
+        if rules is None or rules[0] != f.width or rules[1] != f.height or rules[2] != f.k:
+            # Allocates, so only when the board changes.
+            self._rules = (f.width, f.height, f.k)
+            self._board = new_board(f.width, f.height, f.k)
+            self._step = 0
+        board = self._board
+        new_game = f.game != self._game or f.step < self._step
+        scores = f.p1_wins | (f.p2_wins << 8) | (f.draws << 16)
+        if f.game == self._game and scores != self._scores:
+            # The host moves on to the next game straight away, so a result
+            # only shows up as a new score.
+            self._announce(f)
+        if game_protocol.beacon_has_cells(f.width, f.height):
+            board.clear()
+            for i in range(board.size):
+                owner = game_protocol.beacon_cell(data, start, i)
+                if owner:
+                    board.place(owner, i + 1)
+            self._incomplete = False
+        else:
+            known = self._step
+            if new_game:
+                board.clear()
+                known = 0
+                self._incomplete = False
+            first = f.step - game_protocol.BEACON_HISTORY + 1
+            if first > known + 1:
+                self._incomplete = True
+            for n in range(max(first, known + 1), f.step + 1):
+                move = game_protocol.beacon_move(data, start, f.step - n)
+                if move and board.is_free(move):
+                    board.place(self._mover(f.starts, n), move)
+        self._game = f.game
+        self._seq = f.seq
+        self._step = f.step
+        self._scores = scores
+        if self._incomplete:
+            status = _INCOMPLETE
+        elif (f.starts + f.step) % 2 == 0:
+            status = _HOST_TO_MOVE
+        else:
+            status = _GUEST_TO_MOVE
+        self._render.draw(board, status)
+
+    # Player (1 = host, 2 = guest) who made move number step.
+    def _mover(self, starts, step):
+        return 1 if (starts + step - 1) % 2 == 0 else 2
+
+    def _announce(self, f):
+        old = self._scores
+        if f.p1_wins != old & 0xFF:
+            print("Host wins!")
+        elif f.p2_wins != (old >> 8) & 0xFF:
+            print("Guest wins!")
+        else:
+            print("It's a draw!")
+        print("Score: host %d, guest %d, draws %d" % (f.p1_wins, f.p2_wins, f.draws))
+
+    # Keep scanning, and let go of a host that has gone quiet. Never blocks;
+    # call it often.
+    def tick(self):
+        self._events.drain()
+        if self._addr is not None and time.ticks_diff(time.ticks_ms(), self._heard) > _LOST_MS:
+            print("Lost the host")
+            if not self._pinned:
+                self._addr = None
+            self._forget()
+            self._heard = time.ticks_ms()
+        if not self._scanning:
+            self._scanning = True
+            self._ble.gap_scan(0, _SCAN_INTERVAL_US, _SCAN_WINDOW_US, True)
+
+    def stop(self):
+        self._ble.gap_scan(None)
+
+
+def start(addr=None, ansi=False):
+    spectator = Spectator(bluetooth.BLE(), addr, ansi)
+    print("Looking for a game to watch...")
+    while True:
+        spectator.tick()
+        time.sleep_ms(20)
+
+
+if __name__ == "__main__":
+    start()
@@ -0,0 +1,192 @@
+# Timestamps of connection and move stages, for finding where time goes.
+
+# mark(stage) stores time.ticks_us() and the stage in a fixed ring of
+# records, overwriting the oldest. That's two array stores and no
+# allocation, so tracing stays on during normal play and mark() is safe to
+# call from the BLE IRQ handler. dump() and histogram() read the ring
+# afterwards; they allocate and print, so run them from the REPL or a
+# console command rather than mid-move.
+#
+# Timestamps wrap with ticks_us (about every 18 minutes), so spans longer
+# than half that come out wrong.
+#
+# BootTimes separately keeps when startup milestones were first reached, so
+# they survive the ring filling up.
+
+from array import array
+from micropython import const
+import time
+
+ADVERTISE = const(0)  # host: started advertising afresh
+SCAN = const(1)  # guest: started scanning
+SCAN_HIT = const(2)  # guest: heard a game host
+CONNECT = const(3)
+SERVICES = const(4)  # guest: service discovery done
+CHARACTERISTICS = const(5)  # guest: characteristic discovery done
+FIRST_STATE = const(6)  # guest: first game state since connecting
+INPUT = const(7)  # our move entered
+MOVE_SENT = const(8)  # our move written or notified
+FRAME_IN = const(9)  # a game state frame arrived (marked in the IRQ)
+MOVE_APPLIED = const(10)  # the opponent's move is on our board
+
+NAMES = (
+    "advertise",
+    "scan",
+    "scan hit",
+    "connect",
+    "services",
+    "characteristics",
+    "first state",
+    "input",
+    "move sent",
+    "frame in",
+    "move applied",
+)
+
+# What histogram() reports, as (start, end) pairs. Each end is measured from
+# the latest start before it, and each span only uses a start once, so a
+# reconnect without a scan doesn't count from an old scan hit. Spans sharing
+# a start don't use it up for each other.
+SPANS = (
+    (ADVERTISE, CONNECT),
+    (SCAN, SCAN_HIT),
+    (SCAN_HIT, CONNECT),
+    (CONNECT, SERVICES),
+    (SERVICES, CHARACTERISTICS),
+    (CHARACTERISTICS, FIRST_STATE),
+    # The whole join, whether or not discovery was skipped (see gatt_cache).
+    (CONNECT, FIRST_STATE),
+    (INPUT, MOVE_SENT),
+    # Our move to the next frame from the other side: its ack, or its reply.
+    (MOVE_SENT, FRAME_IN),
+    (FRAME_IN, MOVE_APPLIED),
+)
+
+
+class StageTrace:
+    def __init__(self, size=128):
+        self._size = size
+        self._t = array("I", bytes(4 * size))
+        self._stage = bytearray(size)
+        self._next = 0
+        self._count = 0
+
+    def mark(self, stage):
+        i = self._next
+        self._t[i] = time.ticks_us()
+        self._stage[i] = stage
+        i += 1
+        self._next = 0 if i == self._size else i
+        if self._count < self._size:
+            self._count += 1
+
+    def clear(self):
+        self._next = 0
+        self._count = 0
+
+    # (ticks_us, stage) for each record, oldest first.
+    def records(self):
+        i = self._next - self._count
+        if i < 0:
+            i += self._size
+        for _ in range(self._count):
+            yield self._t[i], self._stage[i]
+            i += 1
+            if i == self._size:
+                i = 0
+
+    # Print every record with its time since the first and since the last.
+    def dump(self):
+        first = prev = None
+        for t, stage in self.records():
+            if first is None:
+                first = prev = t
+            print("%10d us %+10d us  %s" % (time.ticks_diff(t, first), time.ticks_diff(t, prev), NAMES[stage]))
+            prev = t
+        if first is None:
+            print("Trace is empty")
+
+    # Microseconds for each occurrence of each span: a list per span.
+    def spans(self, spans=SPANS):
+        out = [[] for _ in spans]
+        # When each span last started, or None once its end has used that.
+        last = [None] * len(spans)
+        for t, stage in self.records():
+            for k in range(len(spans)):
+                start, end = spans[k]
+                if end == stage and last[k] is not None:
+                    out[k].append(time.ticks_diff(t, last[k]))
+                    last[k] = None
+                if start == stage:
+                    last[k] = t
+        return out
+
+    # Print a power-of-two histogram of each span that occurred.
+    def histogram(self, spans=SPANS):
+        found = False
+        all_samples = self.spans(spans)
+        for k in range(len(spans)):
+            start, end = spans[k]
+            samples = all_samples[k]
+            if not samples:
+                continue
+            found = True
+            samples.sort()
+            print(
+                "%s -> %s: %d, min %d us, median %d us, max %d us"
+                % (NAMES[start], NAMES[end], len(samples), samples[0], samples[len(samples) // 2], samples[-1])
+            )
+            # buckets[b] counts samples from 2**b to 2**(b+1) - 1 us.
+            buckets = [0] * 32
+            for us in samples:
+                b = 0
+                while us > 1 and b < 31:
+                    us >>= 1
+                    b += 1
+                buckets[b] += 1
+            for b in range(32):
+                if buckets[b]:
+                    low = 1 << b
+                    print("    %8d-%-8d us %s %d" % (low, 2 * low - 1, "#" * min(buckets[b], 40), buckets[b]))
+        if not found:
+            print("No complete spans traced")
+
+
+# Startup milestones for BootTimes, each timed from reset.
+IMPORTED = const(0)  # the entry module's imports are done
+RADIO_UP = const(1)  # radio active and (host) services registered
+DISCOVERABLE = const(2)  # host: first advertisement; guest: first scan
+FIRST_CONNECT = const(3)  # first connection accepted
+
+BOOT_NAMES = ("imports done", "radio up", "advertising or scanning", "first connection")
+
+
+# When each startup milestone was first reached. On the Pico ticks_us starts
+# at reset, so the times read as microseconds since power-on (until they wrap
+# after about 18 minutes, long after booting). Under ble_sim the clock starts
+# elsewhere, so only the differences mean anything there.
+class BootTimes:
+    def __init__(self):
+        self._t = array("i", [-1] * len(BOOT_NAMES))
+
+    # Record milestone at t (default now) unless it was reached before.
+    # Returns True if this was the first time.
+    def mark(self, milestone, t=None):
+        if self._t[milestone] >= 0:
+            return False
+        self._t[milestone] = time.ticks_us() if t is None else t
+        return True
+
+    # Microseconds from reset to milestone, or -1 if not reached yet.
+    def us(self, milestone):
+        return self._t[milestone]
+
+    def report(self):
+        prev = 0
+        for m in range(len(BOOT_NAMES)):
+            t = self._t[m]
+            if t < 0:
+                print("           not yet  %s" % BOOT_NAMES[m])
+                continue
+            print("%8d ms %+8d ms  %s" % (t // 1000, (t - prev) // 1000, BOOT_NAMES[m]))
+            prev = t
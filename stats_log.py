@@ -0,0 +1,234 @@
+# Lifetime results per opponent, kept on the device's filesystem.
+
+# Every finished game is appended to a ring of fixed-size log files as an
+# 8-byte record:
+#   offset 0: opponent's address (6 bytes)
+#   offset 6: result, from our side (WIN, LOSS or DRAW)
+#   offset 7: lap, the low byte of how many times the ring has rotated
+#
+# Records are batched in RAM and appended a batch at a time, since flash
+# filesystems rewrite a whole block for each small append. When a file
+# fills up the ring moves on to the next one (truncating what was there) and
+# only then rewrites the index, which holds the per-opponent totals up to
+# that point and where the log continues:
+#   header:  b"ts", version, current file, offset (uint16), lap (uint16)
+#   entries: address (6 bytes), wins, losses, draws (uint16 each)
+#
+# So the index is written once per file's worth of games, and loading reads
+# the index plus at most one file of records. That happens on first use
+# rather than at boot, to keep it off the path to advertising. Up to a batch
+# of results can be lost if power goes before flush().
+
+from array import array
+from micropython import const
+import os
+import struct
+
+WIN = const(0)
+LOSS = const(1)
+DRAW = const(2)
+
+_VERSION = const(1)
+_RECORD_SIZE = const(8)
+_ADDR_SIZE = const(6)
+_HEADER_FORMAT = "<2sBBHH"
+_HEADER_SIZE = const(8)
+_ENTRY_FORMAT = "<6sHHH"
+_ENTRY_SIZE = const(12)
+_MAGIC = b"ts"
+
+
+class StatsLog:
+    def __init__(self, path="stats", files=4, file_records=64, batch=8, max_peers=16):
+        self._path = path
+        self._files = files
+        self._file_size = file_records * _RECORD_SIZE
+        self._batch = batch
+        self.max_peers = max_peers
+        self._addrs = bytearray(max_peers * _ADDR_SIZE)
+        self._used = bytearray(max_peers)
+        # wins, losses and draws for peer e live at 3 * e + result.
+        self._counts = array("H", bytes(2 * 3 * max_peers))
+        self._pending = bytearray(batch * _RECORD_SIZE)
+        self._n_pending = 0
+        # How many of the pending records flush() has written so far.
+        self._written = 0
+        self._file = 0
+        self._offset = 0
+        self._lap = 0
+        self._loaded = False
+
+    def _name(self, n):
+        return "%s%d.bin" % (self._path, n)
+
+    def _index_name(self):
+        return self._path + ".idx"
+
+    def _find(self, addr, create):
+        for e in range(self.max_peers):
+            if self._used[e]:
+                base = e * _ADDR_SIZE
+                j = 0
+                while j < _ADDR_SIZE and self._addrs[base + j] == addr[j]:
+                    j += 1
+                if j == _ADDR_SIZE:
+                    return e
+        if not create:
+            return -1
+        # A free entry, or else the opponent we've played least.
+        fewest = 0
+        for e in range(self.max_peers):
+            if not self._used[e]:
+                fewest = e
+                break
+            if self._games(e) < self._games(fewest):
+                fewest = e
+        base = fewest * _ADDR_SIZE
+        for j in range(_ADDR_SIZE):
+            self._addrs[base + j] = addr[j]
+        self._used[fewest] = 1
+        for r in range(3):
+            self._counts[3 * fewest + r] = 0
+        return fewest
+
+    def _games(self, e):
+        c = self._counts
+        return c[3 * e] + c[3 * e + 1] + c[3 * e + 2]
+
+    def _apply(self, addr, result):
+        if result > DRAW:
+            return
+        e = self._find(addr, True)
+        i = 3 * e + result
+        self._counts[i] = (self._counts[i] + 1) & 0xFFFF
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self._index_name(), "rb") as f:
+                data = f.read()
+        except OSError:
+            data = b""
+        if len(data) >= _HEADER_SIZE:
+            magic, version, n, offset, lap = struct.unpack_from(_HEADER_FORMAT, data, 0)
+            if magic == _MAGIC and version == _VERSION and n < self._files:
+                self._file, self._offset, self._lap = n, offset, lap
+                for k in range(min((len(data) - _HEADER_SIZE) // _ENTRY_SIZE, self.max_peers)):
+                    addr, wins, losses, draws = struct.unpack_from(_ENTRY_FORMAT, data, _HEADER_SIZE + k * _ENTRY_SIZE)
+                    self._used[k] = 1
+                    self._addrs[k * _ADDR_SIZE : (k + 1) * _ADDR_SIZE] = addr
+                    self._counts[3 * k] = wins
+                    self._counts[3 * k + 1] = losses
+                    self._counts[3 * k + 2] = draws
+        self._replay()
+
+    # Apply records written since the index was saved.
+    def _replay(self):
+        lap = self._lap & 0xFF
+        end = self._offset
+        try:
+            with open(self._name(self._file), "rb") as f:
+                f.seek(self._offset)
+                record = bytearray(_RECORD_SIZE)
+                while True:
+                    n = f.readinto(record)
+                    if n != _RECORD_SIZE or record[7] != lap:
+                        break
+                    self._apply(record, record[6])
+                    end += _RECORD_SIZE
+        except OSError:
+            # No log yet.
+            self._rotate_to(self._file)
+            return
+        self._offset = end
+        if n or end >= self._file_size:
+            # A partial or stale record follows; start a fresh file rather
+            # than append after it.
+            self._rotate()
+
+    def _rotate(self):
+        self._rotate_to((self._file + 1) % self._files)
+
+    def _rotate_to(self, n):
+        self._file = n
+        self._offset = 0
+        self._lap = (self._lap + 1) & 0xFFFF
+        with open(self._name(n), "wb"):
+            pass
+        self._save_index()
+
+    # The index only covers records on flash, so pending records not yet
+    # written (counted in _counts since record()) are left out of it; they
+    # are replayed from the log once written.
+    def _save_index(self):
+        tmp = self._index_name() + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(struct.pack(_HEADER_FORMAT, _MAGIC, _VERSION, self._file, self._offset, self._lap))
+            c = array("H", bytes(6))
+            for e in range(self.max_peers):
+                if self._used[e]:
+                    base = e * _ADDR_SIZE
+                    for r in range(3):
+                        c[r] = self._counts[3 * e + r]
+                    self._unwritten(base, c)
+                    f.write(struct.pack(_ENTRY_FORMAT, bytes(self._addrs[base : base + _ADDR_SIZE]), c[0], c[1], c[2]))
+        # rename is atomic on LittleFS, so a reset never leaves half an index.
+        os.rename(tmp, self._index_name())
+
+    # Take the pending records not yet written for the peer whose address
+    # is at _addrs[base:] off its counts c.
+    def _unwritten(self, base, c):
+        for k in range(self._written, self._n_pending):
+            at = k * _RECORD_SIZE
+            j = 0
+            while j < _ADDR_SIZE and self._pending[at + j] == self._addrs[base + j]:
+                j += 1
+            result = self._pending[at + 6]
+            if j == _ADDR_SIZE and result <= DRAW:
+                c[result] = (c[result] - 1) & 0xFFFF
+
+    # Note the result of a finished game against the peer at addr.
+    def record(self, addr, result):
+        self._load()
+        self._apply(addr, result)
+        base = self._n_pending * _RECORD_SIZE
+        for j in range(_ADDR_SIZE):
+            self._pending[base + j] = addr[j]
+        self._pending[base + 6] = result
+        self._pending[base + 7] = self._lap & 0xFF
+        self._n_pending += 1
+        if self._n_pending == self._batch:
+            self.flush()
+
+    # Append any batched records to the log.
+    def flush(self):
+        if not self._n_pending:
+            return
+        self._load()
+        done = 0
+        while done < self._n_pending:
+            room = (self._file_size - self._offset) // _RECORD_SIZE
+            n = min(room, self._n_pending - done)
+            # Records carry the lap they were written in.
+            for k in range(done, done + n):
+                self._pending[k * _RECORD_SIZE + 7] = self._lap & 0xFF
+            with open(self._name(self._file), "ab") as f:
+                f.write(memoryview(self._pending)[done * _RECORD_SIZE : (done + n) * _RECORD_SIZE])
+            self._offset += n * _RECORD_SIZE
+            done += n
+            self._written = done
+            if self._offset >= self._file_size:
+                self._rotate()
+        self._n_pending = 0
+        self._written = 0
+
+    # Lifetime (wins, losses, draws) against the peer at addr.
+    def totals(self, addr):
+        self._load()
+        e = self._find(addr, False)
+        if e < 0:
+            return (0, 0, 0)
+        c = self._counts
+        return (c[3 * e], c[3 * e + 1], c[3 * e + 2])